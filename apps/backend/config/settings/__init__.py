@@ -12,6 +12,10 @@ if ENV == "production":
     from .production import *
 
     print("Loaded production settings")
+elif ENV == "single_node":
+    from .single_node import *
+
+    print("Loaded single-node settings")
 elif ENV == "development":
     from .development import *
 
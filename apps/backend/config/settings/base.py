@@ -47,6 +47,7 @@ INSTALLED_APPS = [
     "modules.dish.apps.DishConfig",
     "modules.category.apps.CategoryConfig",
     "modules.food_tag.apps.FoodTagConfig",
+    "modules.api.apps.ApiConfig",
     # Additional modules (to be implemented)
     # "modules.menu.apps.MenuConfig",
     # "modules.table.apps.TableConfig",
@@ -55,7 +56,11 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.middleware.slow_query.SlowQueryMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "core.middleware.replicas.ReplicaRoutingMiddleware",
+    "core.middleware.static.StaticFilesMiddleware",
+    "core.middleware.metrics.MetricsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -63,6 +68,11 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "django.middleware.locale.LocaleMiddleware",
+    "core.middleware.di.RequestScopeMiddleware",
+    "core.middleware.session.RequestSessionMiddleware",
+    "core.middleware.n_plus_one.NPlusOneDetectionMiddleware",
+    "core.middleware.profiling.RequestProfilingMiddleware",
+    "core.middleware.tracing.TracingMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -157,3 +167,109 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 LOGIN_URL = "authentication:login"
 LOGIN_REDIRECT_URL = "dish:list"
 LOGOUT_REDIRECT_URL = "authentication:login"
+
+# Query budgets (@query_budget): "off", "warn" or "raise"
+QUERY_BUDGET_MODE = os.environ.get("QUERY_BUDGET_MODE", "off")
+
+# N+1 query detection middleware: "off", "warn" or "raise"
+N_PLUS_ONE_DETECTION = os.environ.get("N_PLUS_ONE_DETECTION", "off")
+N_PLUS_ONE_THRESHOLD = int(os.environ.get("N_PLUS_ONE_THRESHOLD", 3))
+
+# Request profiling (Server-Timing + staff view at /_profiling/requests/)
+PROFILING_ENABLED = os.environ.get("PROFILING_ENABLED", "false").lower() == "true"
+PROFILING_SAMPLE_RATE = float(os.environ.get("PROFILING_SAMPLE_RATE", 0.0))
+PROFILING_BUFFER_SIZE = int(os.environ.get("PROFILING_BUFFER_SIZE", 500))
+# Output of the on-demand sampling profiler (/_profiling/sampler/)
+PROFILING_SAMPLER_DIR = os.environ.get("PROFILING_SAMPLER_DIR", BASE_DIR / "logs" / "profiles")
+
+# Tracing spans for @Controller/@Injectable methods, exported as OTLP/JSON
+TRACING_ENABLED = os.environ.get("TRACING_ENABLED", "false").lower() == "true"
+TRACING_SAMPLE_RATE = float(os.environ.get("TRACING_SAMPLE_RATE", 1.0))
+TRACING_EXPORTER = os.environ.get("TRACING_EXPORTER", "file")  # "file" or "http"
+TRACING_EXPORT_PATH = os.environ.get("TRACING_EXPORT_PATH", BASE_DIR / "logs" / "traces.jsonl")
+TRACING_COLLECTOR_URL = os.environ.get("TRACING_COLLECTOR_URL", "http://localhost:4318/v1/traces")
+TRACING_SERVICE_NAME = os.environ.get("TRACING_SERVICE_NAME", "savoro-backend")
+
+# Prometheus metrics exposed at /metrics (opt-in: wraps every SQL execute)
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "false").lower() == "true"
+# Shared directory for gunicorn workers (empty it on server start); "" = single process
+METRICS_MULTIPROC_DIR = os.environ.get("METRICS_MULTIPROC_DIR", "")
+METRICS_FLUSH_INTERVAL = float(os.environ.get("METRICS_FLUSH_INTERVAL", 1.0))
+# Opt-in: behind a reverse proxy REMOTE_ADDR is the proxy for every client
+METRICS_ALLOWED_IPS = [
+    ip.strip()
+    for ip in os.environ.get("METRICS_ALLOWED_IPS", "").split(",")
+    if ip.strip()
+]
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+
+# Slow query log with EXPLAIN plans, aggregated by `manage.py index_advisor`
+SLOW_QUERY_LOG_ENABLED = os.environ.get("SLOW_QUERY_LOG_ENABLED", "false").lower() == "true"
+SLOW_QUERY_THRESHOLD_MS = float(os.environ.get("SLOW_QUERY_THRESHOLD_MS", 100))
+SLOW_QUERY_ANALYZE_RATE = float(os.environ.get("SLOW_QUERY_ANALYZE_RATE", 0.0))
+SLOW_QUERY_LOG_PATH = os.environ.get("SLOW_QUERY_LOG_PATH", BASE_DIR / "logs" / "slow_queries.jsonl")
+
+# Serve STATIC_ROOT from the app (core.middleware.static) for small deployments
+STATIC_SERVE_ENABLED = os.environ.get("STATIC_SERVE_ENABLED", "false").lower() == "true"
+STATIC_MAX_AGE = int(os.environ.get("STATIC_MAX_AGE", 3600))
+
+# Responsive image renditions (core.images), generated by the "images" job queue
+IMAGE_RENDITION_WIDTHS = [int(w) for w in os.environ.get("IMAGE_RENDITION_WIDTHS", "320,640,960,1280").split(",")]
+IMAGE_RENDITION_QUALITY = int(os.environ.get("IMAGE_RENDITION_QUALITY", 80))
+
+# Serve MEDIA_ROOT from the app outside DEBUG (core.files.views.media)
+MEDIA_SERVE_ENABLED = os.environ.get("MEDIA_SERVE_ENABLED", "false").lower() == "true"
+
+# Background jobs (core.jobs) consumed by `manage.py run_workers`; eager = run after commit
+JOBS_EAGER = os.environ.get("JOBS_EAGER", "false").lower() == "true"
+JOBS_WORKER_THREADS = int(os.environ.get("JOBS_WORKER_THREADS", 2))
+JOBS_POLL_INTERVAL = float(os.environ.get("JOBS_POLL_INTERVAL", 1.0))
+# Seconds before a RUNNING job of a silent worker is requeued
+JOBS_LOCK_TIMEOUT = int(os.environ.get("JOBS_LOCK_TIMEOUT", 600))
+JOBS_RETENTION_HOURS = float(os.environ.get("JOBS_RETENTION_HOURS", 24))
+
+# Delta sync API for POS tablets (/api/sync/)
+SYNC_PAGE_SIZE = int(os.environ.get("SYNC_PAGE_SIZE", 500))
+# Rows updated more recently than this are left for the next sync (late commits)
+SYNC_SETTLE_SECONDS = float(os.environ.get("SYNC_SETTLE_SECONDS", 2))
+
+# Request-scoped identity map for repository find_by_id (core.db.session)
+IDENTITY_MAP_ENABLED = os.environ.get("IDENTITY_MAP_ENABLED", "true").lower() == "true"
+# Defer repository updates and save them in one transaction at the end of the request
+UNIT_OF_WORK_ENABLED = os.environ.get("UNIT_OF_WORK_ENABLED", "false").lower() == "true"
+
+# Reference data snapshots (core.reference); use a shared cache so version bumps reach every process
+REFERENCE_DATA_CACHE = os.environ.get("REFERENCE_DATA_CACHE", "default")
+# Seconds a version key lives; bounds staleness across processes with a per-process cache
+REFERENCE_DATA_TIMEOUT = int(os.environ.get("REFERENCE_DATA_TIMEOUT", 300))
+
+# Read replicas (core.db.routers): aliases in DATABASES, filled by production settings
+DATABASE_ROUTERS = ["core.db.routers.ReplicaRouter"]
+DATABASE_REPLICAS: list[str] = []
+# Apps whose reads may be served by a replica (guest menu browsing)
+REPLICA_READ_APPS = ["dish", "category", "food_tag"]
+# Seconds a client stays on the primary after writing (read-your-writes)
+REPLICA_STICKY_SECONDS = int(os.environ.get("REPLICA_STICKY_SECONDS", 10))
+REPLICA_MAX_LAG_SECONDS = float(os.environ.get("REPLICA_MAX_LAG_SECONDS", 2))
+REPLICA_LAG_CHECK_SECONDS = float(os.environ.get("REPLICA_LAG_CHECK_SECONDS", 5))
+
+# SQLite PRAGMAs run on every new connection (core.db.sqlite)
+SQLITE_PRAGMAS: dict[str, str | int] = {}
+# Profile enabled by settings/single_node.py (and measured by benchmark_sqlite)
+SQLITE_SINGLE_NODE_PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "WAL",
+    # Durable at each checkpoint instead of each commit (safe with WAL)
+    "synchronous": "NORMAL",
+    "mmap_size": int(os.environ.get("SQLITE_MMAP_SIZE", 256 * 1024 * 1024)),
+    # Negative: KiB of page cache per connection
+    "cache_size": -int(os.environ.get("SQLITE_CACHE_KB", 64000)),
+    "temp_store": "MEMORY",
+    "busy_timeout": int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", 5000)),
+}
+# Seconds between PRAGMA optimize / WAL checkpoint jobs (0 disables them)
+SQLITE_MAINTENANCE_INTERVAL = int(os.environ.get("SQLITE_MAINTENANCE_INTERVAL", 0))
+
+# Per-action statement timeouts (@statement_timeout, core.db.timeouts)
+STATEMENT_TIMEOUTS_ENABLED = (
+    os.environ.get("STATEMENT_TIMEOUTS_ENABLED", "true").lower() == "true"
+)
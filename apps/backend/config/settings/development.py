@@ -26,6 +26,15 @@ INTERNAL_IPS = [
     "127.0.0.1",
 ]
 
+# Fail fast when a controller action exceeds its declared query budget
+QUERY_BUDGET_MODE = "raise"
+
+# Report repeated lazy-load queries with their template line / stack
+N_PLUS_ONE_DETECTION = os.environ.get("N_PLUS_ONE_DETECTION", "warn")
+
+# Run background jobs inline after commit unless a worker is started
+JOBS_EAGER = os.environ.get("JOBS_EAGER", "true").lower() == "true"
+
 # Email backend for development (console)
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
@@ -23,8 +23,48 @@ DATABASES: dict[str, dict[str, Any]] = {
         "PASSWORD": os.environ.get("DB_PASSWORD"),
         "HOST": os.environ.get("DB_HOST"),
         "PORT": os.environ.get("DB_PORT", "5432"),
+        # Reuse connections across requests instead of paying TCP, TLS and
+        # authentication on every one; health checks drop dead sockets first
+        "CONN_MAX_AGE": int(os.environ.get("DB_CONN_MAX_AGE", 60)),
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {},
     }
 }
+if os.environ.get("DB_SSLMODE"):
+    DATABASES["default"]["OPTIONS"]["sslmode"] = os.environ["DB_SSLMODE"]
+
+# In-process pool shared by the threads of a worker (psycopg 3 + psycopg-pool)
+if os.environ.get("DB_POOL", "false").lower() == "true":
+    DATABASES["default"]["ENGINE"] = "core.db.backends.postgresql"
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": int(os.environ.get("DB_POOL_MIN_SIZE", 2)),
+        "max_size": int(os.environ.get("DB_POOL_MAX_SIZE", 10)),
+        "timeout": float(os.environ.get("DB_POOL_TIMEOUT", 10)),
+        "max_idle": float(os.environ.get("DB_POOL_MAX_IDLE", 600)),
+    }
+
+# PgBouncer in transaction mode: no cursor or prepared statement may outlive
+# a transaction, since the next one can run on another server connection
+if os.environ.get("DB_PGBOUNCER", "false").lower() == "true":
+    DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = True
+    DATABASES["default"]["OPTIONS"]["prepare_threshold"] = None
+
+# Read replicas: DB_REPLICA_HOSTS="host1,host2:5433" (same name and credentials)
+DATABASE_REPLICAS = []
+for index, address in enumerate(
+    filter(None, os.environ.get("DB_REPLICA_HOSTS", "").split(",")), start=1
+):
+    host, _, port = address.strip().partition(":")
+    alias = f"replica_{index}"
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        "OPTIONS": {**DATABASES["default"]["OPTIONS"]},
+        "HOST": host,
+        "PORT": port or DATABASES["default"]["PORT"],
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(alias)
 
 # Security settings for production
 SECURE_SSL_REDIRECT = True
@@ -39,13 +79,25 @@ SECURE_HSTS_SECONDS = 31536000
 SECURE_HSTS_INCLUDE_SUBDOMAINS = True
 SECURE_HSTS_PRELOAD = True
 
+# Prometheus metrics on by default in production
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "true").lower() == "true"
+
 # Vite Production Mode
 VITE_DEV_MODE = False
+# Loaded once per process by vite_tags, reloaded when its mtime changes
+VITE_MANIFEST_PATH = os.environ.get(
+    "VITE_MANIFEST_PATH", os.path.join(BASE_DIR, "../frontend/staticfiles/manifest.json")
+)
 
 # Static files handling - use built files
 STATIC_URL = "/static/"
 STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles_collected")
 STATICFILES_DIRS = [os.path.join(BASE_DIR, "../frontend/staticfiles")]
+# collectstatic writes .gz/.br siblings served by core.middleware.static
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "core.staticfiles.storage.CompressedStaticFilesStorage"},
+}
 
 # Email configuration
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
@@ -0,0 +1,29 @@
+"""
+Single-node production settings - One server with a local SQLite database
+"""
+
+# pyright: reportConstantRedefinition=false
+
+from .production import *
+
+# Database
+# Writers are serialized by SQLite; WAL lets readers run alongside them
+
+DATABASES: dict[str, dict[str, Any]] = {
+    "default": {
+        "ENGINE": "core.db.backends.sqlite3",
+        "NAME": os.environ.get("SQLITE_PATH", BASE_DIR / "db.sqlite3"),
+        "CONN_MAX_AGE": int(os.environ.get("DB_CONN_MAX_AGE", 600)),
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            # Take the write lock when the transaction starts: a deferred
+            # transaction that reads and then writes cannot wait for the lock
+            # (SQLITE_BUSY right away) once another writer holds it
+            "transaction_mode": "IMMEDIATE",
+        },
+    }
+}
+DATABASE_REPLICAS = []
+
+SQLITE_PRAGMAS = SQLITE_SINGLE_NODE_PRAGMAS
+SQLITE_MAINTENANCE_INTERVAL = int(os.environ.get("SQLITE_MAINTENANCE_INTERVAL", 3600))
@@ -19,19 +19,29 @@ def root_redirect(request: HttpRequest) -> HttpResponseRedirect:
 
 urlpatterns: list[URLResolver | URLPattern] = [
     path("admin/", admin.site.urls),
+    # Staff-only diagnostics
+    path("_profiling/", include("core.profiling.urls")),
+    # Prometheus scrape endpoint
+    path("", include("core.metrics.urls")),
     # Authentication
     path("", include("modules.authentication.urls")),
     # Domain modules
     path("dishes/", include("modules.dish.urls")),
     path("categories/", include("modules.category.urls")),
+    # JSON API for POS tablets
+    path("api/", include("modules.api.urls")),
     # Redirect root to login
     path("", root_redirect),
 ]
 
-# Serve static and media files in development
+# Media files; content-addressed blobs are served with immutable caching
+if settings.DEBUG or getattr(settings, "MEDIA_SERVE_ENABLED", False):
+    urlpatterns += [
+        path(settings.MEDIA_URL.lstrip("/"), include("core.files.urls")),
+    ]
+
+# Serve static files in development
 if settings.DEBUG:
-    # Serve media files
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 
     # In development with Vite, static files are served by Vite dev server
     # Only serve static files if NOT using Vite dev mode
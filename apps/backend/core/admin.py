@@ -0,0 +1,16 @@
+"""
+Core admin configuration
+"""
+
+from django.contrib import admin
+
+from .jobs.models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):  # type: ignore
+    list_display = ["id", "name", "queue", "status", "priority", "attempts", "run_at"]
+    list_filter = ["status", "queue"]
+    search_fields = ["name", "dedup_key"]
+    readonly_fields = ["locked_by", "locked_at", "created_at", "finished_at"]
+    ordering = ["-id"]
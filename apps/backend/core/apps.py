@@ -9,3 +9,9 @@ class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "core"
     verbose_name = "Core Framework"
+
+    def ready(self) -> None:
+        from core import reference
+        from core.db import connections, sqlite  # noqa: F401 (signal receivers)
+
+        reference.autodiscover()
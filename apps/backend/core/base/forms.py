@@ -13,6 +13,14 @@ class BaseModelForm(forms.ModelForm):  # type: ignore
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)  # type: ignore
+        # Edits carry the row version they started from (optimistic locking)
+        if self.instance.pk and hasattr(self.instance, "version"):
+            self.fields["version"] = forms.IntegerField(
+                widget=forms.HiddenInput,
+                initial=self.instance.version,
+                required=False,
+                min_value=1,
+            )
         # Apply Materialize classes to all fields
         for _, field in self.fields.items():
             if isinstance(field.widget, forms.TextInput):
@@ -4,10 +4,12 @@ Base model classes with timestamps and soft delete
 
 from __future__ import annotations
 from datetime import datetime
-from typing import Any, Dict, Tuple, Type
+from typing import Any, ClassVar, Dict, Tuple, Type
 from django.db import models
 from django.conf import settings
 
+from core.exceptions.database import StaleObjectError
+
 
 class BaseModelMeta(models.base.ModelBase):
     """
@@ -79,9 +81,61 @@ class BaseModel(models.Model, metaclass=BaseModelMeta):
         default=True,
         verbose_name="Activo",
     )
+    # Optimistic locking: incremented by every save of an existing row
+    version: models.PositiveIntegerField[int, int] = models.PositiveIntegerField(
+        default=1,
+        editable=False,
+        verbose_name="Versión",
+    )
+
+    # Set to False in a subclass to save without the version check
+    optimistic_locking: ClassVar[bool] = True
 
     class Meta:
         abstract = True
+        # Keyset pagination of changes for the sync API (modules.api)
+        indexes = [
+            models.Index(
+                fields=["updated_at", "id"], name="%(app_label)s_%(class)s_sync_idx"
+            ),
+        ]
+
+    def _do_update(
+        self,
+        base_qs: models.QuerySet[Any],
+        using: str,
+        pk_val: Any,
+        values: list[tuple[Any, Any, Any]],
+        update_fields: Any,
+        forced_update: bool,
+    ) -> bool:
+        """
+        UPDATE ... WHERE id = %s AND version = %s, setting version + 1
+
+        Raises StaleObjectError when the row exists with another version
+        (someone saved it after this instance was loaded).
+        """
+        if not self.optimistic_locking:
+            return super()._do_update(
+                base_qs, using, pk_val, values, update_fields, forced_update
+            )
+        expected = self.version
+        version_field = self._meta.get_field("version")
+        values = [value for value in values if value[0] is not version_field]
+        values.append((version_field, None, expected + 1))
+        updated = super()._do_update(
+            base_qs.filter(version=expected),
+            using,
+            pk_val,
+            values,
+            update_fields,
+            forced_update,
+        )
+        if updated:
+            self.version = expected + 1
+        elif base_qs.filter(pk=pk_val).exists():
+            raise StaleObjectError(self._meta.label, pk_val, expected)
+        return updated
 
 
 class NamedModel(BaseModel):
@@ -3,9 +3,35 @@ Base repository pattern with generic CRUD operations
 """
 
 from __future__ import annotations
-from typing import Generic, TypeVar, Optional, Any, TYPE_CHECKING
+from typing import (
+    ClassVar,
+    Generic,
+    Iterable,
+    TypeVar,
+    Optional,
+    Any,
+    TYPE_CHECKING,
+)
 from abc import ABC
-from django.db.models import QuerySet, Model
+from dataclasses import dataclass
+from datetime import datetime
+from django.db import IntegrityError, router
+from django.db.models import Prefetch, QuerySet, Model, Q, prefetch_related_objects
+from django.utils import timezone
+
+from core.db.routers import use_primary
+from core.db.session import current_session
+from core.exceptions.database import StaleObjectError
+from core.exceptions.http import ConflictException
+
+CONFLICT_MESSAGE = (
+    "El registro fue modificado por otro usuario mientras lo editaba. "
+    "Recargue la página y vuelva a aplicar sus cambios."
+)
+INTEGRITY_MESSAGE = (
+    "No se pudieron guardar los cambios porque entran en conflicto con otro "
+    "registro. Recargue la página y vuelva a intentarlo."
+)
 
 if TYPE_CHECKING:
     from typing import Type
@@ -13,50 +39,223 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound=Model)
 
 
+@dataclass(frozen=True)
+class FetchPlan:
+    """
+    Related objects and columns a caller needs from a query
+
+    Example:
+        FetchPlan(
+            select_related=("category",),
+            prefetch_related=("tags",),
+            only=("name", "price", "category__name"),
+        )
+    """
+
+    select_related: tuple[str, ...] = ()
+    prefetch_related: tuple[str | Prefetch, ...] = ()
+    only: tuple[str, ...] = ()
+    defer: tuple[str, ...] = ()
+
+    def apply(self, queryset: QuerySet[T]) -> QuerySet[T]:
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        if self.only:
+            queryset = queryset.only(*self.only)
+        if self.defer:
+            queryset = queryset.defer(*self.defer)
+        return queryset
+
+    def widen(self, entity: Model) -> None:
+        """
+        Load what this plan fetches and an already loaded entity lacks
+        Deferred columns are refreshed; relations already cached are skipped.
+        """
+        deferred = entity.get_deferred_fields()
+        if deferred:
+            if self.only:
+                meta = entity._meta
+                wanted = {
+                    meta.get_field(name.split("__")[0]).attname for name in self.only
+                }
+                deferred &= wanted | {meta.pk.attname}
+            elif self.defer:
+                deferred -= set(self.defer)
+            if deferred:
+                entity.refresh_from_db(fields=list(deferred))
+        lookups = (*self.select_related, *self.prefetch_related)
+        if lookups:
+            prefetch_related_objects([entity], *lookups)
+
+
 class BaseRepository(Generic[T], ABC):
     """
     Generic repository with CRUD operations
     Type-safe data access layer
+
+    Subclasses declare named fetch plans; callers pick the one matching what
+    they render (find_all("detail"), find_by_id(id, "form"), ...).
     """
 
+    fetch_plans: ClassVar[dict[str, FetchPlan]] = {}
+
     def __init__(self, model_class: Type[T]):
         self.model = model_class
 
-    def find_all(self) -> QuerySet[T]:
+    def get_plan(self, plan: Optional[str]) -> FetchPlan:
+        """Named fetch plan (None: every column, no relations)"""
+        if plan is None:
+            return FetchPlan()
+        try:
+            return self.fetch_plans[plan]
+        except KeyError:
+            raise ValueError(
+                f"{type(self).__name__} has no fetch plan '{plan}' "
+                f"(available: {', '.join(self.fetch_plans) or 'none'})"
+            ) from None
+
+    def with_plan(self, queryset: QuerySet[T], plan: Optional[str]) -> QuerySet[T]:
+        """Apply a named fetch plan (None leaves the queryset unchanged)"""
+        if plan is None:
+            return queryset
+        return self.get_plan(plan).apply(queryset)
+
+    def find_all(self, plan: Optional[str] = None) -> QuerySet[T]:
         """Find all entities"""
-        return self.model.objects.all()
+        return self.with_plan(self.model.objects.all(), plan)
 
-    def find_by_id(self, id: int) -> Optional[T]:
-        """Find entity by ID"""
+    def find_by_id(self, id: int, plan: Optional[str] = None) -> Optional[T]:
+        """
+        Find entity by ID
+        Within a request session a row is loaded once; asking again with
+        another plan widens the cached instance with what that plan adds
+        """
+        session = current_session()
+        if session is not None:
+            cached = session.get(self.model, id)
+            if cached is not None:
+                self.get_plan(plan).widen(cached)
+                return cached  # type: ignore[return-value]
         try:
-            return self.model.objects.get(id=id)
+            entity = self.find_all(plan).get(id=id)
         except self.model.DoesNotExist:
             return None
+        if session is not None:
+            session.add(entity)
+        return entity
 
     def create(self, **kwargs: Any) -> T:
         """Create new entity"""
-        return self.model.objects.create(**kwargs)
+        entity = self.model.objects.create(**kwargs)
+        session = current_session()
+        if session is not None:
+            session.add(entity)
+        return entity
+
+    def save(self, entity: T) -> T:
+        """
+        Save now, or mark dirty when the session runs a unit of work
+
+        Raises ConflictException when the row's version moved since the
+        entity was loaded (BaseModel optimistic locking) or a constraint fails.
+        """
+        session = current_session()
+        if session is not None and session.unit_of_work:
+            session.register_dirty(entity)
+            return entity
+        try:
+            entity.save()
+        except StaleObjectError as e:
+            raise ConflictException(CONFLICT_MESSAGE) from e
+        except IntegrityError as e:
+            raise ConflictException(INTEGRITY_MESSAGE) from e
+        return entity
+
+    def set_related(self, entity: T, field: str, values: Iterable[Any]) -> None:
+        """
+        Replace a many-to-many relation of entity
+        Deferred to the flush when the session runs a unit of work, so it is
+        written (or dropped) together with the entity's own changes
+        """
+        values = list(values)
+        session = current_session()
+        if session is not None and session.unit_of_work:
+            alias = router.db_for_write(type(entity), instance=entity)
+            session.defer(lambda: getattr(entity, field).set(values), using=alias)
+            return
+        getattr(entity, field).set(values)
+
+    def flush(self) -> None:
+        """
+        Write pending unit-of-work changes
+        Services call it before returning from a mutation so version conflicts
+        and integrity errors surface as ConflictException inside the action.
+        """
+        session = current_session()
+        if session is None:
+            return
+        try:
+            session.flush()
+        except StaleObjectError as e:
+            raise ConflictException(CONFLICT_MESSAGE) from e
+        except IntegrityError as e:
+            raise ConflictException(INTEGRITY_MESSAGE) from e
 
     def update(self, id: int, **kwargs: Any) -> Optional[T]:
-        """Update entity by ID"""
-        entity = self.find_by_id(id)
+        """
+        Update entity by ID
+        `version` (the one the edit form was rendered with) makes the update
+        conditional on nobody having saved the row since
+        """
+        expected_version = kwargs.pop("version", None)
+        with use_primary():
+            entity = self.find_by_id(id)
         if not entity:
             return None
+        if expected_version is not None:
+            entity.version = expected_version  # type: ignore[attr-defined]
 
         for key, value in kwargs.items():
             setattr(entity, key, value)
-        entity.save()
-        return entity
+        return self.save(entity)
 
     def delete(self, id: int) -> bool:
         """Delete entity"""
-        entity = self.find_by_id(id)
+        with use_primary():
+            entity = self.find_by_id(id)
         if not entity:
             return False
 
         if hasattr(entity, "deleted"):
             entity.deleted = True  # type: ignore
-            entity.save()
+            entity.delete_at = timezone.now()  # type: ignore
+            self.save(entity)
         else:
+            session = current_session()
+            if session is not None:
+                session.evict(entity)
             entity.delete()
         return True
+
+    def find_changed_since(
+        self,
+        updated_at: Optional[datetime] = None,
+        id: int = 0,
+        until: Optional[datetime] = None,
+    ) -> QuerySet[T]:
+        """
+        Find entities changed after the (updated_at, id) cursor, oldest first
+        Soft-deleted rows are included as tombstones once a cursor exists
+        """
+        queryset = self.find_all()
+        if updated_at is None:
+            queryset = queryset.filter(deleted=False)
+        else:
+            queryset = queryset.filter(
+                Q(updated_at__gt=updated_at) | Q(updated_at=updated_at, id__gt=id)
+            )
+        if until is not None:
+            queryset = queryset.filter(updated_at__lte=until)
+        return queryset.order_by("updated_at", "id")
@@ -0,0 +1,3 @@
+"""
+Core database module - Query instrumentation and database helpers
+"""
@@ -0,0 +1,47 @@
+"""
+Portable aggregates - SQL functions with per-vendor spellings
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.db.models import Aggregate, TextField, Value
+from django.db.models.functions import Cast
+
+
+class GroupConcat(Aggregate):
+    """
+    Concatenate the non-null values of a group into one string
+
+    GROUP_CONCAT(expr, delimiter) on SQLite, STRING_AGG(expr::text,
+    delimiter) on PostgreSQL and GROUP_CONCAT(expr SEPARATOR delimiter) on
+    MySQL. Order inside the group is not guaranteed; sort after splitting.
+
+    Usage:
+        Dish.objects.annotate(tag_list=GroupConcat("tags__name", "|"))
+    """
+
+    function = "GROUP_CONCAT"
+    output_field = TextField()
+
+    def __init__(self, expression: Any, delimiter: str = ",", **extra: Any):
+        self.delimiter = delimiter
+        super().__init__(expression, Value(delimiter), **extra)
+
+    def as_postgresql(self, compiler: Any, connection: Any, **extra: Any) -> Any:
+        clone = self.copy()
+        source, delimiter = clone.get_source_expressions()
+        clone.set_source_expressions([Cast(source, TextField()), delimiter])
+        return clone.as_sql(compiler, connection, function="STRING_AGG", **extra)
+
+    def as_mysql(self, compiler: Any, connection: Any, **extra: Any) -> Any:
+        clone = self.copy()
+        clone.set_source_expressions(clone.get_source_expressions()[:1])
+        return clone.as_sql(
+            compiler,
+            connection,
+            template="%(function)s(%(expressions)s SEPARATOR %(separator)s)",
+            separator="'{}'".format(self.delimiter.replace("'", "''")),
+            **extra,
+        )
@@ -0,0 +1,3 @@
+"""
+Database backends - Thin subclasses of Django's built-in backends
+"""
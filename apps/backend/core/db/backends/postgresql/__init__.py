@@ -0,0 +1,3 @@
+"""
+PostgreSQL backend with an optional in-process connection pool
+"""
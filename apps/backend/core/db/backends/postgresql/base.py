@@ -0,0 +1,96 @@
+"""
+PostgreSQL DatabaseWrapper backed by a psycopg_pool.ConnectionPool
+
+Enable with ENGINE "core.db.backends.postgresql" and OPTIONS["pool"]
+(True or a dict of ConnectionPool arguments: min_size, max_size, timeout,
+max_lifetime, max_idle). Without OPTIONS["pool"] it behaves exactly like
+django.db.backends.postgresql.
+
+Django closes its connection at the end of each request (CONN_MAX_AGE must
+be 0); here closing returns the socket to the pool, so threaded workers
+share a few authenticated connections instead of each keeping their own.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from core.db.connections import checkout_timer, create_pool, pools
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS
+from django.db.backends.postgresql import base
+from django.db.backends.postgresql.psycopg_any import IsolationLevel, is_psycopg3
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def __init__(self, settings_dict: dict[str, Any], alias: str = DEFAULT_DB_ALIAS):
+        super().__init__(settings_dict, alias)
+        pool = settings_dict.get("OPTIONS", {}).get("pool")
+        self.pool_options: Optional[dict[str, Any]] = (
+            (dict(pool) if isinstance(pool, dict) else {}) if pool else None
+        )
+
+    @property
+    def pool(self) -> Any:
+        """ConnectionPool of this alias in the current process (None if disabled)"""
+        if self.pool_options is None:
+            return None
+        return pools.get(self.alias, self._create_pool)
+
+    def _create_pool(self) -> Any:
+        if not is_psycopg3:
+            raise ImproperlyConfigured("OPTIONS['pool'] requires psycopg 3")
+        if self.settings_dict["CONN_MAX_AGE"] != 0:
+            raise ImproperlyConfigured(
+                "OPTIONS['pool'] requires CONN_MAX_AGE = 0 "
+                "(the pool keeps the connections alive)"
+            )
+        conn_params = self.get_connection_params()
+        # Django sets the autocommit mode it wants after each checkout
+        conn_params["autocommit"] = True
+        options = {"check": self.settings_dict["CONN_HEALTH_CHECKS"]}
+        options.update(self.pool_options or {})
+        return create_pool(self.alias, conn_params, self._configure, options)
+
+    def _configure(self, connection: Any) -> None:
+        """Run once per physical connection opened by the pool"""
+        if self.settings_dict["OPTIONS"].get("isolation_level") is not None:
+            connection.isolation_level = self._isolation_level()
+
+    def _isolation_level(self) -> IsolationLevel:
+        value = self.settings_dict["OPTIONS"].get("isolation_level")
+        if value is None:
+            return IsolationLevel.READ_COMMITTED
+        try:
+            return IsolationLevel(value)
+        except ValueError:
+            raise ImproperlyConfigured(
+                f"Invalid transaction isolation level {value} "
+                f"specified. Use one of the psycopg.IsolationLevel values."
+            )
+
+    def get_connection_params(self) -> dict[str, Any]:
+        conn_params = super().get_connection_params()
+        conn_params.pop("pool", None)
+        return conn_params
+
+    def get_new_connection(self, conn_params: dict[str, Any]) -> Any:
+        if self.pool_options is None:
+            return super().get_new_connection(conn_params)
+        self.isolation_level = self._isolation_level()
+        pool = self.pool
+        with checkout_timer(self.alias):
+            return pool.getconn()
+
+    def _close(self) -> None:
+        if self.pool_options is None or self.connection is None:
+            return super()._close()
+        with self.wrap_database_errors:
+            # The pool that handed it out, even if this process forked since
+            pool = getattr(self.connection, "_pool", None)
+            if pool is None:
+                self.connection.close()
+            else:
+                pool.putconn(self.connection)
+            # Never reuse a returned connection, even inside an atomic block
+            self.connection = None
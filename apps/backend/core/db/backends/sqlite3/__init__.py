@@ -0,0 +1,3 @@
+"""
+SQLite backend with a configurable transaction mode
+"""
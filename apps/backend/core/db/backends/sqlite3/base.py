@@ -0,0 +1,43 @@
+"""
+SQLite DatabaseWrapper honoring OPTIONS["transaction_mode"]
+
+Django starts atomic blocks with a plain (DEFERRED) BEGIN, which takes the
+write lock only at the first write. When two such transactions both read
+and then write, the second cannot upgrade its lock and fails with
+"database is locked" without waiting for busy_timeout. With
+transaction_mode "IMMEDIATE" the lock is taken by BEGIN itself, where
+SQLite does wait. Same option name and values as Django 5.1's backend.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS
+from django.db.backends.sqlite3 import base
+
+TRANSACTION_MODES = ("DEFERRED", "EXCLUSIVE", "IMMEDIATE")
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def __init__(self, settings_dict: dict[str, Any], alias: str = DEFAULT_DB_ALIAS):
+        super().__init__(settings_dict, alias)
+        mode = settings_dict.get("OPTIONS", {}).get("transaction_mode")
+        if mode is not None and mode.upper() not in TRANSACTION_MODES:
+            raise ImproperlyConfigured(
+                f"settings.DATABASES[{alias!r}]['OPTIONS']['transaction_mode'] "
+                f"is improperly configured to '{mode}'. Use one of "
+                f"{', '.join(TRANSACTION_MODES)}, or None."
+            )
+        self.transaction_mode: Optional[str] = mode.upper() if mode else None
+
+    def get_connection_params(self) -> dict[str, Any]:
+        conn_params = super().get_connection_params()
+        conn_params.pop("transaction_mode", None)
+        return conn_params
+
+    def _start_transaction_under_autocommit(self) -> None:
+        if self.transaction_mode is None:
+            return super()._start_transaction_under_autocommit()
+        self.cursor().execute(f"BEGIN {self.transaction_mode}")
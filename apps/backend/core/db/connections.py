@@ -0,0 +1,173 @@
+"""
+Connection lifecycle - Per-process psycopg pools and connection metrics
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+from core.metrics import REGISTRY, Counter, Gauge, Histogram
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger("core.db.connections")
+
+CONNECTIONS_OPENED = Counter(
+    "savoro_db_connections_opened_total",
+    "Physical database connections opened (TCP, TLS and authentication)",
+    ("alias",),
+)
+POOL_WAIT = Histogram(
+    "savoro_db_pool_wait_seconds",
+    "Time spent waiting for a pooled connection",
+    ("alias",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+POOL_TIMEOUTS = Counter(
+    "savoro_db_pool_timeouts_total",
+    "Checkouts that gave up after the pool timeout",
+    ("alias",),
+)
+POOL_CONNECTIONS = Gauge(
+    "savoro_db_pool_connections",
+    "Connections held by the pools of live workers (idle, in_use)",
+    ("alias", "state"),
+    multiprocess_mode="livesum",
+)
+POOL_WAITING = Gauge(
+    "savoro_db_pool_requests_waiting",
+    "Threads waiting for a pooled connection",
+    ("alias",),
+    multiprocess_mode="livesum",
+)
+
+
+class PoolRegistry:
+    """
+    One psycopg_pool.ConnectionPool per database alias and process
+
+    Pools are created on first checkout, so a forked worker (gunicorn with
+    preload, run_workers --processes) never reuses sockets opened by its
+    parent: a pool created under another pid is dropped, not closed.
+    """
+
+    def __init__(self) -> None:
+        self._pools: dict[str, Any] = {}
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def get(self, alias: str, factory: Callable[[], Any]) -> Any:
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._pools, self._pid = {}, os.getpid()
+        pool = self._pools.get(alias)
+        if pool is None:
+            with self._lock:
+                pool = self._pools.get(alias)
+                if pool is None:
+                    pool = self._pools[alias] = factory()
+        return pool
+
+    def items(self) -> list[tuple[str, Any]]:
+        if self._pid != os.getpid():
+            return []
+        return list(self._pools.items())
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Close every pool of this process (worker shutdown, before a fork)"""
+        with self._lock:
+            pools = self._pools if self._pid == os.getpid() else {}
+            self._pools = {}
+        for alias, pool in pools.items():
+            try:
+                pool.close(timeout=timeout)
+            except Exception:
+                logger.warning("Could not close the pool of %s", alias, exc_info=True)
+
+
+pools = PoolRegistry()
+
+
+def close_pools() -> None:
+    pools.close()
+
+
+def create_pool(
+    alias: str,
+    conninfo_kwargs: dict[str, Any],
+    configure: Callable[[Any], None],
+    options: dict[str, Any],
+) -> Any:
+    """
+    Open a pool of autocommit connections for alias
+
+    options are passed to ConnectionPool (min_size, max_size, timeout,
+    max_lifetime, max_idle...). Connections are checked before being handed
+    out when CONN_HEALTH_CHECKS is on (check=True in options).
+    """
+    try:
+        from psycopg_pool import ConnectionPool
+    except ImportError as e:
+        raise ImproperlyConfigured(
+            "OPTIONS['pool'] requires psycopg 3 and psycopg-pool "
+            "(pip install 'psycopg[pool]')"
+        ) from e
+
+    options = dict(options)
+    if options.pop("check", False) and hasattr(ConnectionPool, "check_connection"):
+        options["check"] = ConnectionPool.check_connection
+
+    def opened(connection: Any) -> None:
+        CONNECTIONS_OPENED.inc(alias=alias)
+        configure(connection)
+
+    pool = ConnectionPool(
+        kwargs=conninfo_kwargs,
+        configure=opened,
+        open=False,
+        name=alias,
+        **options,
+    )
+    pool.open()
+    return pool
+
+
+@contextmanager
+def checkout_timer(alias: str) -> Iterator[None]:
+    """Record the wait of one pool checkout (and whether it timed out)"""
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        if type(e).__name__ == "PoolTimeout":
+            POOL_TIMEOUTS.inc(alias=alias)
+        raise
+    finally:
+        POOL_WAIT.observe(time.perf_counter() - started, alias=alias)
+
+
+def collect_pool_metrics() -> None:
+    """Refresh pool gauges (registered as a registry collector)"""
+    for alias, pool in pools.items():
+        stats = pool.get_stats()
+        size = stats.get("pool_size", 0)
+        available = stats.get("pool_available", 0)
+        POOL_CONNECTIONS.set(available, alias=alias, state="idle")
+        POOL_CONNECTIONS.set(size - available, alias=alias, state="in_use")
+        POOL_WAITING.set(stats.get("requests_waiting", 0), alias=alias)
+
+
+def _connection_opened(sender: Any, connection: Any, **kwargs: Any) -> None:
+    # Pooled checkouts are counted by the pool when it really connects
+    if getattr(connection, "pool_options", None) is None:
+        CONNECTIONS_OPENED.inc(alias=connection.alias)
+
+
+REGISTRY.add_collector(collect_pool_metrics)
+connection_created.connect(_connection_opened, dispatch_uid="core.db.connections")
@@ -0,0 +1,35 @@
+"""
+SQL fingerprinting - Normalize statements into query shapes
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%s)(?:\s*,\s*(?:\?|%s))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Reduce a statement to its shape: literals and parameter lists collapsed
+
+    Examples:
+        >>> normalize_sql('SELECT * FROM "t" WHERE "t"."id" IN (%s, %s, %s)')
+        'SELECT * FROM "t" WHERE "t"."id" IN (?+)'
+        >>> normalize_sql("SELECT * FROM t WHERE name = 'Café' LIMIT 21")
+        'SELECT * FROM t WHERE name = ? LIMIT ?'
+    """
+    normalized = _STRING_LITERAL.sub("?", sql)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(?+)", normalized)
+    normalized = normalized.replace("%s", "?")
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def fingerprint(sql: str) -> str:
+    """Short stable hash of the normalized statement"""
+    return hashlib.sha1(normalize_sql(sql).encode("utf-8")).hexdigest()[:16]
@@ -0,0 +1,216 @@
+"""
+N+1 query detection - Repeated query shapes with call-site attribution
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import FrameType
+from typing import Iterable, Optional
+
+from django.apps import apps
+from django.conf import settings
+
+from .fingerprint import normalize_sql
+from .queries import QueryRecorder, RecordedQuery
+
+_FROM_TABLE = re.compile(r'\bFROM\s+"?(\w+)"?', re.IGNORECASE)
+_WHERE_COLUMN = re.compile(
+    r'\bWHERE\s+\(?\s*"?(\w+)"?\."?(\w+)"?\s*=\s*%s', re.IGNORECASE
+)
+_TEMPLATE_BASE = os.path.join("django", "template", "base.py")
+_IGNORED_DIRS = (
+    os.path.join("core", "db") + os.sep,
+    os.path.join("core", "middleware") + os.sep,
+)
+
+
+@dataclass
+class QueryOrigin:
+    """Where a statement was triggered from"""
+
+    template: Optional[str] = None
+    stack: tuple[str, ...] = ()
+
+    @property
+    def key(self) -> str:
+        """Grouping key: template line if any, else innermost project frame"""
+        if self.template:
+            return self.template
+        return self.stack[-1] if self.stack else "<unknown>"
+
+
+@dataclass
+class NPlusOneReport:
+    """A query shape repeated from the same call site"""
+
+    shape: str
+    count: int
+    origin: QueryOrigin
+    suggestion: Optional[str] = None
+    sample: str = ""
+
+    def format(self) -> str:
+        """Human readable report for logs and exceptions"""
+        lines = [f"N+1 query: {self.count}x {self.shape}"]
+        if self.origin.template:
+            lines.append(f"  template: {self.origin.template}")
+        for frame in self.origin.stack:
+            lines.append(f"  at {frame}")
+        if self.suggestion:
+            lines.append(f"  suggestion: {self.suggestion}")
+        return "\n".join(lines)
+
+
+@dataclass
+class _ShapeGroup:
+    count: int = 0
+    origin: QueryOrigin = field(default_factory=QueryOrigin)
+    sample: str = ""
+
+
+def _project_root() -> str:
+    return str(settings.BASE_DIR) + os.sep
+
+
+def _template_location(frame: Optional[FrameType]) -> Optional[str]:
+    """Innermost template node being rendered, as 'name:line'"""
+    while frame is not None:
+        if frame.f_code.co_filename.endswith(_TEMPLATE_BASE) and (
+            frame.f_code.co_name == "render_annotated"
+        ):
+            node = frame.f_locals.get("self")
+            token = getattr(node, "token", None)
+            origin = getattr(node, "origin", None)
+            if token is not None and origin is not None:
+                return f"{origin.template_name or origin.name}:{token.lineno}"
+        frame = frame.f_back
+    return None
+
+
+def _project_stack(frame: Optional[FrameType], limit: int) -> tuple[str, ...]:
+    """Project frames (outermost first) excluding the instrumentation itself"""
+    root = _project_root()
+    frames: list[str] = []
+    while frame is not None and len(frames) < limit:
+        filename = frame.f_code.co_filename
+        if filename.startswith(root) and "site-packages" not in filename:
+            relative = filename[len(root) :]
+            if not relative.startswith(_IGNORED_DIRS):
+                frames.append(f"{relative}:{frame.f_lineno} in {frame.f_code.co_name}")
+        frame = frame.f_back
+    return tuple(reversed(frames))
+
+
+@lru_cache(maxsize=None)
+def _relation_index() -> dict[tuple[str, str], str]:
+    """
+    Map (table, filtered column) to the prefetch/select path that avoids it
+
+    Built once from the model registry:
+        forward FK   (target_table, pk)          -> select_related("field")
+        reverse FK   (child_table, fk_column)    -> prefetch_related("related_name")
+        many-to-many (through_table, source_col) -> prefetch_related("field")
+    """
+    index: dict[tuple[str, str], str] = {}
+    for model in apps.get_models():
+        owner = model.__name__
+        for model_field in model._meta.get_fields():
+            if not model_field.is_relation or model_field.auto_created:
+                continue
+            related = model_field.related_model
+            if related is None or isinstance(related, str):
+                continue
+            if model_field.many_to_one or model_field.one_to_one:
+                pk_column = related._meta.pk.column
+                index.setdefault(
+                    (related._meta.db_table, pk_column),
+                    f'{owner}: select_related("{model_field.name}")',
+                )
+                accessor = model_field.remote_field.get_accessor_name()
+                if accessor:
+                    index.setdefault(
+                        (model._meta.db_table, model_field.column),
+                        f'{related.__name__}: prefetch_related("{accessor}") '
+                        f'or annotate(Count("{accessor}")) for counts',
+                    )
+            elif model_field.many_to_many:
+                through = model_field.remote_field.through._meta
+                source_column = model_field.m2m_column_name()
+                index.setdefault(
+                    (through.db_table, source_column),
+                    f'{owner}: prefetch_related("{model_field.name}")',
+                )
+    return index
+
+
+def suggest_fix(sql: str) -> Optional[str]:
+    """Suggest the select_related/prefetch_related path for a lazy-load query"""
+    where = _WHERE_COLUMN.search(sql)
+    if not where:
+        return None
+    index = _relation_index()
+    table, column = where.group(1), where.group(2)
+    if (table, column) in index:
+        return index[(table, column)]
+    source = _FROM_TABLE.search(sql)
+    if source and (source.group(1), column) in index:
+        return index[(source.group(1), column)]
+    return None
+
+
+class NPlusOneRecorder(QueryRecorder):
+    """
+    QueryRecorder that groups statements by shape and call site
+
+    Usage:
+        with NPlusOneRecorder(threshold=3) as recorder:
+            response = get_response(request)
+        for report in recorder.reports():
+            logger.warning(report.format())
+    """
+
+    def __init__(
+        self,
+        using: Optional[Iterable[str]] = None,
+        threshold: int = 3,
+        stack_depth: int = 5,
+    ):
+        super().__init__(using)
+        self.threshold = threshold
+        self.stack_depth = stack_depth
+        self._groups: dict[tuple[str, str], _ShapeGroup] = defaultdict(_ShapeGroup)
+
+    def record(self, query: RecordedQuery) -> None:
+        super().record(query)
+        if not query.sql.lstrip().upper().startswith("SELECT"):
+            return
+        caller = sys._getframe(1)
+        origin = QueryOrigin(
+            template=_template_location(caller),
+            stack=_project_stack(caller, self.stack_depth),
+        )
+        group = self._groups[(normalize_sql(query.sql), origin.key)]
+        if not group.count:
+            group.origin = origin
+            group.sample = query.sql
+        group.count += 1
+
+    def reports(self) -> list[NPlusOneReport]:
+        """Query shapes repeated at least `threshold` times from one call site"""
+        return [
+            NPlusOneReport(
+                shape=shape,
+                count=group.count,
+                origin=group.origin,
+                suggestion=suggest_fix(group.sample),
+                sample=group.sample,
+            )
+            for (shape, _), group in self._groups.items()
+            if group.count >= self.threshold
+        ]
@@ -0,0 +1,103 @@
+"""
+Query recording utilities built on Django's execute wrappers
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+@dataclass
+class RecordedQuery:
+    """Single SQL statement captured by a QueryRecorder"""
+
+    sql: str
+    params: Any
+    many: bool
+    duration: float
+    alias: str
+
+
+class QueryRecorder:
+    """
+    Context manager that records every query executed on the given connections
+
+    Usage:
+        with QueryRecorder() as recorder:
+            controller.index(request)
+        print(recorder.count, recorder.total_time)
+    """
+
+    def __init__(self, using: Optional[Iterable[str]] = None):
+        self.aliases = list(using) if using else [DEFAULT_DB_ALIAS]
+        self.queries: list[RecordedQuery] = []
+        self._stack: Optional[ExitStack] = None
+
+    def __enter__(self) -> "QueryRecorder":
+        self._stack = ExitStack()
+        for alias in self.aliases:
+            self._stack.enter_context(
+                connections[alias].execute_wrapper(self._wrapper(alias))
+            )
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._stack is not None:
+            self._stack.close()
+            self._stack = None
+
+    def _wrapper(self, alias: str) -> Callable[..., Any]:
+        """Build an execute wrapper bound to a connection alias"""
+
+        def wrapper(
+            execute: Callable[..., Any],
+            sql: str,
+            params: Any,
+            many: bool,
+            context: dict[str, Any],
+        ) -> Any:
+            start = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                self.record(
+                    RecordedQuery(
+                        sql=sql,
+                        params=params,
+                        many=many,
+                        duration=time.perf_counter() - start,
+                        alias=alias,
+                    )
+                )
+
+        return wrapper
+
+    def record(self, query: RecordedQuery) -> None:
+        """
+        Store a captured statement
+
+        Called from inside the execute wrapper, so subclasses can still
+        inspect the calling stack here.
+        """
+        self.queries.append(query)
+
+    @property
+    def count(self) -> int:
+        """Number of statements executed"""
+        return len(self.queries)
+
+    @property
+    def total_time(self) -> float:
+        """Total time spent executing statements, in seconds"""
+        return sum(query.duration for query in self.queries)
+
+    def format_queries(self) -> str:
+        """Numbered list of captured statements, for assertion messages"""
+        return "\n".join(
+            f"{index}. {query.sql}" for index, query in enumerate(self.queries, 1)
+        )
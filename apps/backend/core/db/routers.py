@@ -0,0 +1,175 @@
+"""
+Read-replica database router with read-your-writes stickiness
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
+
+from core.db.timeouts import is_timeout_transaction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+logger = logging.getLogger("core.db.routers")
+
+
+@dataclass
+class _ReadState:
+    """Routing state of the current request"""
+
+    replicas_allowed: bool = False
+    # Set by the first write to a replicated app (read-your-writes)
+    wrote: bool = False
+    # Nesting depth of use_primary() blocks
+    primary: int = 0
+
+
+_state: ContextVar[Optional[_ReadState]] = ContextVar("db_read_state", default=None)
+
+
+def replica_aliases() -> list[str]:
+    return list(getattr(settings, "DATABASE_REPLICAS", []))
+
+
+def _replicated(model: type) -> bool:
+    """Whether reads of model may be served by a replica (REPLICA_READ_APPS)"""
+    apps = getattr(settings, "REPLICA_READ_APPS", ("dish", "category", "food_tag"))
+    return model._meta.app_label in apps  # type: ignore[attr-defined]
+
+
+@contextmanager
+def routing_scope(replicas_allowed: bool) -> Iterator[_ReadState]:
+    """
+    Track writes inside the block and, if allowed, read from replicas
+
+    ReplicaRoutingMiddleware opens one per request. Outside any scope
+    (workers, commands, shell) everything uses the primary.
+    """
+    state = _ReadState(replicas_allowed=replicas_allowed)
+    token = _state.set(state)
+    try:
+        yield state
+    finally:
+        _state.reset(token)
+
+
+@contextmanager
+def use_primary() -> Iterator[None]:
+    """Read from the primary inside the block (read-modify-write paths)"""
+    state = _state.get()
+    if state is None:
+        yield
+        return
+    state.primary += 1
+    try:
+        yield
+    finally:
+        state.primary -= 1
+
+
+class ReplicaHealth:
+    """
+    Replication lag per replica, checked at most every few seconds
+
+    A replica lagging more than REPLICA_MAX_LAG_SECONDS, or failing the
+    check, is skipped until the next check.
+    """
+
+    def __init__(self) -> None:
+        self._checked: dict[str, tuple[float, bool]] = {}
+        self._lock = threading.Lock()
+
+    def is_healthy(self, alias: str) -> bool:
+        interval = float(getattr(settings, "REPLICA_LAG_CHECK_SECONDS", 5))
+        checked_at, healthy = self._checked.get(alias, (0.0, True))
+        if time.monotonic() - checked_at < interval:
+            return healthy
+        with self._lock:
+            checked_at, healthy = self._checked.get(alias, (0.0, True))
+            if time.monotonic() - checked_at >= interval:
+                healthy = self._check(alias)
+                self._checked[alias] = (time.monotonic(), healthy)
+        return healthy
+
+    def _check(self, alias: str) -> bool:
+        max_lag = float(getattr(settings, "REPLICA_MAX_LAG_SECONDS", 2))
+        try:
+            lag = self.lag(alias)
+        except Exception:
+            logger.warning("Replica %s failed its lag check", alias, exc_info=True)
+            return False
+        if lag is not None and lag > max_lag:
+            logger.warning("Replica %s lags %.1fs (max %.1fs)", alias, lag, max_lag)
+            return False
+        return True
+
+    def lag(self, alias: str) -> Optional[float]:
+        """Seconds behind the primary (None when the backend cannot tell)"""
+        connection = connections[alias]
+        if connection.vendor != "postgresql":
+            return None
+        with connection.cursor() as cursor:
+            # An idle primary sends no WAL: caught up means no lag
+            cursor.execute(
+                "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() "
+                "THEN 0 ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) "
+                "END"
+            )
+            row = cursor.fetchone()
+        return float(row[0]) if row and row[0] is not None else None
+
+
+replica_health = ReplicaHealth()
+
+
+class ReplicaRouter:
+    """
+    Send reads to a healthy replica, writes and migrations to the primary
+
+    Only models of REPLICA_READ_APPS (the menu) are read from replicas;
+    sessions, users and jobs always use the primary. Reads also stay on the
+    primary when the request may not use replicas (routing_scope()), inside
+    use_primary() or a transaction, and once the request has written to a
+    replicated app (read-your-writes).
+    """
+
+    def db_for_read(self, model: type, **hints: Any) -> Optional[str]:
+        state = _state.get()
+        if (
+            state is None
+            or not state.replicas_allowed
+            or state.wrote
+            or state.primary
+            or not _replicated(model)
+        ):
+            return DEFAULT_DB_ALIAS
+        primary = connections[DEFAULT_DB_ALIAS]
+        # The transaction a statement_timeout opens only scopes SET LOCAL
+        if primary.in_atomic_block and not is_timeout_transaction(primary):
+            return DEFAULT_DB_ALIAS
+        candidates = [
+            alias for alias in replica_aliases() if replica_health.is_healthy(alias)
+        ]
+        return random.choice(candidates) if candidates else DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model: type, **hints: Any) -> Optional[str]:
+        state = _state.get()
+        if state is not None and _replicated(model):
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> Optional[bool]:
+        # Replicas hold the same rows as the primary
+        return True
+
+    def allow_migrate(
+        self, db: str, app_label: str, model_name: Optional[str] = None, **hints: Any
+    ) -> Optional[bool]:
+        return db not in replica_aliases()
@@ -0,0 +1,133 @@
+"""
+Request-scoped session - Identity map and optional unit of work
+
+BaseRepository.find_by_id consults the active session so that loading the
+same row twice in one request returns the same instance without a query.
+With a unit of work, repository updates mark entities dirty and
+Session.flush() saves them, and the deferred many-to-many writes, together in
+one transaction.
+
+Outside a session (jobs, management commands, shell) repositories behave
+exactly as before.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional
+
+from django.db import models, router, transaction
+
+# (model label, primary key)
+IdentityKey = tuple[str, Any]
+
+_session: ContextVar[Optional["Session"]] = ContextVar("db_session", default=None)
+
+
+def _label(model: type[models.Model]) -> str:
+    return model._meta.label_lower
+
+
+class Session:
+    """
+    Identity map keyed by model and primary key
+
+    One instance per row: a caller asking for more than the cached copy
+    holds (deferred columns, relations) widens it in place, see
+    BaseRepository.find_by_id.
+    """
+
+    def __init__(self, unit_of_work: bool = False):
+        self.unit_of_work = unit_of_work
+        self._identity: dict[IdentityKey, models.Model] = {}
+        # Insertion-ordered set of entities waiting for flush()
+        self._dirty: dict[int, models.Model] = {}
+        # (alias, operation) pairs run after the saves, e.g. M2M writes
+        self._deferred: list[tuple[str, Callable[[], Any]]] = []
+        self.hits = 0
+
+    # Identity map -------------------------------------------------------
+
+    def get(self, model: type[models.Model], pk: Any) -> Optional[models.Model]:
+        entity = self._identity.get((_label(model), pk))
+        if entity is not None:
+            self.hits += 1
+        return entity
+
+    def add(self, entity: models.Model) -> None:
+        self._identity[(_label(type(entity)), entity.pk)] = entity
+
+    def evict(self, entity: models.Model) -> None:
+        """Forget the cached instance of an entity (after a hard delete)"""
+        self._identity.pop((_label(type(entity)), entity.pk), None)
+        self._dirty.pop(id(entity), None)
+
+    def clear(self) -> None:
+        """Drop the identity map (pending dirty entities are kept)"""
+        self._identity.clear()
+
+    # Unit of work -------------------------------------------------------
+
+    def register_dirty(self, entity: models.Model) -> None:
+        self._dirty[id(entity)] = entity
+
+    def defer(self, operation: Callable[[], Any], using: str) -> None:
+        """Run operation in the flush transaction of `using`, after the saves"""
+        self._deferred.append((using, operation))
+
+    @property
+    def dirty(self) -> list[models.Model]:
+        return list(self._dirty.values())
+
+    def flush(self) -> int:
+        """Save dirty entities in one transaction per database; returns the count"""
+        if not self._dirty and not self._deferred:
+            return 0
+        pending, self._dirty = list(self._dirty.values()), {}
+        deferred, self._deferred = self._deferred, []
+        by_alias: dict[str, list[models.Model]] = {}
+        for entity in pending:
+            alias = router.db_for_write(type(entity), instance=entity)
+            by_alias.setdefault(alias, []).append(entity)
+        operations: dict[str, list[Callable[[], Any]]] = {}
+        for alias, operation in deferred:
+            by_alias.setdefault(alias, [])
+            operations.setdefault(alias, []).append(operation)
+        for alias, entities in by_alias.items():
+            with transaction.atomic(using=alias):
+                for entity in entities:
+                    entity.save(using=alias)
+                for operation in operations.get(alias, ()):
+                    operation()
+        return len(pending)
+
+    def discard(self) -> None:
+        """Drop pending changes without saving them"""
+        self._dirty = {}
+        self._deferred = []
+
+
+def current_session() -> Optional[Session]:
+    """The session opened by RequestSessionMiddleware or session_scope()"""
+    return _session.get()
+
+
+@contextmanager
+def session_scope(unit_of_work: bool = False) -> Iterator[Session]:
+    """
+    Open a session for the duration of the block
+
+    With unit_of_work, dirty entities are flushed when the block exits
+    normally and discarded if it raises.
+    """
+    session = Session(unit_of_work=unit_of_work)
+    token = _session.set(session)
+    try:
+        yield session
+        session.flush()
+    except BaseException:
+        session.discard()
+        raise
+    finally:
+        _session.reset(token)
@@ -0,0 +1,188 @@
+"""
+Slow query log - Statements above a threshold with their execution plan
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import random
+import sys
+import threading
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from types import FrameType
+from typing import Any, Iterable, Optional
+
+from django.db import connections
+
+from .fingerprint import fingerprint, normalize_sql
+from .n_plus_one import _project_stack, _template_location
+from .queries import QueryRecorder, RecordedQuery
+
+logger = logging.getLogger("core.slow_query")
+
+# Set while an EXPLAIN runs so its own statement is not observed again
+_explaining: ContextVar[bool] = ContextVar("explaining", default=False)
+
+
+@dataclass
+class SlowQueryRecord:
+    """One slow statement, serialized as a JSON line"""
+
+    fingerprint: str
+    shape: str
+    sql: str
+    duration_ms: float
+    alias: str
+    vendor: str
+    repository: Optional[str] = None
+    origin: Optional[str] = None
+    path: Optional[str] = None
+    plan: list[str] = field(default_factory=list)
+    analyzed: bool = False
+    logged_at: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat()
+    )
+
+
+def _repository_method(frame: Optional[FrameType]) -> Optional[str]:
+    """Innermost BaseRepository method on the stack, as 'DishRepository.find_all'"""
+    from core.base.repositories import BaseRepository
+
+    while frame is not None:
+        # type() rather than isinstance(): never evaluate lazy objects here
+        owner = type(frame.f_locals.get("self"))
+        if issubclass(owner, BaseRepository):
+            return f"{owner.__name__}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+def explain(
+    alias: str, sql: str, params: Any, analyze: bool = False
+) -> tuple[list[str], bool]:
+    """
+    Execution plan of a SELECT as text lines, and whether it was analyzed
+
+    PostgreSQL runs EXPLAIN (ANALYZE, BUFFERS) when analyze is set, which
+    executes the statement again; SQLite only supports EXPLAIN QUERY PLAN.
+    """
+    if not sql.lstrip().upper().startswith("SELECT"):
+        return [], False
+    connection = connections[alias]
+    vendor = connection.vendor
+    if vendor == "postgresql":
+        prefix = "EXPLAIN (ANALYZE, BUFFERS) " if analyze else "EXPLAIN "
+    elif vendor == "sqlite":
+        prefix, analyze = "EXPLAIN QUERY PLAN ", False
+    else:
+        prefix, analyze = "EXPLAIN ", False
+
+    token = _explaining.set(True)
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(prefix + sql, params)
+            rows = cursor.fetchall()
+    except Exception as e:
+        logger.debug("EXPLAIN failed for %s: %s", sql, e)
+        return [], False
+    finally:
+        _explaining.reset(token)
+
+    if vendor == "sqlite":
+        # (id, parent, notused, detail)
+        return [str(row[-1]) for row in rows], False
+    return [" ".join(str(column) for column in row) for row in rows], analyze
+
+
+class SlowQueryLog:
+    """Append-only JSON Lines file shared by the threads of a process"""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def write(self, record: SlowQueryRecord) -> None:
+        line = json.dumps(asdict(record), ensure_ascii=False)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def read(self) -> Iterable[SlowQueryRecord]:
+        """Records in the log, skipping malformed lines"""
+        if not self.path.exists():
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield SlowQueryRecord(**json.loads(line))
+                except (ValueError, TypeError):
+                    continue
+
+
+class SlowQueryRecorder(QueryRecorder):
+    """
+    QueryRecorder that logs statements slower than threshold_ms
+
+    Usage:
+        with SlowQueryRecorder(log, threshold_ms=100, path=request.path):
+            response = get_response(request)
+    """
+
+    def __init__(
+        self,
+        log: SlowQueryLog,
+        using: Optional[Iterable[str]] = None,
+        threshold_ms: float = 100.0,
+        analyze_rate: float = 0.0,
+        path: Optional[str] = None,
+    ):
+        super().__init__(using)
+        self.log = log
+        self.threshold_ms = threshold_ms
+        self.analyze_rate = analyze_rate
+        self.path = path
+        self.records: list[SlowQueryRecord] = []
+
+    def record(self, query: RecordedQuery) -> None:
+        duration_ms = query.duration * 1000
+        if duration_ms < self.threshold_ms or _explaining.get():
+            return
+        caller = sys._getframe(1)
+        stack = _project_stack(caller, 1)
+        # Plans are captured after the wrapper returns, outside the cursor in use
+        self.records.append(
+            SlowQueryRecord(
+                fingerprint=fingerprint(query.sql),
+                shape=normalize_sql(query.sql),
+                sql=query.sql,
+                duration_ms=round(duration_ms, 3),
+                alias=query.alias,
+                vendor=connections[query.alias].vendor,
+                repository=_repository_method(caller),
+                origin=_template_location(caller) or (stack[0] if stack else None),
+                path=self.path,
+            )
+        )
+        self.queries.append(query)
+
+    def __exit__(self, *exc_info: Any) -> None:
+        super().__exit__(*exc_info)
+        for record, query in zip(self.records, self.queries):
+            if not query.many:
+                analyze = self.analyze_rate > 0 and random.random() < self.analyze_rate
+                record.plan, record.analyzed = explain(
+                    query.alias, query.sql, query.params, analyze
+                )
+            self.log.write(record)
+            logger.warning(
+                "Slow query %.1fms [%s] %s (%s)",
+                record.duration_ms,
+                record.fingerprint,
+                record.shape,
+                record.repository or record.origin or "unknown caller",
+            )
@@ -0,0 +1,98 @@
+"""
+SQLite tuning - Connection PRAGMAs and periodic optimize/checkpoint job
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from datetime import timedelta
+from typing import Any, Mapping, Optional
+
+from core.jobs import job
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.backends.signals import connection_created
+from django.utils import timezone
+
+logger = logging.getLogger("core.db.sqlite")
+
+_PRAGMA_NAME = re.compile(r"^[a-z_]+$")
+
+
+def apply_pragmas(cursor: Any, pragmas: Mapping[str, Any]) -> None:
+    """Run `PRAGMA name = value` for each item on a DB-API cursor"""
+    for name, value in pragmas.items():
+        if not _PRAGMA_NAME.match(name):
+            raise ImproperlyConfigured(f"Invalid SQLite PRAGMA name: {name!r}")
+        cursor.execute(f"PRAGMA {name} = {value}")
+
+
+def _configure_connection(sender: Any, connection: Any, **kwargs: Any) -> None:
+    pragmas = getattr(settings, "SQLITE_PRAGMAS", None)
+    if connection.vendor != "sqlite" or not pragmas:
+        return
+    cursor = connection.connection.cursor()
+    try:
+        apply_pragmas(cursor, pragmas)
+    finally:
+        cursor.close()
+
+
+connection_created.connect(_configure_connection, dispatch_uid="core.db.sqlite")
+
+
+def sqlite_aliases() -> list[str]:
+    return [alias for alias in connections if connections[alias].vendor == "sqlite"]
+
+
+def optimize(
+    alias: str = DEFAULT_DB_ALIAS, checkpoint: Optional[str] = "TRUNCATE"
+) -> Optional[tuple[int, int, int]]:
+    """
+    Refresh planner statistics and fold the WAL back into the database
+
+    Returns the wal_checkpoint row (busy, WAL pages, pages checkpointed).
+    A busy checkpoint is not an error: the next run finishes it.
+    """
+    with connections[alias].cursor() as cursor:
+        cursor.execute("PRAGMA optimize")
+        if checkpoint is None:
+            return None
+        cursor.execute(f"PRAGMA wal_checkpoint({checkpoint})")
+        row = cursor.fetchone()
+    return (int(row[0]), int(row[1]), int(row[2])) if row else None
+
+
+@job(queue="default", max_attempts=1)
+def sqlite_maintenance() -> None:
+    """Optimize every SQLite database, then schedule the next run"""
+    try:
+        for alias in sqlite_aliases():
+            result = optimize(alias)
+            if result is not None and result[0]:
+                logger.warning("WAL checkpoint of %s was busy: %s", alias, result)
+            else:
+                logger.info("SQLite %s optimized (checkpoint %s)", alias, result)
+    finally:
+        schedule_maintenance()
+
+
+def schedule_maintenance() -> None:
+    """
+    Queue the next sqlite_maintenance run SQLITE_MAINTENANCE_INTERVAL seconds out
+
+    Called by run_workers on start and by the job itself; the dedup key keeps
+    a single queued run. Nothing is scheduled with JOBS_EAGER (the job would
+    run inline right away) or without SQLite databases.
+    """
+    interval = int(getattr(settings, "SQLITE_MAINTENANCE_INTERVAL", 0))
+    if interval <= 0 or getattr(settings, "JOBS_EAGER", False):
+        return
+    if not sqlite_aliases():
+        return
+    sqlite_maintenance.delay(
+        dedup_key="sqlite-maintenance",
+        run_at=timezone.now() + timedelta(seconds=interval),
+    )
@@ -0,0 +1,188 @@
+"""
+Statement timeouts - Cancel SQL statements that run past a per-action budget
+
+PostgreSQL: the first statement of the scope on a connection opens a
+transaction (unless one is already open) and runs
+`SET LOCAL statement_timeout`, so the setting never outlives it and is safe
+behind PgBouncer in transaction mode. The server cancels the statement.
+
+SQLite: a progress handler interrupts the statement once its deadline has
+passed.
+
+Either way the statement raises StatementTimeout, counted in
+savoro_db_statement_timeouts_total. The budget applies to each statement;
+Python loops over query results call check_deadline(), which holds them to
+the same budget measured from the start of the scope.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import ExitStack
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+from core.exceptions.database import StatementTimeout
+from core.metrics import Counter
+from django.db import DatabaseError, connections, transaction
+
+STATEMENT_TIMEOUTS = Counter(
+    "savoro_db_statement_timeouts_total",
+    "Statements cancelled for exceeding the timeout of their action",
+    ("controller", "action", "vendor"),
+)
+
+# VM instructions between two deadline checks on SQLite
+SQLITE_PROGRESS_STEPS = 1000
+# QueryCanceled (statement_timeout or pg_cancel_backend)
+_PG_QUERY_CANCELED = "57014"
+
+
+_active: ContextVar[Optional["statement_timeout"]] = ContextVar(
+    "statement_timeout", default=None
+)
+
+
+def check_deadline() -> None:
+    """
+    Raise StatementTimeout once the innermost scope has run past its timeout
+
+    For Python work no statement covers, e.g. filtering fetched rows. A no-op
+    outside a statement_timeout scope.
+    """
+    scope = _active.get()
+    if scope is not None and time.monotonic() > scope.wall_deadline:
+        controller, action = scope.labels
+        STATEMENT_TIMEOUTS.inc(controller=controller, action=action, vendor="python")
+        raise StatementTimeout("python", scope.timeout_ms)
+
+
+def is_timeout_error(error: BaseException, vendor: str) -> bool:
+    cause = error.__cause__ or error
+    if vendor == "postgresql":
+        code = getattr(cause, "sqlstate", None) or getattr(cause, "pgcode", None)
+        return code == _PG_QUERY_CANCELED
+    if vendor == "sqlite":
+        return "interrupted" in str(cause)
+    return False
+
+
+def is_timeout_transaction(connection: Any) -> bool:
+    """Whether the only open atomic block is one opened by a statement_timeout"""
+    blocks = connection.atomic_blocks
+    return len(blocks) == 1 and getattr(blocks[0], "_statement_timeout", False)
+
+
+class statement_timeout:
+    """
+    Cancel statements that run longer than timeout_ms inside the block
+
+    Usage:
+        with statement_timeout(2000, labels=("DishController", "index")):
+            dishes = list(queryset)
+    """
+
+    def __init__(
+        self,
+        timeout_ms: int,
+        using: Optional[list[str]] = None,
+        labels: tuple[str, str] = ("none", "none"),
+    ):
+        self.timeout_ms = int(timeout_ms)
+        self.aliases = list(using) if using else list(connections)
+        self.labels = labels
+        self._stack: Optional[ExitStack] = None
+        # alias -> outermost atomic block the SET LOCAL was issued in
+        self._configured: dict[str, Any] = {}
+        self._deadline = 0.0
+        self.wall_deadline = 0.0
+
+    def __enter__(self) -> "statement_timeout":
+        self.wall_deadline = time.monotonic() + self.timeout_ms / 1000
+        self._stack = ExitStack()
+        self._stack.callback(_active.reset, _active.set(self))
+        for alias in self.aliases:
+            self._stack.enter_context(
+                connections[alias].execute_wrapper(self._wrapper(alias))
+            )
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        stack, self._stack = self._stack, None
+        try:
+            self._restore()
+        finally:
+            # Closes the transactions opened by the scope (rolled back on error)
+            if stack is not None:
+                stack.__exit__(*exc_info)
+
+    def _wrapper(self, alias: str) -> Callable[..., Any]:
+        def wrapper(
+            execute: Callable[..., Any],
+            sql: str,
+            params: Any,
+            many: bool,
+            context: dict[str, Any],
+        ) -> Any:
+            connection = connections[alias]
+            if connection.vendor == "postgresql":
+                self._set_local(alias)
+            elif connection.vendor == "sqlite":
+                self._install_progress_handler(alias)
+                self._deadline = time.monotonic() + self.timeout_ms / 1000
+            try:
+                return execute(sql, params, many, context)
+            except DatabaseError as e:
+                if not is_timeout_error(e, connection.vendor):
+                    raise
+                controller, action = self.labels
+                STATEMENT_TIMEOUTS.inc(
+                    controller=controller, action=action, vendor=connection.vendor
+                )
+                raise StatementTimeout(alias, self.timeout_ms, sql) from e
+
+        return wrapper
+
+    def _set_local(self, alias: str) -> None:
+        connection = connections[alias]
+        if not connection.in_atomic_block:
+            assert self._stack is not None
+            atomic = transaction.atomic(using=alias)
+            setattr(atomic, "_statement_timeout", True)
+            self._stack.enter_context(atomic)
+        outermost = connection.atomic_blocks[0]
+        if self._configured.get(alias) is outermost:
+            return
+        with connection.connection.cursor() as cursor:
+            cursor.execute(f"SET LOCAL statement_timeout = {self.timeout_ms}")
+        self._configured[alias] = outermost
+
+    def _install_progress_handler(self, alias: str) -> None:
+        if alias in self._configured:
+            return
+        connection = connections[alias]
+        connection.ensure_connection()
+        connection.connection.set_progress_handler(
+            lambda: time.monotonic() > self._deadline, SQLITE_PROGRESS_STEPS
+        )
+        self._configured[alias] = connection.connection
+
+    def _restore(self) -> None:
+        """Undo the settings of connections the scope does not close itself"""
+        for alias, configured in self._configured.items():
+            connection = connections[alias]
+            if connection.connection is None:
+                continue
+            if connection.vendor == "sqlite":
+                if connection.connection is configured:
+                    connection.connection.set_progress_handler(None, 0)
+            elif (
+                connection.in_atomic_block
+                and connection.atomic_blocks[0] is configured
+                and not getattr(configured, "_statement_timeout", False)
+                and not connection.needs_rollback
+            ):
+                # A transaction of the caller that outlives the scope
+                with connection.connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL statement_timeout TO DEFAULT")
+        self._configured = {}
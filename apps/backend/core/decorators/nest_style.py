@@ -2,33 +2,112 @@
 NestJS-style decorators
 """
 
-from typing import Type, TypeVar, Callable
+import functools
+import inspect
+from typing import Any, Callable, Iterator, Type, TypeVar
+
+from core.di.container import Scope
+from core.tracing.spans import traced
 
 T = TypeVar("T")
 
 
-def Injectable() -> Callable[[Type[T]], Type[T]]:
+def _public_methods(cls: type) -> Iterator[tuple[str, Callable[..., Any]]]:
+    """
+    Public plain functions resolved on cls (own and inherited)
+
+    Wrappers added when a base class was decorated are peeled off so the
+    subclass re-wraps the original function under its own name.
+    """
+    seen: set[str] = set()
+    for klass in cls.__mro__[:-1]:
+        for name, attribute in vars(klass).items():
+            if (
+                name.startswith("_")
+                or name in seen
+                or not inspect.isfunction(attribute)
+            ):
+                continue
+            seen.add(name)
+            while getattr(attribute, "__traced__", None) or getattr(
+                attribute, "__action__", None
+            ):
+                attribute = attribute.__wrapped__
+            yield name, attribute
+
+
+def _action(controller: str, name: str, function: Callable[..., Any]) -> Any:
+    """Record the outermost action handling a request as request.controller_action"""
+
+    @functools.wraps(function)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        request = args[0] if args else None
+        if hasattr(request, "META") and not hasattr(request, "controller_action"):
+            request.controller_action = (controller, name)  # type: ignore[union-attr]
+        return function(self, *args, **kwargs)
+
+    setattr(wrapper, "__action__", (controller, name))
+    return wrapper
+
+
+def _decorate_methods(cls: type, trace: bool, actions: bool) -> None:
+    """
+    Wrap public methods in tracing spans named Class.method and, for
+    controllers, label the request with the action being handled
+
+    Spans are only recorded while a request trace is active (see
+    core.middleware.tracing.TracingMiddleware); otherwise the wrapper just
+    calls through. Static and class methods are left untouched.
+    """
+    for name, function in list(_public_methods(cls)):
+        if actions:
+            function = _action(cls.__name__, name, function)
+        if trace:
+            function = traced(f"{cls.__name__}.{name}")(function)
+        setattr(cls, name, function)
+
+
+def Injectable(
+    trace: bool = True, scope: Scope = Scope.SINGLETON
+) -> Callable[[Type[T]], Type[T]]:
     """
     Decorator to mark a class as injectable
     Similar to NestJS @Injectable()
+
+    Args:
+        trace: Wrap public methods in tracing spans
+        scope: Lifetime of instances resolved by core.di
     """
 
     def decorator(cls: Type[T]) -> Type[T]:
         setattr(cls, "_injectable", True)
+        setattr(cls, "_scope", scope)
+        if trace:
+            _decorate_methods(cls, trace=True, actions=False)
         return cls
 
     return decorator
 
 
-def Controller(prefix: str = ""):
+def Controller(prefix: str = "", trace: bool = True, scope: Scope = Scope.SINGLETON):
     """
     Decorator to mark a class as controller
     Similar to NestJS @Controller()
+
+    Public methods (actions) set request.controller_action, used to label
+    request metrics by controller and action.
+
+    Args:
+        prefix: Route prefix
+        trace: Wrap public methods (actions) in tracing spans
+        scope: Lifetime of instances resolved by core.di
     """
 
     def decorator(cls: Type[T]) -> Type[T]:
         setattr(cls, "_controller", True)
+        setattr(cls, "_scope", scope)
         setattr(cls, "_prefix", prefix)
+        _decorate_methods(cls, trace=trace, actions=True)
         return cls
 
     return decorator
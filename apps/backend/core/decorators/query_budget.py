@@ -0,0 +1,80 @@
+"""
+Query budget decorator for controller actions and admin views
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+from typing import Any, Callable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+logger = logging.getLogger("core.query_budget")
+
+QUERY_BUDGET_MODES = ("off", "warn", "raise")
+
+
+def get_query_budget_mode() -> str:
+    """Current enforcement mode from settings.QUERY_BUDGET_MODE"""
+    from django.conf import settings
+
+    mode = getattr(settings, "QUERY_BUDGET_MODE", "off")
+    return mode if mode in QUERY_BUDGET_MODES else "off"
+
+
+def query_budget(max_queries: int) -> Callable[[F], F]:
+    """
+    Declare the maximum number of SQL queries an action may execute
+
+    The budget is stored on the function as ``_query_budget`` so tests can
+    assert against it. Depending on ``settings.QUERY_BUDGET_MODE`` the
+    decorator also enforces it at runtime:
+
+        "off"   - no recording, the action is called as-is
+        "warn"  - log a warning with the captured statements
+        "raise" - raise QueryBudgetExceeded
+
+    Lazy responses (TemplateResponse) are rendered inside the recording so
+    template-triggered queries are counted against the action.
+
+    Usage:
+        @query_budget(6)
+        def index(self, request): ...
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            mode = get_query_budget_mode()
+            if mode == "off":
+                return func(*args, **kwargs)
+
+            from core.db.queries import QueryRecorder
+            from core.exceptions.database import QueryBudgetExceeded
+            from django.db import connections
+
+            with QueryRecorder(using=list(connections)) as recorder:
+                response = func(*args, **kwargs)
+                if callable(getattr(response, "render", None)) and not getattr(
+                    response, "is_rendered", True
+                ):
+                    response.render()
+
+            if recorder.count > max_queries:
+                error = QueryBudgetExceeded(
+                    func.__qualname__,
+                    max_queries,
+                    recorder.count,
+                    recorder.format_queries(),
+                )
+                if mode == "raise":
+                    raise error
+                logger.warning(str(error))
+
+            return response
+
+        setattr(wrapper, "_query_budget", max_queries)
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,68 @@
+"""
+Statement timeout decorator for controller actions
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+from typing import Any, Callable, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+logger = logging.getLogger("core.statement_timeout")
+
+
+def statement_timeout(
+    timeout_ms: int, fallback: Optional[str] = None
+) -> Callable[[F], F]:
+    """
+    Cancel any SQL statement of the action that runs longer than timeout_ms
+
+    The timeout is stored on the function as ``_statement_timeout``. When a
+    statement is cancelled the action raises StatementTimeout, unless
+    ``fallback`` names a controller method, which is then called with the
+    same arguments to build a degraded response (e.g. the last cached
+    listing with a warning). settings.STATEMENT_TIMEOUTS_ENABLED = False
+    disables enforcement.
+
+    Lazy responses (TemplateResponse) are rendered inside the timeout so
+    template-triggered queries are covered too.
+
+    Usage:
+        @statement_timeout(2000, fallback="index_timed_out")
+        def index(self, request): ...
+    """
+
+    def decorator(func: F) -> F:
+        controller, _, action = func.__qualname__.rpartition(".")
+        labels = (controller or func.__module__, action)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            from django.conf import settings
+
+            if not getattr(settings, "STATEMENT_TIMEOUTS_ENABLED", True):
+                return func(*args, **kwargs)
+
+            from core.db.timeouts import statement_timeout as timeout_scope
+            from core.exceptions.database import StatementTimeout
+
+            try:
+                with timeout_scope(timeout_ms, labels=labels):
+                    response = func(*args, **kwargs)
+                    if callable(getattr(response, "render", None)) and not getattr(
+                        response, "is_rendered", True
+                    ):
+                        response.render()
+            except StatementTimeout as e:
+                if fallback is None:
+                    raise
+                logger.warning("%s.%s: %s", *labels, e)
+                return getattr(args[0], fallback)(*args[1:], **kwargs)
+            return response
+
+        setattr(wrapper, "_statement_timeout", timeout_ms)
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,44 @@
+"""
+Dependency injection - Constructor injection by type hints with scopes
+
+Usage:
+    @Injectable()                       # Scope.SINGLETON by default
+    class DishService(BaseService):
+        def __init__(self, repository: DishRepository):
+            self.repository = repository
+
+    service = resolve(DishService)      # built on first use, then shared
+    controller = provide(DishController)  # module-level, resolved lazily
+"""
+
+from __future__ import annotations
+
+from typing import TypeVar
+
+from .container import Container, DependencyError, Lazy, Scope, request_scope
+
+T = TypeVar("T")
+
+container = Container()
+
+
+def resolve(cls: type[T]) -> T:
+    """Instance of cls from the global container"""
+    return container.resolve(cls)
+
+
+def provide(cls: type[T]) -> Lazy[T]:
+    """Lazy stand-in for cls, resolved from the global container on use"""
+    return Lazy(cls, container)
+
+
+__all__ = [
+    "Container",
+    "DependencyError",
+    "Lazy",
+    "Scope",
+    "container",
+    "provide",
+    "request_scope",
+    "resolve",
+]
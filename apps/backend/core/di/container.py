@@ -0,0 +1,215 @@
+"""
+Dependency injection container - Scoped, lazily constructed providers
+"""
+
+from __future__ import annotations
+
+import inspect
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Generic, Iterator, Optional, TypeVar, get_type_hints
+
+T = TypeVar("T")
+
+
+class Scope(str, Enum):
+    """Lifetime of a resolved instance"""
+
+    # One instance per process, built on first use
+    SINGLETON = "singleton"
+    # One instance per request (request_scope()); transient outside one
+    REQUEST = "request"
+    # A new instance on every resolve
+    TRANSIENT = "transient"
+
+
+class DependencyError(LookupError):
+    """A class or one of its constructor parameters cannot be resolved"""
+
+
+@dataclass(frozen=True)
+class Provider:
+    factory: Callable[..., Any]
+    scope: Scope
+
+
+# Instances of the current request scope, keyed by class
+_request: ContextVar[Optional[dict[type, Any]]] = ContextVar("di_request", default=None)
+# Classes being constructed, to report dependency cycles
+_resolving: ContextVar[tuple[type, ...]] = ContextVar("di_resolving", default=())
+
+
+class Container:
+    """
+    Resolve classes and their constructor dependencies
+
+    Classes decorated with @Injectable() or @Controller() are resolved
+    without registration, using the scope given to the decorator. Each
+    __init__ parameter is injected from its type hint; parameters whose
+    type is not injectable must have a default.
+
+    A singleton may not depend on a request-scoped class (it would keep the
+    first request's instance); give it provide(cls) instead.
+    """
+
+    def __init__(self) -> None:
+        self._providers: dict[type, Provider] = {}
+        self._singletons: dict[type, Any] = {}
+        self._lock = threading.RLock()
+
+    def register(
+        self,
+        cls: type[T],
+        scope: Scope = Scope.SINGLETON,
+        factory: Optional[Callable[..., T]] = None,
+    ) -> None:
+        """Register a class (optionally built by a factory) under a scope"""
+        self._providers[cls] = Provider(factory or cls, scope)
+        self._singletons.pop(cls, None)
+
+    def provider(self, cls: type[T]) -> Provider:
+        provider = self._providers.get(cls)
+        if provider is not None:
+            return provider
+        scope = getattr(cls, "_scope", None)
+        if scope is None:
+            raise DependencyError(
+                f"{cls.__qualname__} is not injectable "
+                "(decorate it with @Injectable() or register it)"
+            )
+        return Provider(cls, Scope(scope))
+
+    def resolve(self, cls: type[T]) -> T:
+        """Instance of cls for the current scope, building it if needed"""
+        provider = self.provider(cls)
+        if provider.scope is Scope.SINGLETON:
+            instance = self._singletons.get(cls)
+            if instance is None:
+                with self._lock:
+                    instance = self._singletons.get(cls)
+                    if instance is None:
+                        instance = self._singletons[cls] = self._build(cls, provider)
+            return instance
+        if provider.scope is Scope.REQUEST:
+            instances = _request.get()
+            if instances is None:
+                return self._build(cls, provider)
+            if cls not in instances:
+                instances[cls] = self._build(cls, provider)
+            return instances[cls]
+        return self._build(cls, provider)
+
+    @contextmanager
+    def override(self, cls: type[T], instance: T) -> Iterator[None]:
+        """Resolve cls to instance inside the block (tests, scripts)"""
+        previous_provider = self._providers.get(cls)
+        previous_instance = self._singletons.get(cls)
+        self._providers[cls] = Provider(lambda: instance, Scope.SINGLETON)
+        self._singletons[cls] = instance
+        try:
+            yield
+        finally:
+            self._singletons.pop(cls, None)
+            if previous_provider is None:
+                self._providers.pop(cls, None)
+            else:
+                self._providers[cls] = previous_provider
+            if previous_instance is not None:
+                self._singletons[cls] = previous_instance
+
+    def reset(self) -> None:
+        """Drop every singleton (they are rebuilt on next use)"""
+        with self._lock:
+            self._singletons.clear()
+
+    def _build(self, cls: type[T], provider: Provider) -> T:
+        chain = _resolving.get()
+        if cls in chain:
+            cycle = " -> ".join(c.__qualname__ for c in (*chain, cls))
+            raise DependencyError(f"Dependency cycle: {cycle}")
+        token = _resolving.set((*chain, cls))
+        try:
+            kwargs = self._dependencies(cls, provider)
+            return provider.factory(**kwargs)
+        finally:
+            _resolving.reset(token)
+
+    def _dependencies(self, cls: type, provider: Provider) -> dict[str, Any]:
+        """Constructor arguments injected from type hints"""
+        init = provider.factory if provider.factory is not cls else cls.__init__
+        if init is object.__init__:
+            return {}
+        try:
+            hints = get_type_hints(init)
+        except NameError as e:
+            raise DependencyError(
+                f"Cannot evaluate the type hints of {cls.__qualname__}: {e} "
+                "(dependencies must be imported at runtime, not under TYPE_CHECKING)"
+            ) from e
+        kwargs: dict[str, Any] = {}
+        for name, parameter in inspect.signature(init).parameters.items():
+            if name == "self" or parameter.kind in (
+                parameter.VAR_POSITIONAL,
+                parameter.VAR_KEYWORD,
+            ):
+                continue
+            dependency = hints.get(name)
+            try:
+                dependency_provider = (
+                    self.provider(dependency) if isinstance(dependency, type) else None
+                )
+            except DependencyError:
+                dependency_provider = None
+            if dependency_provider is None:
+                if parameter.default is parameter.empty:
+                    raise DependencyError(
+                        f"Cannot inject parameter '{name}' of {cls.__qualname__}"
+                    )
+                continue
+            if (
+                provider.scope is Scope.SINGLETON
+                and dependency_provider.scope is Scope.REQUEST
+            ):
+                raise DependencyError(
+                    f"Singleton {cls.__qualname__} cannot depend on request-scoped "
+                    f"{dependency.__qualname__}; inject provide(...) instead"
+                )
+            kwargs[name] = self.resolve(dependency)
+        return kwargs
+
+
+class Lazy(Generic[T]):
+    """
+    Stand-in resolved on first attribute access
+
+    Module-level `controller = provide(DishController)` defers building the
+    controller (and its services and repositories) until the first request.
+    Every access goes through the container, so a request-scoped class
+    yields the instance of the current request.
+    """
+
+    __slots__ = ("_cls", "_container")
+
+    def __init__(self, cls: type[T], container: Container):
+        object.__setattr__(self, "_cls", cls)
+        object.__setattr__(self, "_container", container)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._container.resolve(self._cls), name)
+
+    def __repr__(self) -> str:
+        return f"<Lazy {self._cls.__qualname__}>"
+
+
+@contextmanager
+def request_scope() -> Iterator[dict[type, Any]]:
+    """Share REQUEST-scoped instances inside the block"""
+    instances: dict[type, Any] = {}
+    token = _request.set(instances)
+    try:
+        yield instances
+    finally:
+        _request.reset(token)
@@ -0,0 +1,44 @@
+"""
+Database exceptions
+"""
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when an action executes more queries than its declared budget"""
+
+    def __init__(self, action: str, budget: int, count: int, queries: str = ""):
+        self.action = action
+        self.budget = budget
+        self.count = count
+        message = f"{action} executed {count} queries (budget: {budget})"
+        if queries:
+            message = f"{message}\n{queries}"
+        super().__init__(message)
+
+
+class StaleObjectError(Exception):
+    """Raised when a row changed (its version moved) since it was loaded"""
+
+    def __init__(self, label: str, pk: object, version: int):
+        self.label = label
+        self.pk = pk
+        self.version = version
+        super().__init__(f"{label} {pk} was modified since version {version}")
+
+
+class NPlusOneDetected(AssertionError):
+    """Raised in strict mode when a request repeats a lazy-load query shape"""
+
+    def __init__(self, path: str, reports: str):
+        self.path = path
+        super().__init__(f"N+1 queries detected in {path}\n{reports}")
+
+
+class StatementTimeout(Exception):
+    """Raised when a statement ran past the timeout of its action and was cancelled"""
+
+    def __init__(self, alias: str, timeout_ms: int, sql: str = ""):
+        self.alias = alias
+        self.timeout_ms = timeout_ms
+        self.sql = sql
+        super().__init__(f"Statement on {alias} cancelled after {timeout_ms} ms")
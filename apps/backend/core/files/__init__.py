@@ -0,0 +1,3 @@
+"""
+Media files - Content-addressed storage and cache-friendly serving
+"""
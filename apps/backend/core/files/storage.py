@@ -0,0 +1,94 @@
+"""
+Content-addressed storage - Files named after the SHA-256 of their bytes
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import posixpath
+import re
+import tempfile
+from typing import IO, Any, Optional
+
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+# <upload_to>/<2 hex>/<64 hex>.<ext>
+BLOB_NAME = re.compile(r"(?:^|/)([0-9a-f]{2})/(\1[0-9a-f]{62})(\.\w+)?$")
+
+
+def blob_hash(name: str) -> Optional[str]:
+    """SHA-256 of a content-addressed name, None for any other file"""
+    match = BLOB_NAME.search(name)
+    return match.group(2) if match else None
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    FileSystemStorage that stores each upload under its content hash
+
+    The upload is streamed chunk by chunk to a temporary file in the target
+    directory while being hashed, then renamed to
+    `<upload_to>/<hash[:2]>/<hash>.<ext>`. Uploading the same photo again
+    (for another dish, or another branch sharing MEDIA_ROOT) reuses the
+    existing blob, so names are immutable and safe to cache forever.
+
+    Blobs may be shared, so delete() is a no-op; unreferenced blobs are
+    removed by `manage.py gc_media`, which calls purge().
+    """
+
+    def get_available_name(self, name: str, max_length: Optional[int] = None) -> str:
+        # The final name comes from the content, never from collisions
+        return name
+
+    def _save(self, name: str, content: IO[Any]) -> str:
+        directory = posixpath.dirname(name)
+        extension = os.path.splitext(name)[1].lower()
+        full_directory = self.path(directory)
+        os.makedirs(full_directory, exist_ok=True)
+
+        digest = hashlib.sha256()
+        fd, temporary = tempfile.mkstemp(dir=full_directory, prefix=".upload-")
+        try:
+            with os.fdopen(fd, "wb") as output:
+                for chunk in content.chunks():  # type: ignore[attr-defined]
+                    digest.update(chunk)
+                    output.write(chunk)
+
+            hexdigest = digest.hexdigest()
+            final = posixpath.join(directory, hexdigest[:2], hexdigest + extension)
+            final_path = self.path(final)
+            if os.path.exists(final_path):
+                os.unlink(temporary)
+                # A fresh mtime keeps gc_media (--min-age) off a re-referenced blob
+                os.utime(final_path)
+            else:
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                if self.file_permissions_mode is not None:
+                    os.chmod(temporary, self.file_permissions_mode)
+                os.replace(temporary, final_path)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.unlink(temporary)
+            raise
+        return final
+
+    def delete(self, name: str) -> None:
+        """Blobs may be shared between rows; see purge()"""
+
+    def purge(self, name: str) -> None:
+        """Remove a blob from disk (garbage collection only)"""
+        super().delete(name)
+
+
+_storage: Optional[ContentAddressedStorage] = None
+
+
+def content_addressed_storage() -> ContentAddressedStorage:
+    """Shared instance, used as `storage=` callable of ImageFields"""
+    global _storage
+    if _storage is None:
+        _storage = ContentAddressedStorage()
+    return _storage
@@ -0,0 +1,13 @@
+"""
+Media URLs
+"""
+
+from django.urls import path
+
+from . import views
+
+app_name = "media"
+
+urlpatterns = [
+    path("<path:path>", views.media, name="file"),
+]
@@ -0,0 +1,47 @@
+"""
+Media views - Serve MEDIA_ROOT with immutable caching for content-addressed blobs
+"""
+
+from __future__ import annotations
+
+import os
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpRequest, HttpResponse
+from django.utils._os import safe_join
+from django.views.decorators.http import require_safe
+from django.views.static import serve
+
+from .storage import blob_hash
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+@require_safe
+def media(request: HttpRequest, path: str) -> HttpResponse:
+    """
+    Content-addressed blobs get a strong ETag (their hash) and a one-year
+    immutable Cache-Control; any other media file is delegated to
+    django.views.static.serve (Last-Modified revalidation)
+    """
+    digest = blob_hash(path)
+    if digest is None:
+        return serve(request, path, document_root=settings.MEDIA_ROOT)
+
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404("Archivo no encontrado")
+    if not os.path.isfile(full_path):
+        raise Http404("Archivo no encontrado")
+
+    etag = f'"{digest}"'
+    if etag in request.META.get("HTTP_IF_NONE_MATCH", ""):
+        response = HttpResponse(status=304)
+    else:
+        response = FileResponse(open(full_path, "rb"))
+        del response["Content-Disposition"]
+    response["ETag"] = etag
+    response["Cache-Control"] = IMMUTABLE
+    return response
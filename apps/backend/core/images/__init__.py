@@ -0,0 +1,7 @@
+"""
+Responsive image pipeline - Sized WebP/JPEG renditions and LQIP placeholders
+"""
+
+from .renditions import generate_renditions, rendition_dir
+
+__all__ = ["generate_renditions", "rendition_dir"]
@@ -0,0 +1,113 @@
+"""
+Image renditions - Resize an upload to several widths in WebP and JPEG
+
+Outputs live in deterministic paths next to nothing else:
+
+    dishes/paella.jpg -> renditions/dishes/paella/640w.webp
+                         renditions/dishes/paella/640w.jpg
+
+so regenerating an image overwrites its previous renditions and the
+backfill can skip files that already exist.
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+import posixpath
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage, default_storage
+from PIL import Image, ImageOps
+
+FORMATS = {"webp": ("WEBP", ".webp"), "jpeg": ("JPEG", ".jpg")}
+LQIP_WIDTH = 16
+
+
+def rendition_dir(name: str) -> str:
+    """renditions/<upload path without extension>"""
+    return posixpath.join("renditions", posixpath.splitext(name)[0])
+
+
+def _widths(original: int) -> list[int]:
+    """Configured widths not larger than the original (at least one)"""
+    widths = sorted(getattr(settings, "IMAGE_RENDITION_WIDTHS", [320, 640, 960, 1280]))
+    if not widths:
+        return [original]
+    fitting = [width for width in widths if width < original]
+    largest = min(original, widths[-1])
+    return fitting if largest in fitting else fitting + [largest]
+
+
+def _flatten(image: Image.Image) -> Image.Image:
+    """RGB copy, compositing transparency over white (JPEG has no alpha)"""
+    if image.mode in ("RGBA", "LA") or "transparency" in image.info:
+        rgba = image.convert("RGBA")
+        background = Image.new("RGB", rgba.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+
+def _encode(image: Image.Image, fmt: str, quality: int) -> bytes:
+    buffer = io.BytesIO()
+    options: dict[str, Any] = {"quality": quality}
+    if fmt == "JPEG":
+        options.update(optimize=True, progressive=True)
+    else:
+        options.update(method=4)
+    image.save(buffer, fmt, **options)
+    return buffer.getvalue()
+
+
+def lqip(image: Image.Image) -> str:
+    """Tiny blurred JPEG as a data URI, shown while the real image loads"""
+    height = max(1, round(image.height * LQIP_WIDTH / image.width))
+    tiny = image.resize((LQIP_WIDTH, height), Image.Resampling.BILINEAR)
+    data = _encode(tiny, "JPEG", 40)
+    return "data:image/jpeg;base64," + base64.b64encode(data).decode("ascii")
+
+
+def generate_renditions(
+    name: str,
+    storage: Optional[Storage] = None,
+    force: bool = False,
+) -> dict[str, Any]:
+    """
+    Write the renditions of an uploaded image and return their metadata
+
+    Returns:
+        {"source": name, "width": w, "height": h, "lqip": "data:...",
+         "sources": {"webp": [[320, "renditions/.../320w.webp"], ...],
+                     "jpeg": [...]}}
+    """
+    storage = storage or default_storage
+    quality = int(getattr(settings, "IMAGE_RENDITION_QUALITY", 80))
+    with storage.open(name, "rb") as f:
+        with Image.open(f) as source:
+            image = _flatten(ImageOps.exif_transpose(source))
+
+    directory = rendition_dir(name)
+    sources: dict[str, list[list[Any]]] = {key: [] for key in FORMATS}
+    for width in _widths(image.width):
+        resized = None
+        for key, (fmt, extension) in FORMATS.items():
+            path = posixpath.join(directory, f"{width}w{extension}")
+            if force or not storage.exists(path):
+                if resized is None:
+                    height = max(1, round(image.height * width / image.width))
+                    resized = image.resize((width, height), Image.Resampling.LANCZOS)
+                if storage.exists(path):
+                    storage.delete(path)
+                path = storage.save(path, ContentFile(_encode(resized, fmt, quality)))
+            sources[key].append([width, path])
+
+    return {
+        "source": name,
+        "width": image.width,
+        "height": image.height,
+        "lqip": lqip(image),
+        "sources": sources,
+    }
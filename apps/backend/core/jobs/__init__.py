@@ -0,0 +1,17 @@
+"""
+Background jobs - Database-backed queue consumed by `manage.py run_workers`
+
+Usage:
+    from core.jobs import job
+
+    @job(queue="default", priority=0, max_attempts=3)
+    def warm_menu_cache() -> None:
+        ...
+
+    warm_menu_cache.delay(dedup_key="warm-menu")
+"""
+
+from .queue import enqueue
+from .registry import JobFunction, UnknownJob, get_job, job
+
+__all__ = ["JobFunction", "UnknownJob", "enqueue", "get_job", "job"]
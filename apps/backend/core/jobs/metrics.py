@@ -0,0 +1,33 @@
+"""
+Job metrics - Outcome, duration and queue wait per job name
+"""
+
+from __future__ import annotations
+
+from core.metrics import Counter, Gauge, Histogram
+
+WAIT_BUCKETS = (0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0, 3600.0)
+
+JOBS_PROCESSED = Counter(
+    "savoro_jobs_processed_total",
+    "Background jobs run by outcome (done, retry, failed)",
+    ("job", "status"),
+)
+JOB_DURATION = Histogram(
+    "savoro_job_duration_seconds",
+    "Execution time of background jobs",
+    ("job",),
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+JOB_WAIT = Histogram(
+    "savoro_job_queue_wait_seconds",
+    "Delay between run_at and a worker starting the job",
+    ("job",),
+    buckets=WAIT_BUCKETS,
+)
+JOBS_PENDING = Gauge(
+    "savoro_jobs_pending",
+    "Queued jobs per queue, refreshed by the workers",
+    ("queue",),
+    multiprocess_mode="max",
+)
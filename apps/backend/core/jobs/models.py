@@ -0,0 +1,70 @@
+"""
+Job model - Rows of the database-backed job queue
+"""
+
+from __future__ import annotations
+
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """
+    One unit of background work
+
+    Workers claim QUEUED rows whose run_at has passed, highest priority
+    first. At most one QUEUED job may exist per dedup_key.
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", "En cola"
+        RUNNING = "running", "En ejecución"
+        DONE = "done", "Completado"
+        FAILED = "failed", "Fallido"
+
+    name = models.CharField(max_length=255, verbose_name="Tarea")
+    args = models.JSONField(default=list, blank=True, verbose_name="Argumentos")
+    kwargs = models.JSONField(default=dict, blank=True, verbose_name="Opciones")
+    queue = models.CharField(max_length=64, default="default", verbose_name="Cola")
+    priority = models.SmallIntegerField(default=0, verbose_name="Prioridad")
+    status = models.CharField(
+        max_length=16,
+        choices=Status.choices,
+        default=Status.QUEUED,
+        verbose_name="Estado",
+    )
+    dedup_key = models.CharField(
+        max_length=255, null=True, blank=True, verbose_name="Clave de deduplicación"
+    )
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name="Intentos")
+    max_attempts = models.PositiveSmallIntegerField(
+        default=3, verbose_name="Intentos máximos"
+    )
+    run_at = models.DateTimeField(default=timezone.now, verbose_name="Ejecutar desde")
+    locked_by = models.CharField(max_length=255, blank=True, verbose_name="Worker")
+    locked_at = models.DateTimeField(null=True, blank=True, verbose_name="Tomado en")
+    last_error = models.TextField(blank=True, verbose_name="Último error")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Creado")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="Terminado")
+
+    class Meta:
+        app_label = "core"
+        db_table = "savoro_job"
+        verbose_name = "Tarea en segundo plano"
+        verbose_name_plural = "Tareas en segundo plano"
+        indexes = [
+            models.Index(
+                fields=["queue", "status", "-priority", "run_at"],
+                name="savoro_job_claim_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dedup_key"],
+                condition=models.Q(status="queued"),
+                name="savoro_job_dedup_queued",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.name} #{self.pk} ({self.status})"
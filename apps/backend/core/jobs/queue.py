@@ -0,0 +1,222 @@
+"""
+Job queue - Enqueue, claim and complete rows of savoro_job
+
+Claiming uses SELECT ... FOR UPDATE SKIP LOCKED where the backend supports
+it (PostgreSQL). SQLite has no row locks but serializes writers, so a
+compare-and-set UPDATE on the status gives the same guarantee: only one
+worker moves a given row from QUEUED to RUNNING.
+"""
+
+from __future__ import annotations
+
+import logging
+import traceback
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Optional, Sequence
+
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F, QuerySet
+from django.utils import timezone
+
+from .models import Job
+from .registry import get_job
+
+logger = logging.getLogger(__name__)
+
+CLAIM_ORDER = ("-priority", "run_at", "id")
+
+
+def enqueue(
+    name: str,
+    args: Sequence[Any] = (),
+    kwargs: Optional[dict[str, Any]] = None,
+    *,
+    queue: str = "default",
+    priority: int = 0,
+    max_attempts: int = 3,
+    dedup_key: Optional[str] = None,
+    run_at: Optional[datetime] = None,
+) -> Optional[Job]:
+    """
+    Store a job in the current transaction (it is enqueued only if it commits)
+
+    With a dedup_key, an already queued job with the same key is returned
+    instead of creating another one. With settings.JOBS_EAGER the job runs
+    inline after commit and None is returned.
+    """
+    kwargs = kwargs or {}
+    if getattr(settings, "JOBS_EAGER", False):
+        transaction.on_commit(lambda: get_job(name).run(list(args), kwargs))
+        return None
+
+    fields = {
+        "name": name,
+        "args": list(args),
+        "kwargs": kwargs,
+        "queue": queue,
+        "priority": priority,
+        "max_attempts": max_attempts,
+        "dedup_key": dedup_key,
+        "run_at": run_at or timezone.now(),
+    }
+    if dedup_key is None:
+        return Job.objects.create(**fields)
+
+    queued = Job.objects.filter(dedup_key=dedup_key, status=Job.Status.QUEUED)
+    existing = queued.first()
+    if existing is not None:
+        return existing
+    try:
+        with transaction.atomic():
+            return Job.objects.create(**fields)
+    except IntegrityError:
+        # Another request enqueued the same key concurrently
+        return queued.first()
+
+
+def claim(worker: str, queues: Iterable[str]) -> Optional[Job]:
+    """Move the next runnable job to RUNNING for this worker"""
+    now = timezone.now()
+    candidates = Job.objects.filter(
+        status=Job.Status.QUEUED, queue__in=list(queues), run_at__lte=now
+    ).order_by(*CLAIM_ORDER)
+    running = {
+        "status": Job.Status.RUNNING,
+        "locked_by": worker,
+        "locked_at": now,
+        "attempts": F("attempts") + 1,
+    }
+
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            job = candidates.select_for_update(skip_locked=True).first()
+            if job is None:
+                return None
+            Job.objects.filter(pk=job.pk).update(**running)
+    else:
+        for pk in candidates.values_list("pk", flat=True)[:10]:
+            if Job.objects.filter(pk=pk, status=Job.Status.QUEUED).update(**running):
+                break
+        else:
+            return None
+        job = Job(pk=pk)
+    job.refresh_from_db()
+    return job
+
+
+def _owned(job: Job) -> QuerySet[Job]:
+    """The row of this attempt, unless it was requeued and claimed meanwhile"""
+    return Job.objects.filter(
+        pk=job.pk,
+        status=Job.Status.RUNNING,
+        locked_by=job.locked_by,
+        attempts=job.attempts,
+    )
+
+
+def heartbeat(workers: Iterable[str]) -> int:
+    """Refresh locked_at of the jobs these workers are running"""
+    return Job.objects.filter(
+        status=Job.Status.RUNNING, locked_by__in=list(workers)
+    ).update(locked_at=timezone.now())
+
+
+def complete(job: Job) -> bool:
+    """Mark the attempt done; False if another worker owns the row now"""
+    return bool(
+        _owned(job).update(
+            status=Job.Status.DONE,
+            finished_at=timezone.now(),
+            locked_by="",
+            last_error="",
+        )
+    )
+
+
+def _requeue(running: QuerySet[Job], **fields: Any) -> bool:
+    """
+    Move a RUNNING job back to QUEUED; False if it was not requeued
+
+    A newer job queued with the same dedup_key (e.g. renditions scheduled
+    again while this one ran) holds the savoro_job_dedup_queued slot: this
+    one is then marked failed as superseded, the queued one does the work.
+    """
+    try:
+        with transaction.atomic():
+            return bool(running.update(status=Job.Status.QUEUED, **fields))
+    except IntegrityError:
+        running.update(
+            status=Job.Status.FAILED,
+            finished_at=timezone.now(),
+            locked_by="",
+            last_error="Reemplazada por una tarea más reciente con la misma clave",
+        )
+        return False
+
+
+def fail(job: Job, error: str, retry_delay: Optional[float]) -> str:
+    """Schedule a retry (retry_delay seconds) or mark failed; returns the outcome"""
+    now = timezone.now()
+    if retry_delay is not None and job.attempts < job.max_attempts:
+        if _requeue(
+            _owned(job),
+            run_at=now + timedelta(seconds=retry_delay),
+            locked_by="",
+            last_error=error,
+        ):
+            return "retry"
+        return "failed"
+    _owned(job).update(
+        status=Job.Status.FAILED, finished_at=now, locked_by="", last_error=error
+    )
+    return "failed"
+
+
+def execute(job: Job) -> str:
+    """Run a claimed job; returns "done", "retry" or "failed" """
+    try:
+        definition = get_job(job.name)
+    except LookupError:
+        return fail(job, f"Tarea no registrada: {job.name}", None)
+    try:
+        definition.run(job.args, job.kwargs)
+    except Exception:
+        logger.exception("Fallo en la tarea %s #%s", job.name, job.pk)
+        return fail(job, traceback.format_exc(), definition.retry_delay(job.attempts))
+    if not complete(job):
+        logger.warning(
+            "La tarea %s #%s terminó, pero otro worker la había retomado",
+            job.name,
+            job.pk,
+        )
+    return "done"
+
+
+def requeue_stale(timeout: float) -> int:
+    """
+    Return RUNNING jobs of workers silent for `timeout` seconds to the queue
+    Live workers refresh locked_at with heartbeat(), so long jobs stay put
+    """
+    cutoff = timezone.now() - timedelta(seconds=timeout)
+    stale = Job.objects.filter(status=Job.Status.RUNNING, locked_at__lt=cutoff)
+    message = "Worker sin respuesta; tarea devuelta a la cola"
+    stale.filter(attempts__gte=F("max_attempts")).update(
+        status=Job.Status.FAILED, finished_at=timezone.now(), last_error=message
+    )
+    requeued = stale.filter(dedup_key__isnull=True).update(
+        status=Job.Status.QUEUED, locked_by="", last_error=message
+    )
+    # One by one: a queued job may already hold the same dedup_key
+    for pk in stale.filter(dedup_key__isnull=False).values_list("pk", flat=True):
+        requeued += _requeue(stale.filter(pk=pk), locked_by="", last_error=message)
+    return requeued
+
+
+def prune_finished(hours: float) -> int:
+    """Delete DONE jobs older than `hours` (failed ones are kept for review)"""
+    cutoff = timezone.now() - timedelta(hours=hours)
+    deleted, _ = Job.objects.filter(
+        status=Job.Status.DONE, finished_at__lt=cutoff
+    ).delete()
+    return deleted
@@ -0,0 +1,148 @@
+"""
+Job registry - @job decorator and name resolution
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import random
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+_registry: dict[str, "JobFunction"] = {}
+
+
+class UnknownJob(LookupError):
+    """No @job is registered under the stored name"""
+
+
+class JobFunction:
+    """
+    Function (or service method) that can also be enqueued
+
+    Calling it runs the work inline; .delay(...) stores it in the queue.
+    Methods run on the instance core.di resolves for their class, so they
+    must belong to injectable services (the @Injectable() ones).
+    """
+
+    def __init__(
+        self,
+        function: Callable[..., Any],
+        queue: str,
+        priority: int,
+        max_attempts: int,
+        backoff: float,
+    ):
+        functools.update_wrapper(self, function)
+        self.function = function
+        self.name = f"{function.__module__}:{function.__qualname__}"
+        self.queue = queue
+        self.priority = priority
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.owner: Optional[type] = None
+        _registry[self.name] = self
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.owner = owner
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        return _BoundJob(self, instance)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.function(*args, **kwargs)
+
+    def delay(
+        self,
+        *args: Any,
+        dedup_key: Optional[str] = None,
+        priority: Optional[int] = None,
+        run_at: Optional[datetime] = None,
+        queue: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Enqueue with JSON-serializable arguments; returns the Job (None if eager)"""
+        from .queue import enqueue
+
+        return enqueue(
+            self.name,
+            args,
+            kwargs,
+            queue=queue or self.queue,
+            priority=self.priority if priority is None else priority,
+            max_attempts=self.max_attempts,
+            dedup_key=dedup_key,
+            run_at=run_at,
+        )
+
+    def run(self, args: list[Any], kwargs: dict[str, Any]) -> Any:
+        """Execute as a worker does"""
+        if self.owner is not None:
+            from core.di import resolve
+
+            return self.function(resolve(self.owner), *args, **kwargs)
+        return self.function(*args, **kwargs)
+
+    def retry_delay(self, attempt: int) -> float:
+        """Exponential backoff with ±20% jitter, capped at one hour"""
+        return min(self.backoff * 2 ** (attempt - 1), 3600.0) * random.uniform(0.8, 1.2)
+
+
+class _BoundJob:
+    """JobFunction accessed through a service instance"""
+
+    def __init__(self, job: JobFunction, instance: Any):
+        self.job = job
+        self.instance = instance
+        self.delay = job.delay
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.job.function(self.instance, *args, **kwargs)
+
+
+def job(
+    queue: str = "default",
+    priority: int = 0,
+    max_attempts: int = 3,
+    backoff: float = 10.0,
+) -> Callable[[Callable[..., Any]], JobFunction]:
+    """
+    Register a function or service method as a background job
+
+    Usage:
+        @Injectable()
+        class DishService(BaseService):
+            @job(queue="images", max_attempts=5)
+            def generate_image_renditions(self, dish_id: int, name: str) -> bool:
+                ...
+
+        service.generate_image_renditions.delay(dish.pk, dish.image.name)
+
+    Args:
+        queue: Queue consumed by `run_workers --queues`
+        priority: Higher runs first
+        max_attempts: Runs before the job is marked failed
+        backoff: Seconds before the first retry (doubles on each attempt)
+    """
+
+    def decorator(function: Callable[..., Any]) -> JobFunction:
+        return JobFunction(function, queue, priority, max_attempts, backoff)
+
+    return decorator
+
+
+def get_job(name: str) -> JobFunction:
+    """Resolve a stored job name, importing its module if needed"""
+    if name not in _registry:
+        module = name.split(":", 1)[0]
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            raise UnknownJob(name) from e
+    try:
+        return _registry[name]
+    except KeyError:
+        raise UnknownJob(name) from None
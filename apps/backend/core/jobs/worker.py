@@ -0,0 +1,139 @@
+"""
+Job worker - Threads polling the queue in one process
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import time
+
+from core.db.connections import close_pools
+from core.metrics import REGISTRY, get_store
+from django.conf import settings
+from django.db import close_old_connections, connections
+from django.db.models import Count
+
+from .metrics import JOB_DURATION, JOB_WAIT, JOBS_PENDING, JOBS_PROCESSED
+from .models import Job
+from .queue import claim, execute, heartbeat, prune_finished, requeue_stale
+
+logger = logging.getLogger(__name__)
+
+
+class Worker:
+    """
+    Run jobs of `queues` in `threads` threads until stop() is called
+
+    The calling thread refreshes locked_at of the running jobs (at least
+    four times per JOBS_LOCK_TIMEOUT) and does housekeeping every
+    `maintenance_interval` seconds: requeue jobs of dead workers, prune
+    finished rows, refresh the pending gauge and flush metrics to
+    METRICS_MULTIPROC_DIR.
+    """
+
+    def __init__(
+        self,
+        queues: list[str],
+        threads: int = 2,
+        poll_interval: float = 1.0,
+        burst: bool = False,
+        maintenance_interval: float = 30.0,
+    ):
+        self.queues = queues
+        self.threads = threads
+        self.poll_interval = poll_interval
+        self.burst = burst
+        self.maintenance_interval = maintenance_interval
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    @property
+    def workers(self) -> list[str]:
+        """locked_by values of the worker threads"""
+        return [f"{self.name}:{index}" for index in range(self.threads)]
+
+    def run(self) -> None:
+        threads = [
+            threading.Thread(target=self._loop, args=(worker,), name=f"job-{index}")
+            for index, worker in enumerate(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        lock_timeout = float(getattr(settings, "JOBS_LOCK_TIMEOUT", 600))
+        tick = min(self.maintenance_interval, lock_timeout / 4)
+        next_maintenance = 0.0
+        while any(thread.is_alive() for thread in threads):
+            self.heartbeat()
+            if time.monotonic() >= next_maintenance:
+                self.maintenance()
+                next_maintenance = time.monotonic() + self.maintenance_interval
+            self._stop.wait(tick)
+        self.maintenance()
+        connections.close_all()
+        close_pools()
+
+    def _loop(self, worker: str) -> None:
+        try:
+            while not self._stop.is_set():
+                close_old_connections()
+                try:
+                    job = claim(worker, self.queues)
+                    if job is None:
+                        if self.burst:
+                            return
+                        self._stop.wait(self.poll_interval)
+                        continue
+                    self.process(job)
+                except Exception:
+                    # A database error must not end the thread: stale jobs
+                    # are requeued by maintenance()
+                    logger.exception("Fallo en el worker %s", worker)
+                    connections.close_all()
+                    self._stop.wait(self.poll_interval)
+        finally:
+            connections.close_all()
+
+    def process(self, job: Job) -> str:
+        if job.locked_at is not None:
+            JOB_WAIT.observe(
+                max((job.locked_at - job.run_at).total_seconds(), 0.0), job=job.name
+            )
+        started = time.perf_counter()
+        outcome = execute(job)
+        JOB_DURATION.observe(time.perf_counter() - started, job=job.name)
+        JOBS_PROCESSED.inc(job=job.name, status=outcome)
+        return outcome
+
+    def heartbeat(self) -> None:
+        try:
+            heartbeat(self.workers)
+        except Exception:
+            logger.exception("Fallo al renovar el bloqueo de las tareas en curso")
+        finally:
+            close_old_connections()
+
+    def maintenance(self) -> None:
+        try:
+            requeue_stale(float(getattr(settings, "JOBS_LOCK_TIMEOUT", 600)))
+            prune_finished(float(getattr(settings, "JOBS_RETENTION_HOURS", 24)))
+            pending = dict.fromkeys(self.queues, 0)
+            pending.update(
+                Job.objects.filter(status=Job.Status.QUEUED, queue__in=self.queues)
+                .values_list("queue")
+                .annotate(total=Count("id"))
+            )
+            for queue, total in pending.items():
+                JOBS_PENDING.set(total, queue=queue)
+        except Exception:
+            logger.exception("Fallo en el mantenimiento de la cola de tareas")
+        finally:
+            close_old_connections()
+        store = get_store()
+        if store is not None:
+            store.flush(REGISTRY)
@@ -0,0 +1,79 @@
+"""
+Backfill renditions command - Generate responsive images for existing dishes
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connections
+
+from core.di import resolve
+from modules.dish.service import DishService
+
+
+class Command(BaseCommand):
+    help = "Generar variantes WebP/JPEG y LQIP de las imágenes de platos existentes"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Hilos de procesamiento en paralelo (por defecto 4)",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Procesar todos los platos con imagen, no solo los pendientes",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerar archivos aunque ya existan",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        service = resolve(DishService)
+        if options["all"]:
+            dishes = service.find_all().exclude(image="").exclude(image__isnull=True)
+        else:
+            dishes = service.find_missing_renditions()
+        pending = list(dishes.values_list("id", "image"))
+        if not pending:
+            self.stdout.write("No hay imágenes pendientes")
+            return
+
+        self.stdout.write(
+            f"Procesando {len(pending)} imágenes con {options['workers']} hilos..."
+        )
+
+        def process(dish_id: int, image_name: str) -> bool:
+            try:
+                return service.generate_image_renditions(
+                    dish_id, image_name, force=options["force"]
+                )
+            finally:
+                connections.close_all()
+
+        failed = 0
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            futures = {
+                executor.submit(process, dish_id, image_name): image_name
+                for dish_id, image_name in pending
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    self.stdout.write(f"  ✓ {futures[future]}")
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f"  ✗ {futures[future]}: {e}")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(pending) - failed} imágenes procesadas")
+        )
+        if failed:
+            self.stdout.write(self.style.WARNING(f"{failed} con errores"))
@@ -0,0 +1,218 @@
+"""
+SQLite benchmark command - Default settings against the single-node profile
+"""
+
+from __future__ import annotations
+
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+from core.db.sqlite import apply_pragmas
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+SCHEMA = """
+CREATE TABLE dish (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    price REAL NOT NULL,
+    category_id INTEGER NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX dish_category ON dish (category_id, name);
+"""
+CATEGORIES = 20
+
+
+@dataclass(frozen=True)
+class Profile:
+    name: str
+    pragmas: Mapping[str, Any]
+    # None: Django's plain (deferred) BEGIN
+    transaction_mode: Optional[str]
+
+
+@dataclass
+class Result:
+    reads: int = 0
+    writes: int = 0
+    # "database is locked" errors (the transaction is rolled back)
+    locked: int = 0
+    write_latencies: list[float] = field(default_factory=list)
+
+    def merge(self, other: "Result") -> None:
+        self.reads += other.reads
+        self.writes += other.writes
+        self.locked += other.locked
+        self.write_latencies.extend(other.write_latencies)
+
+    def p95_ms(self) -> float:
+        if not self.write_latencies:
+            return 0.0
+        ordered = sorted(self.write_latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000
+
+
+def _connect(path: Path, profile: Profile) -> sqlite3.Connection:
+    # Same connection mode as Django: autocommit, transactions begun explicitly
+    connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+    apply_pragmas(connection, profile.pragmas)
+    return connection
+
+
+def _prepare(path: Path, profile: Profile, rows: int) -> None:
+    connection = _connect(path, profile)
+    connection.executescript(SCHEMA)
+    connection.execute("BEGIN")
+    connection.executemany(
+        "INSERT INTO dish (name, description, price, category_id) VALUES (?, ?, ?, ?)",
+        (
+            (f"Plato {i}", "Descripción " * 20, 5 + i % 40, i % CATEGORIES)
+            for i in range(rows)
+        ),
+    )
+    connection.execute("COMMIT")
+    connection.close()
+
+
+def _work(
+    path: Path,
+    profile: Profile,
+    rows: int,
+    write_ratio: float,
+    deadline: float,
+    result: Result,
+) -> None:
+    connection = _connect(path, profile)
+    begin = f"BEGIN {profile.transaction_mode or ''}".strip()
+    rng = random.Random()
+    while time.perf_counter() < deadline:
+        if rng.random() >= write_ratio:
+            # Menu page: one category, ordered by name
+            connection.execute(
+                "SELECT id, name, price FROM dish WHERE category_id = ? "
+                "ORDER BY name LIMIT 20",
+                (rng.randrange(CATEGORIES),),
+            ).fetchall()
+            result.reads += 1
+            continue
+        # Read-modify-write, as BaseRepository.update does with its version check
+        dish_id = rng.randrange(1, rows + 1)
+        started = time.perf_counter()
+        try:
+            connection.execute(begin)
+            version = connection.execute(
+                "SELECT version FROM dish WHERE id = ?", (dish_id,)
+            ).fetchone()[0]
+            connection.execute(
+                "UPDATE dish SET price = price + 1, version = ? "
+                "WHERE id = ? AND version = ?",
+                (version + 1, dish_id, version),
+            )
+            connection.execute("COMMIT")
+        except sqlite3.OperationalError:
+            result.locked += 1
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            continue
+        result.write_latencies.append(time.perf_counter() - started)
+        result.writes += 1
+    connection.close()
+
+
+def run_profile(
+    profile: Profile, threads: int, seconds: float, rows: int, write_ratio: float
+) -> Result:
+    with tempfile.TemporaryDirectory(prefix="savoro-bench-") as directory:
+        path = Path(directory) / "bench.sqlite3"
+        _prepare(path, profile, rows)
+        deadline = time.perf_counter() + seconds
+        results = [Result() for _ in range(threads)]
+        workers = [
+            threading.Thread(
+                target=_work,
+                args=(path, profile, rows, write_ratio, deadline, results[index]),
+            )
+            for index in range(threads)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    total = Result()
+    for result in results:
+        total.merge(result)
+    return total
+
+
+class Command(BaseCommand):
+    help = (
+        "Comparar el rendimiento de SQLite con la configuración por defecto "
+        "y con el perfil de un solo nodo (WAL, PRAGMAs y BEGIN IMMEDIATE)"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--threads", type=int, default=8, help="Conexiones concurrentes"
+        )
+        parser.add_argument(
+            "--seconds", type=float, default=5.0, help="Duración de cada perfil"
+        )
+        parser.add_argument(
+            "--rows", type=int, default=5000, help="Filas de la tabla de prueba"
+        )
+        parser.add_argument(
+            "--write-ratio",
+            type=float,
+            default=0.2,
+            help="Fracción de operaciones que escriben (0 a 1)",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        profiles = [
+            Profile("por defecto", {}, None),
+            Profile(
+                "un solo nodo",
+                getattr(settings, "SQLITE_PRAGMAS", None)
+                or getattr(settings, "SQLITE_SINGLE_NODE_PRAGMAS", {}),
+                "IMMEDIATE",
+            ),
+        ]
+        self.stdout.write(
+            f"{options['threads']} hilo(s), {options['seconds']:g} s por perfil, "
+            f"{options['rows']} filas, {options['write_ratio']:.0%} escrituras"
+        )
+        self.stdout.write(
+            f"{'Perfil':<14} {'ops/s':>10} {'lecturas/s':>11} {'escrituras/s':>13} "
+            f"{'bloqueos':>9} {'p95 escr. ms':>13}"
+        )
+        throughput: list[float] = []
+        for profile in profiles:
+            result = run_profile(
+                profile,
+                options["threads"],
+                options["seconds"],
+                options["rows"],
+                options["write_ratio"],
+            )
+            seconds = options["seconds"]
+            ops = (result.reads + result.writes) / seconds
+            throughput.append(ops)
+            self.stdout.write(
+                f"{profile.name:<14} {ops:>10.0f} {result.reads / seconds:>11.0f} "
+                f"{result.writes / seconds:>13.0f} {result.locked:>9} "
+                f"{result.p95_ms():>13.1f}"
+            )
+        if throughput[0]:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Un solo nodo: {throughput[1] / throughput[0]:.2f}x operaciones/s"
+                )
+            )
@@ -0,0 +1,134 @@
+"""
+Media garbage collection command - Remove unreferenced content-addressed blobs
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Any, Iterator
+
+from django.apps import apps
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import models
+
+from core.files.storage import ContentAddressedStorage, blob_hash
+from core.images import rendition_dir
+
+
+def _file_fields() -> list[tuple[type[models.Model], models.FileField]]:
+    """FileFields of every model stored in a ContentAddressedStorage"""
+    return [
+        (model, field)
+        for model in apps.get_models()
+        for field in model._meta.get_fields()
+        if isinstance(field, models.FileField)
+        and isinstance(field.storage, ContentAddressedStorage)
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Eliminar archivos de media con hash de contenido que ninguna fila referencia"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Archivos verificados contra la base de datos por consulta",
+        )
+        parser.add_argument(
+            "--min-age",
+            type=float,
+            default=24.0,
+            help="Horas mínimas desde la subida (protege subidas sin commit)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Solo listar lo que se eliminaría",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        fields = _file_fields()
+        if not fields:
+            self.stdout.write("Ningún campo usa ContentAddressedStorage")
+            return
+
+        cutoff = time.time() - options["min_age"] * 3600
+        scanned = removed = freed = 0
+        # Fields sharing a storage and upload directory are checked together
+        by_location: dict[tuple[str, str], list[tuple[Any, Any]]] = {}
+        for model, field in fields:
+            upload_to = field.upload_to if isinstance(field.upload_to, str) else ""
+            key = (field.storage.location, upload_to.strip("/"))
+            by_location.setdefault(key, []).append((model, field))
+
+        for (_, directory), location_fields in by_location.items():
+            storage = location_fields[0][1].storage
+            for batch in self._batches(storage, directory, cutoff, options):
+                scanned += len(batch)
+                referenced: set[str] = set()
+                for model, field in location_fields:
+                    referenced.update(
+                        model._base_manager.filter(
+                            **{f"{field.name}__in": batch}
+                        ).values_list(field.name, flat=True)
+                    )
+                for name in batch:
+                    if name in referenced:
+                        continue
+                    # Reused by an upload since the batch was listed
+                    if os.path.getmtime(storage.path(name)) > cutoff:
+                        continue
+                    size = storage.size(name)
+                    self.stdout.write(f"  - {name} ({size} bytes)")
+                    if not options["dry_run"]:
+                        storage.purge(name)
+                        self._purge_renditions(name)
+                    removed += 1
+                    freed += size
+
+        verb = "se eliminarían" if options["dry_run"] else "eliminados"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{scanned} archivos revisados, {removed} {verb} "
+                f"({freed / 1024 / 1024:.1f} MB)"
+            )
+        )
+
+    def _batches(
+        self,
+        storage: ContentAddressedStorage,
+        directory: str,
+        cutoff: float,
+        options: dict[str, Any],
+    ) -> Iterator[list[str]]:
+        """Blob names older than cutoff, in lists of --batch-size"""
+        root = storage.path(directory)
+        batch: list[str] = []
+        for current, _, files in os.walk(root):
+            for filename in files:
+                full_path = os.path.join(current, filename)
+                name = os.path.relpath(full_path, storage.location).replace(os.sep, "/")
+                if blob_hash(name) is None or os.path.getmtime(full_path) > cutoff:
+                    continue
+                batch.append(name)
+                if len(batch) >= options["batch_size"]:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    def _purge_renditions(self, name: str) -> None:
+        """Remove the core.images renditions generated from a blob"""
+        directory = rendition_dir(name)
+        if not default_storage.exists(directory):
+            return
+        _, files = default_storage.listdir(directory)
+        for filename in files:
+            default_storage.delete(f"{directory}/{filename}")
+        os.rmdir(default_storage.path(directory))
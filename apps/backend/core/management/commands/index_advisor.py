@@ -0,0 +1,267 @@
+"""
+Index advisor command - Propose indexes from the slow query log
+"""
+
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connections, migrations, models
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.writer import MigrationWriter
+
+from core.db.slow_query import SlowQueryLog, SlowQueryRecord
+
+DEFAULT_TABLES = ("savoro_dish", "savoro_category", "savoro_dish_tags")
+
+_SEQ_SCAN = {
+    "postgresql": re.compile(r"Seq Scan on (\w+)"),
+    "sqlite": re.compile(r"^SCAN (\w+)$"),
+}
+_CLAUSE_END = re.compile(r"\s(?:GROUP BY|ORDER BY|LIMIT|OFFSET|HAVING)\s", re.I)
+
+
+@dataclass
+class ShapeStats:
+    """Slow log records aggregated by fingerprint"""
+
+    fingerprint: str
+    shape: str
+    sample: str
+    vendor: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    seq_scans: set[str] = field(default_factory=set)
+    repositories: set[str] = field(default_factory=set)
+
+    def add(self, record: SlowQueryRecord) -> None:
+        self.count += 1
+        self.total_ms += record.duration_ms
+        self.max_ms = max(self.max_ms, record.duration_ms)
+        if record.repository:
+            self.repositories.add(record.repository)
+        pattern = _SEQ_SCAN.get(record.vendor)
+        for line in record.plan if pattern else []:
+            match = pattern.search(line.strip())  # type: ignore[union-attr]
+            if match:
+                self.seq_scans.add(match.group(1))
+
+
+@dataclass
+class Proposal:
+    """Index suggested for one table"""
+
+    table: str
+    columns: list[str]
+    shapes: list[ShapeStats]
+    pattern_match: bool = False
+    existing: Optional[str] = None
+
+
+def _columns(sql: str, table: str) -> tuple[list[str], list[str], list[str], bool]:
+    """Equality, range and ORDER BY columns of table referenced in sql"""
+    column = rf'"{table}"\."(\w+)"(?:::\w+)?\)?'
+    where = sql.split(" WHERE ", 1)[1] if " WHERE " in sql else ""
+    where = _CLAUSE_END.split(where, 1)[0]
+    equality = re.findall(column + r"\s*(?:=|IN\s*\(|IS\s)", where, re.I)
+    ranges = re.findall(column + r"\s*(?:<|>|BETWEEN\s)", where, re.I)
+    likes = re.findall(column + r"\s*LIKE\s", where, re.I)
+    joins = re.findall(r"\bON\s*\([^)]*?" + column, sql, re.I)
+    order = sql.split(" ORDER BY ", 1)[1] if " ORDER BY " in sql else ""
+    ordering = re.findall(column, order)
+    equality = list(dict.fromkeys([*equality, *joins]))
+    return equality, list(dict.fromkeys(ranges)), ordering, bool(likes)
+
+
+def _model_for_table(table: str) -> Optional[type[models.Model]]:
+    for model in apps.get_models(include_auto_created=True):
+        if model._meta.db_table == table:
+            return model
+    return None
+
+
+def _existing_index(table: str, columns: list[str]) -> Optional[str]:
+    """Name of an index whose leading columns already match columns"""
+    connection = connections["default"]
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, table)
+    for name, info in constraints.items():
+        indexed = info.get("columns") or []
+        if (info.get("index") or info.get("unique")) and indexed[: len(columns)] == (
+            columns
+        ):
+            return name
+    return None
+
+
+class Command(BaseCommand):
+    help = (
+        "Agrupar el log de consultas lentas por fingerprint, detectar scans "
+        "secuenciales y proponer migraciones de índices"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--log",
+            default=str(settings.SLOW_QUERY_LOG_PATH),
+            help="Archivo JSON Lines del log de consultas lentas",
+        )
+        parser.add_argument(
+            "--tables",
+            nargs="+",
+            default=list(DEFAULT_TABLES),
+            help="Tablas a analizar",
+        )
+        parser.add_argument(
+            "--min-count",
+            type=int,
+            default=1,
+            help="Ocurrencias mínimas de un fingerprint para proponer un índice",
+        )
+        parser.add_argument(
+            "--write",
+            action="store_true",
+            help="Escribir los archivos de migración propuestos",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        log = SlowQueryLog(options["log"])
+        stats: dict[str, ShapeStats] = {}
+        for record in log.read():
+            if record.fingerprint not in stats:
+                stats[record.fingerprint] = ShapeStats(
+                    fingerprint=record.fingerprint,
+                    shape=record.shape,
+                    sample=record.sql,
+                    vendor=record.vendor,
+                )
+            stats[record.fingerprint].add(record)
+
+        if not stats:
+            self.stdout.write(f"Sin consultas lentas en {log.path}")
+            return
+
+        self.stdout.write(
+            self.style.MIGRATE_HEADING("Consultas lentas por fingerprint:")
+        )
+        ranked = sorted(stats.values(), key=lambda s: s.total_ms, reverse=True)
+        for shape in ranked:
+            scans = ", ".join(sorted(shape.seq_scans)) or "-"
+            self.stdout.write(
+                f"  [{shape.fingerprint}] {shape.count}x "
+                f"total {shape.total_ms:.1f}ms max {shape.max_ms:.1f}ms "
+                f"seq scan: {scans}"
+            )
+            self.stdout.write(f"    {shape.shape[:160]}")
+            if shape.repositories:
+                self.stdout.write(f"    desde: {', '.join(sorted(shape.repositories))}")
+
+        proposals = self._proposals(ranked, options["tables"], options["min_count"])
+        if not proposals:
+            self.stdout.write(
+                self.style.SUCCESS("\nSin scans secuenciales en las tablas analizadas.")
+            )
+            return
+        self._report(proposals, options["write"])
+
+    def _proposals(
+        self, ranked: list[ShapeStats], tables: list[str], min_count: int
+    ) -> list[Proposal]:
+        proposals: dict[tuple[str, tuple[str, ...]], Proposal] = {}
+        for shape in ranked:
+            if shape.count < min_count:
+                continue
+            for table in sorted(shape.seq_scans & set(tables)):
+                equality, ranges, ordering, like = _columns(shape.sample, table)
+                columns = list(dict.fromkeys([*equality, *ranges, *ordering]))
+                if not columns and not like:
+                    continue
+                key = (table, tuple(columns))
+                if key not in proposals:
+                    proposals[key] = Proposal(
+                        table=table,
+                        columns=columns,
+                        shapes=[],
+                        pattern_match=like and not columns,
+                        existing=_existing_index(table, columns) if columns else None,
+                    )
+                proposals[key].shapes.append(shape)
+        return list(proposals.values())
+
+    def _report(self, proposals: list[Proposal], write: bool) -> None:
+        operations: dict[str, list[Any]] = defaultdict(list)
+        self.stdout.write(self.style.MIGRATE_HEADING("\nÍndices propuestos:"))
+        for proposal in proposals:
+            fingerprints = ", ".join(s.fingerprint for s in proposal.shapes)
+            if proposal.pattern_match:
+                self.stdout.write(
+                    f"  {proposal.table}: búsqueda LIKE '%...%' ({fingerprints}); "
+                    "un índice B-tree no aplica, usar un índice GIN con "
+                    "gin_trgm_ops (pg_trgm) en PostgreSQL"
+                )
+                continue
+            if proposal.existing:
+                self.stdout.write(
+                    f"  {proposal.table}({', '.join(proposal.columns)}): ya cubierto "
+                    f"por {proposal.existing}; el planner eligió un scan "
+                    f"(tabla pequeña o baja selectividad) ({fingerprints})"
+                )
+                continue
+            model = _model_for_table(proposal.table)
+            if model is None:
+                self.stdout.write(f"  {proposal.table}: modelo no encontrado")
+                continue
+            operation = self._operation(model, proposal.columns)
+            self.stdout.write(
+                f"  {proposal.table}({', '.join(proposal.columns)}) ({fingerprints})"
+            )
+            operations[model._meta.app_label].append(operation)
+            if isinstance(operation, migrations.AddIndex):
+                index = operation.index
+                self.stdout.write(
+                    f"    Meta.indexes de {model.__name__}: models.Index("
+                    f"fields={index.fields!r}, name={index.name!r})"
+                )
+
+        loader = MigrationLoader(None, ignore_no_migrations=True)
+        for app_label, app_operations in operations.items():
+            leaves = loader.graph.leaf_nodes(app_label)
+            migration = migrations.Migration("add_advised_indexes", app_label)
+            migration.dependencies = leaves[:1]
+            migration.operations = app_operations
+            number = int(leaves[0][1].split("_", 1)[0]) + 1 if leaves else 1
+            migration.name = f"{number:04d}_add_advised_indexes"
+            writer = MigrationWriter(migration)
+            if write:
+                Path(writer.path).write_text(writer.as_string(), encoding="utf-8")
+                self.stdout.write(self.style.SUCCESS(f"\nEscrita {writer.path}"))
+                self.stdout.write(
+                    "  Agregar los índices a Meta.indexes para que makemigrations "
+                    "no los elimine."
+                )
+            else:
+                self.stdout.write(self.style.MIGRATE_HEADING(f"\n# {writer.path}"))
+                self.stdout.write(writer.as_string())
+
+    def _operation(self, model: type[models.Model], columns: list[str]) -> Any:
+        """AddIndex for regular models, RunSQL for auto-created M2M tables"""
+        by_column = {f.column: f.name for f in model._meta.concrete_fields}
+        if model._meta.auto_created:
+            table = model._meta.db_table
+            name = f"{table}_{'_'.join(columns)}_idx"[:63]
+            quoted = ", ".join(f'"{column}"' for column in columns)
+            return migrations.RunSQL(
+                f'CREATE INDEX "{name}" ON "{table}" ({quoted})',
+                reverse_sql=f'DROP INDEX "{name}"',
+            )
+        index = models.Index(fields=[by_column.get(c, c) for c in columns])
+        index.set_name_with_model(model)
+        return migrations.AddIndex(model_name=model._meta.model_name, index=index)
@@ -0,0 +1,96 @@
+"""
+Run workers command - Consume the database-backed job queue
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import signal
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connections
+
+from core.db.connections import close_pools
+from core.db.sqlite import schedule_maintenance
+from core.jobs.worker import Worker
+
+
+def _serve(options: dict[str, Any]) -> None:
+    worker = Worker(
+        queues=options["queues"],
+        threads=options["threads"],
+        poll_interval=options["poll_interval"],
+        burst=options["burst"],
+    )
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, lambda *_: worker.stop())
+    worker.run()
+
+
+class Command(BaseCommand):
+    help = "Ejecutar workers de tareas en segundo plano (cola en base de datos)"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--queues",
+            default="default,images",
+            help="Colas a consumir, separadas por coma (por defecto default,images)",
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=getattr(settings, "JOBS_WORKER_THREADS", 2),
+            help="Hilos por proceso",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=1,
+            help="Procesos worker (para tareas que usan mucha CPU)",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=getattr(settings, "JOBS_POLL_INTERVAL", 1.0),
+            help="Segundos de espera cuando la cola está vacía",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Terminar cuando no queden tareas pendientes",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        options["queues"] = [q.strip() for q in options["queues"].split(",") if q]
+        self.stdout.write(
+            f"Workers: {options['processes']} proceso(s) x {options['threads']} "
+            f"hilo(s), colas: {', '.join(options['queues'])}"
+        )
+        schedule_maintenance()
+        if options["processes"] <= 1:
+            _serve(options)
+            return
+
+        # Children must not share the parent's database connections
+        connections.close_all()
+        close_pools()
+        context = multiprocessing.get_context("fork")
+        processes = [
+            context.Process(target=_serve, args=(options,), name=f"worker-{index}")
+            for index in range(options["processes"])
+        ]
+        for process in processes:
+            process.start()
+
+        def forward(signum: int, _: Any) -> None:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+
+        signal.signal(signal.SIGTERM, forward)
+        signal.signal(signal.SIGINT, forward)
+        for process in processes:
+            process.join()
+        self.stdout.write(self.style.SUCCESS("Workers detenidos"))
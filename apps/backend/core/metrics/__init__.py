@@ -0,0 +1,17 @@
+"""
+Prometheus-compatible metrics with a file-based multiprocess store
+"""
+
+from .multiprocess import MultiProcessStore, get_store
+from .registry import REGISTRY, Counter, Gauge, Histogram, Registry, render
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MultiProcessStore",
+    "REGISTRY",
+    "Registry",
+    "get_store",
+    "render",
+]
@@ -0,0 +1,136 @@
+"""
+Application metrics - Request, database, cache and worker process families
+"""
+
+from __future__ import annotations
+
+import functools
+import gc
+import os
+import sys
+from contextvars import ContextVar
+from typing import Any, Callable
+
+from django.core.cache import caches
+
+from .registry import REGISTRY, Counter, Gauge, Histogram
+
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+QUERY_TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+ACTION_LABELS = ("controller", "action")
+
+REQUEST_LATENCY = Histogram(
+    "savoro_http_request_duration_seconds",
+    "Request latency by controller action",
+    ACTION_LABELS,
+)
+REQUESTS = Counter(
+    "savoro_http_requests_total",
+    "Requests by controller action, method and status code",
+    (*ACTION_LABELS, "method", "status"),
+)
+RESPONSE_SIZE = Histogram(
+    "savoro_http_response_size_bytes",
+    "Response body size by controller action",
+    ACTION_LABELS,
+    buckets=SIZE_BUCKETS,
+)
+DB_QUERIES = Histogram(
+    "savoro_db_queries_per_request",
+    "SQL statements executed per request",
+    ACTION_LABELS,
+    buckets=QUERY_COUNT_BUCKETS,
+)
+DB_TIME = Histogram(
+    "savoro_db_query_duration_seconds",
+    "Time spent in SQL per request",
+    ACTION_LABELS,
+    buckets=QUERY_TIME_BUCKETS,
+)
+CACHE_REQUESTS = Counter(
+    "savoro_cache_requests_total",
+    "Cache lookups by backend and result (hit ratio = hit / (hit + miss))",
+    ("cache", "result"),
+)
+PROCESS_RSS = Gauge(
+    "savoro_process_resident_memory_bytes",
+    "Resident memory of the worker process",
+)
+PROCESS_GC = Gauge(
+    "savoro_process_gc_collections",
+    "Garbage collections run by the worker, per generation",
+    ("generation",),
+)
+
+
+def _resident_memory() -> int:
+    """Current RSS from /proc, falling back to peak RSS where unavailable"""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def collect_process_metrics() -> None:
+    """Refresh worker gauges (registered as a registry collector)"""
+    PROCESS_RSS.set(_resident_memory())
+    for generation, stats in enumerate(gc.get_stats()):
+        PROCESS_GC.set(stats["collections"], generation=generation)
+
+
+REGISTRY.add_collector(collect_process_metrics)
+
+
+_MISSING = object()
+# Set while get_many runs: backends implementing it via get() must not count twice
+_in_get_many: ContextVar[bool] = ContextVar("cache_get_many", default=False)
+
+
+def _wrap_get(alias: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def get(key: Any, default: Any = None, version: Any = None) -> Any:
+        value = method(key, _MISSING, version=version)
+        if _in_get_many.get():
+            return default if value is _MISSING else value
+        if value is _MISSING:
+            CACHE_REQUESTS.inc(cache=alias, result="miss")
+            return default
+        CACHE_REQUESTS.inc(cache=alias, result="hit")
+        return value
+
+    return get
+
+
+def _wrap_get_many(alias: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def get_many(keys: Any, version: Any = None) -> Any:
+        keys = list(keys)
+        token = _in_get_many.set(True)
+        try:
+            found = method(keys, version=version)
+        finally:
+            _in_get_many.reset(token)
+        if found:
+            CACHE_REQUESTS.inc(len(found), cache=alias, result="hit")
+        if len(keys) > len(found):
+            CACHE_REQUESTS.inc(len(keys) - len(found), cache=alias, result="miss")
+        return found
+
+    return get_many
+
+
+def install_cache_metrics() -> None:
+    """Count hits and misses on the cache backends of the current thread"""
+    for alias in caches:
+        cache = caches[alias]
+        if getattr(cache, "_metrics_hook", False):
+            continue
+        cache.get = _wrap_get(alias, cache.get)
+        cache.get_many = _wrap_get_many(alias, cache.get_many)
+        setattr(cache, "_metrics_hook", True)
@@ -0,0 +1,144 @@
+"""
+File-based multiprocess store - Aggregate metrics across worker processes
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from django.conf import settings
+
+from .registry import REGISTRY, Registry
+
+_FILE_PREFIX = "metrics_"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MultiProcessStore:
+    """
+    Each worker periodically writes a snapshot of its registry to
+    <directory>/metrics_<pid>.json; a scrape merges every file.
+
+    Counters and histograms are summed over all files, including those of
+    workers that have exited, so totals survive worker restarts. Gauges only
+    consider live workers and are combined according to their mode.
+    The directory should be emptied when the server (re)starts.
+    """
+
+    def __init__(self, directory: str | Path, flush_interval: float = 1.0):
+        self.directory = Path(directory)
+        self.flush_interval = flush_interval
+        self._last_flush = 0.0
+        self._lock = threading.Lock()
+
+    def _path(self, pid: int) -> Path:
+        return self.directory / f"{_FILE_PREFIX}{pid}.json"
+
+    def flush(self, registry: Registry) -> None:
+        """Write this process' snapshot atomically"""
+        pid = os.getpid()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(pid)
+        tmp = path.with_suffix(f".tmp{threading.get_ident()}")
+        tmp.write_text(json.dumps(registry.dump()), encoding="utf-8")
+        os.replace(tmp, path)
+        self._last_flush = time.monotonic()
+
+    def maybe_flush(self, registry: Registry) -> None:
+        """Flush when the last snapshot is older than flush_interval"""
+        if time.monotonic() - self._last_flush < self.flush_interval:
+            return
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            self.flush(registry)
+        finally:
+            self._lock.release()
+
+    def _snapshots(self) -> list[tuple[int, dict[str, Any]]]:
+        snapshots = []
+        for path in self.directory.glob(f"{_FILE_PREFIX}*.json"):
+            try:
+                pid = int(path.stem[len(_FILE_PREFIX) :])
+                snapshots.append((pid, json.loads(path.read_text(encoding="utf-8"))))
+            except (ValueError, OSError):
+                # Foreign file or a snapshot being replaced
+                continue
+        return snapshots
+
+    def collect(self) -> dict[str, dict[str, Any]]:
+        """Merged families of every worker, ready for registry.render()"""
+        merged: dict[str, dict[str, Any]] = {}
+        series: dict[str, dict[tuple[str, ...], Any]] = {}
+        for pid, families in self._snapshots():
+            alive: Optional[bool] = None
+            for name, family in families.items():
+                if name not in merged:
+                    merged[name] = {k: v for k, v in family.items() if k != "samples"}
+                    series[name] = {}
+                    if family["type"] == "gauge" and family.get("mode") == "all":
+                        merged[name]["labelnames"] = [*family["labelnames"], "pid"]
+                target = series[name]
+                for labelvalues, value in family["samples"]:
+                    key = tuple(labelvalues)
+                    if family["type"] == "counter":
+                        target[key] = target.get(key, 0.0) + value
+                    elif family["type"] == "histogram":
+                        current = target.get(key)
+                        target[key] = (
+                            [a + b for a, b in zip(current, value)]
+                            if current
+                            else list(value)
+                        )
+                    else:
+                        if alive is None:
+                            alive = _pid_alive(pid)
+                        if not alive:
+                            continue
+                        mode = family.get("mode", "all")
+                        if mode == "all":
+                            target[(*key, str(pid))] = value
+                        elif mode == "max":
+                            target[key] = max(target.get(key, value), value)
+                        else:
+                            target[key] = target.get(key, 0.0) + value
+        for name, family in merged.items():
+            family["samples"] = [
+                [list(key), value] for key, value in series[name].items()
+            ]
+        return merged
+
+
+_store: Optional[MultiProcessStore] = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> Optional[MultiProcessStore]:
+    """Store configured by settings.METRICS_MULTIPROC_DIR (None: single process)"""
+    global _store
+    directory = getattr(settings, "METRICS_MULTIPROC_DIR", "")
+    if not directory:
+        return None
+    with _store_lock:
+        if _store is None or _store.directory != Path(directory):
+            _store = MultiProcessStore(
+                directory, getattr(settings, "METRICS_FLUSH_INTERVAL", 1.0)
+            )
+            # Keep the observations made since the last flush of an exiting worker
+            atexit.register(_store.flush, REGISTRY)
+    return _store
@@ -0,0 +1,214 @@
+"""
+Metric types, registry and Prometheus text exposition
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+LabelValues = tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Metric:
+    """
+    Base metric family keyed by label values
+
+    Values are kept in plain dicts guarded by a lock so a process snapshot
+    (Registry.dump) can be written to the multiprocess store at any time.
+    """
+
+    type = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: Optional["Registry"] = None,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[LabelValues, Any] = {}
+        self._lock = threading.Lock()
+        (registry or REGISTRY).register(self)
+
+    def _key(self, labels: dict[str, Any]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def dump(self) -> dict[str, Any]:
+        """Serializable snapshot of this family"""
+        with self._lock:
+            samples = [[list(key), value] for key, value in self._values.items()]
+        return {
+            "type": self.type,
+            "help": self.documentation,
+            "labelnames": list(self.labelnames),
+            "samples": samples,
+        }
+
+
+class Counter(Metric):
+    """Monotonically increasing value"""
+
+    type = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(Metric):
+    """
+    Value that can go up and down
+
+    multiprocess_mode decides how values of several workers are combined:
+        "all": one series per live worker (adds a "pid" label)
+        "livesum": sum over live workers
+        "max": maximum over live workers
+    """
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: Optional["Registry"] = None,
+        multiprocess_mode: str = "all",
+    ):
+        super().__init__(name, documentation, labelnames, registry)
+        self.multiprocess_mode = multiprocess_mode
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def dump(self) -> dict[str, Any]:
+        data = super().dump()
+        data["mode"] = self.multiprocess_mode
+        return data
+
+
+class Histogram(Metric):
+    """
+    Observations counted into cumulative buckets
+
+    Each series is stored as per-bucket counts (last one is +Inf) followed
+    by the sum of observed values.
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: Optional["Registry"] = None,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames, registry)
+        self.buckets = tuple(sorted(float(bound) for bound in buckets))
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        index = len(self.buckets)
+        for position, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = position
+                break
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def dump(self) -> dict[str, Any]:
+        data = super().dump()
+        data["buckets"] = list(self.buckets)
+        return data
+
+
+class Registry:
+    """Metric families of this process plus callbacks run before each snapshot"""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> None:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} already registered")
+            self._metrics[metric.name] = metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Run collector (e.g. refresh process gauges) before every dump"""
+        self._collectors.append(collector)
+
+    def dump(self) -> dict[str, dict[str, Any]]:
+        """Snapshot of every family, keyed by metric name"""
+        for collector in self._collectors:
+            collector()
+        return {name: metric.dump() for name, metric in self._metrics.items()}
+
+
+REGISTRY = Registry()
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def render(families: dict[str, dict[str, Any]]) -> str:
+    """Prometheus text exposition format (version 0.0.4)"""
+    lines: list[str] = []
+    for name in sorted(families):
+        family = families[name]
+        lines.append(f"# HELP {name} {_escape(family['help'])}")
+        lines.append(f"# TYPE {name} {family['type']}")
+        labelnames = family["labelnames"]
+        for labelvalues, value in sorted(family["samples"]):
+            if family["type"] != "histogram":
+                labels = _labels(labelnames, labelvalues)
+                lines.append(f"{name}{labels} {_format_value(value)}")
+                continue
+            cumulative = 0.0
+            bounds = [*family["buckets"], math.inf]
+            for bound, count in zip(bounds, value):
+                cumulative += count
+                labels = _labels(
+                    [*labelnames, "le"], [*labelvalues, _format_value(bound)]
+                )
+                lines.append(f"{name}_bucket{labels} {_format_value(cumulative)}")
+            labels = _labels(labelnames, labelvalues)
+            lines.append(f"{name}_sum{labels} {_format_value(value[-1])}")
+            lines.append(f"{name}_count{labels} {_format_value(cumulative)}")
+    return "\n".join(lines) + "\n"
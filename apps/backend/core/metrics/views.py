@@ -0,0 +1,49 @@
+"""
+Metrics views - Prometheus scrape endpoint
+"""
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+from django.views.decorators.http import require_GET
+
+from . import collectors  # noqa: F401 (registers the application families)
+from .multiprocess import get_store
+from .registry import REGISTRY, render
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _allowed(request: HttpRequest) -> bool:
+    """
+    Scrapes with METRICS_TOKEN or by staff users
+
+    METRICS_ALLOWED_IPS is empty by default: behind a proxy every request
+    comes from the proxy's address, so only list IPs that reach the app
+    directly (e.g. a Prometheus on the same host without a proxy).
+    """
+    token = getattr(settings, "METRICS_TOKEN", "")
+    if token and constant_time_compare(
+        request.headers.get("Authorization", ""), f"Bearer {token}"
+    ):
+        return True
+    allowed_ips = getattr(settings, "METRICS_ALLOWED_IPS", [])
+    if allowed_ips and request.META.get("REMOTE_ADDR") in allowed_ips:
+        return True
+    user = getattr(request, "user", None)
+    return bool(user is not None and user.is_active and user.is_staff)
+
+
+@require_GET
+def metrics(request: HttpRequest) -> HttpResponse:
+    """Metrics of every worker in Prometheus text format"""
+    if not _allowed(request):
+        return HttpResponseForbidden()
+
+    store = get_store()
+    if store is None:
+        families = REGISTRY.dump()
+    else:
+        store.flush(REGISTRY)
+        families = store.collect()
+    return HttpResponse(render(families), content_type=CONTENT_TYPE)
@@ -0,0 +1,3 @@
+"""
+Core middleware - Request-level instrumentation
+"""
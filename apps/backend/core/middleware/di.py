@@ -0,0 +1,22 @@
+"""
+Dependency injection request scope middleware
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from django.http import HttpRequest, HttpResponse
+
+from core.di import request_scope
+
+
+class RequestScopeMiddleware:
+    """Share Scope.REQUEST instances (core.di) for the duration of a request"""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        with request_scope():
+            return self.get_response(request)
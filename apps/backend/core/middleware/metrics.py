@@ -0,0 +1,120 @@
+"""
+Metrics middleware - Per-action latency, SQL, cache and response size
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+from core.db.queries import QueryRecorder, RecordedQuery
+from core.metrics.collectors import (
+    DB_QUERIES,
+    DB_TIME,
+    REQUEST_LATENCY,
+    REQUESTS,
+    RESPONSE_SIZE,
+    install_cache_metrics,
+)
+from core.metrics.multiprocess import get_store
+from core.metrics.registry import REGISTRY
+
+
+_METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+
+
+class _QueryTimer(QueryRecorder):
+    """QueryRecorder that only keeps the statement count and total time"""
+
+    def __init__(self, using: Any = None):
+        super().__init__(using)
+        self._count = 0
+        self._total_time = 0.0
+
+    def record(self, query: RecordedQuery) -> None:
+        self._count += 1
+        self._total_time += query.duration
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total_time(self) -> float:
+        return self._total_time
+
+
+def action_labels(request: HttpRequest) -> dict[str, str]:
+    """
+    controller/action labels of a request
+
+    Controller actions set request.controller_action (see @Controller);
+    other views (admin, auth) are labelled by their URL name, and
+    unresolved paths share one series to keep cardinality bounded.
+    """
+    action: Optional[tuple[str, str]] = getattr(request, "controller_action", None)
+    if action:
+        return {"controller": action[0], "action": action[1]}
+    match = getattr(request, "resolver_match", None)
+    if match:
+        return {
+            "controller": match.namespace or "view",
+            "action": match.url_name or match.view_name,
+        }
+    return {"controller": "none", "action": "none"}
+
+
+def _response_size(response: HttpResponse) -> Optional[int]:
+    if getattr(response, "streaming", False):
+        length = response.get("Content-Length")
+        return int(length) if length else None
+    return len(response.content)
+
+
+class MetricsMiddleware:
+    """
+    Record request metrics exposed at /metrics (core.metrics.views.metrics)
+
+    Settings:
+        METRICS_ENABLED: switch (default False, True in production; middleware
+            removed when False)
+        METRICS_MULTIPROC_DIR: directory shared by gunicorn workers; empty
+            for a single process
+        METRICS_FLUSH_INTERVAL: seconds between worker snapshots
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        if not getattr(settings, "METRICS_ENABLED", False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        install_cache_metrics()
+        start = time.perf_counter()
+        with _QueryTimer(using=list(connections)) as timer:
+            response = self.get_response(request)
+            if callable(getattr(response, "render", None)) and not getattr(
+                response, "is_rendered", True
+            ):
+                response.render()
+        elapsed = time.perf_counter() - start
+
+        labels = action_labels(request)
+        REQUEST_LATENCY.observe(elapsed, **labels)
+        method = request.method if request.method in _METHODS else "other"
+        REQUESTS.inc(**labels, method=method, status=str(response.status_code))
+        DB_QUERIES.observe(timer.count, **labels)
+        DB_TIME.observe(timer.total_time, **labels)
+        size = _response_size(response)
+        if size is not None:
+            RESPONSE_SIZE.observe(size, **labels)
+
+        store = get_store()
+        if store is not None:
+            store.maybe_flush(REGISTRY)
+        return response
@@ -0,0 +1,60 @@
+"""
+N+1 query detection middleware
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Callable
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+from core.db.n_plus_one import NPlusOneRecorder
+from core.exceptions.database import NPlusOneDetected
+
+logger = logging.getLogger("core.n_plus_one")
+
+
+class NPlusOneDetectionMiddleware:
+    """
+    Fingerprint SQL statements per request and report repeated lazy loads
+
+    Settings:
+        N_PLUS_ONE_DETECTION: "off" (default), "warn" or "raise"
+        N_PLUS_ONE_THRESHOLD: repetitions of one shape from one call site
+            before it is reported (default 3)
+
+    Reports include the template line or project stack that triggered the
+    statements and the select_related/prefetch_related path that avoids it.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.mode = getattr(settings, "N_PLUS_ONE_DETECTION", "off")
+        if self.mode not in ("warn", "raise"):
+            raise MiddlewareNotUsed()
+        self.threshold = int(getattr(settings, "N_PLUS_ONE_THRESHOLD", 3))
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        with NPlusOneRecorder(
+            using=list(connections), threshold=self.threshold
+        ) as recorder:
+            response = self.get_response(request)
+            if callable(getattr(response, "render", None)) and not getattr(
+                response, "is_rendered", True
+            ):
+                response.render()
+
+        reports = recorder.reports()
+        if not reports:
+            return response
+
+        details = "\n".join(report.format() for report in reports)
+        if self.mode == "raise":
+            raise NPlusOneDetected(request.path, details)
+        logger.warning("N+1 queries detected in %s\n%s", request.path, details)
+        response["X-N-Plus-One"] = str(len(reports))
+        return response
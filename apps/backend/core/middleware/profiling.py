@@ -0,0 +1,77 @@
+"""
+Request profiling middleware with Server-Timing breakdown
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Callable
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+from django.utils import timezone
+
+from core.profiling.buffer import RequestProfile, get_profile_buffer
+from core.profiling.instrumentation import (
+    ProfileQueryRecorder,
+    activate,
+    deactivate,
+    install_cache_hooks,
+    install_template_hook,
+)
+
+
+class RequestProfilingMiddleware:
+    """
+    Measure SQL, template, cache and controller time of sampled requests
+
+    Settings:
+        PROFILING_ENABLED: opt-in switch (default False, middleware removed)
+        PROFILING_SAMPLE_RATE: fraction of requests profiled, 0.0 - 1.0
+        PROFILING_BUFFER_SIZE: profiles kept in the rolling buffer
+
+    Sampled responses get a Server-Timing header and their profile is
+    appended to the buffer shown at core.profiling.views.slow_requests.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        if not getattr(settings, "PROFILING_ENABLED", False):
+            raise MiddlewareNotUsed()
+        self.sample_rate = float(getattr(settings, "PROFILING_SAMPLE_RATE", 0.0))
+        self.get_response = get_response
+        install_template_hook()
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return self.get_response(request)
+
+        install_cache_hooks()
+        profile = RequestProfile(
+            method=request.method or "",
+            path=request.path,
+            started_at=timezone.now(),
+        )
+        active, token = activate(profile)
+        start = time.perf_counter()
+        try:
+            with ProfileQueryRecorder(active, using=list(connections)) as recorder:
+                response = self.get_response(request)
+                if callable(getattr(response, "render", None)) and not getattr(
+                    response, "is_rendered", True
+                ):
+                    response.render()
+        finally:
+            deactivate(token)
+
+        profile.total_ms = (time.perf_counter() - start) * 1000
+        recorder.finalize()
+        match = getattr(request, "resolver_match", None)
+        profile.view = match.view_name if match else ""
+        profile.status_code = response.status_code
+
+        response["Server-Timing"] = profile.server_timing()
+        get_profile_buffer().append(profile)
+        return response
@@ -0,0 +1,62 @@
+"""
+Read-replica routing middleware with read-your-writes stickiness
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse
+
+from core.db.routers import replica_aliases, routing_scope
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Let safe requests read the menu from replicas (core.db.routers)
+
+    Requests with other methods use the primary throughout. A client whose
+    request wrote to a replicated app gets a cookie that keeps its reads on
+    the primary for REPLICA_STICKY_SECONDS, so it sees its own changes
+    while replicas catch up.
+
+    Settings:
+        DATABASE_REPLICAS: aliases of replica connections (none = disabled)
+        REPLICA_STICKY_SECONDS: primary-only window after a write (default 10)
+        REPLICA_PIN_COOKIE: cookie carrying the window end (default
+            "db_primary_until")
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        if not replica_aliases():
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.sticky_seconds = int(getattr(settings, "REPLICA_STICKY_SECONDS", 10))
+        self.cookie = getattr(settings, "REPLICA_PIN_COOKIE", "db_primary_until")
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        allowed = request.method in SAFE_METHODS and not self._pinned(request)
+        with routing_scope(replicas_allowed=allowed) as state:
+            response = self.get_response(request)
+        if state.wrote:
+            response.set_cookie(
+                self.cookie,
+                str(int(time.time()) + self.sticky_seconds),
+                max_age=self.sticky_seconds,
+                httponly=True,
+                samesite="Lax",
+                secure=request.is_secure(),
+            )
+        return response
+
+    def _pinned(self, request: HttpRequest) -> bool:
+        # Tampering only sends the client to the primary, so it is not signed
+        try:
+            return float(request.COOKIES.get(self.cookie, 0)) > time.time()
+        except ValueError:
+            return False
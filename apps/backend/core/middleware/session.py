@@ -0,0 +1,39 @@
+"""
+Request-scoped identity map and unit of work middleware
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse
+
+from core.db.session import session_scope
+
+
+class RequestSessionMiddleware:
+    """
+    Open a core.db.session.Session for each request
+
+    Settings:
+        IDENTITY_MAP_ENABLED: serve repeated find_by_id calls from memory
+            (default True)
+        UNIT_OF_WORK_ENABLED: defer repository updates and save them in one
+            transaction after the view returns (default False); pending
+            changes are discarded when the response is a server error
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.unit_of_work = getattr(settings, "UNIT_OF_WORK_ENABLED", False)
+        if not (getattr(settings, "IDENTITY_MAP_ENABLED", True) or self.unit_of_work):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        with session_scope(unit_of_work=self.unit_of_work) as session:
+            response = self.get_response(request)
+            if response.status_code >= 500:
+                session.discard()
+        return response
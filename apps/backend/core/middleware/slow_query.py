@@ -0,0 +1,54 @@
+"""
+Slow query middleware - Log slow statements with their EXPLAIN plan
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+from core.db.slow_query import SlowQueryLog, SlowQueryRecorder
+
+
+class SlowQueryMiddleware:
+    """
+    Write statements slower than SLOW_QUERY_THRESHOLD_MS to a JSON Lines log
+
+    Each record carries the normalized fingerprint, the calling repository
+    method and the EXPLAIN plan (EXPLAIN ANALYZE on PostgreSQL for a
+    SLOW_QUERY_ANALYZE_RATE fraction). Aggregate it with
+    `manage.py index_advisor`.
+
+    Settings:
+        SLOW_QUERY_LOG_ENABLED: switch (default False, middleware removed)
+        SLOW_QUERY_THRESHOLD_MS: minimum duration logged
+        SLOW_QUERY_ANALYZE_RATE: fraction of slow SELECTs re-run with ANALYZE
+        SLOW_QUERY_LOG_PATH: JSON Lines file
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        if not getattr(settings, "SLOW_QUERY_LOG_ENABLED", False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.log = SlowQueryLog(settings.SLOW_QUERY_LOG_PATH)
+        self.threshold_ms = float(getattr(settings, "SLOW_QUERY_THRESHOLD_MS", 100))
+        self.analyze_rate = float(getattr(settings, "SLOW_QUERY_ANALYZE_RATE", 0.0))
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        with SlowQueryRecorder(
+            self.log,
+            using=list(connections),
+            threshold_ms=self.threshold_ms,
+            analyze_rate=self.analyze_rate,
+            path=request.path,
+        ):
+            response = self.get_response(request)
+            if callable(getattr(response, "render", None)) and not getattr(
+                response, "is_rendered", True
+            ):
+                response.render()
+        return response
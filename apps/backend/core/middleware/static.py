@@ -0,0 +1,173 @@
+"""
+Static files middleware - Serve collected assets from an in-memory index
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import FileResponse, HttpRequest, HttpResponse
+
+from core.staticfiles.index import (
+    FileVariant,
+    StaticAsset,
+    StaticFileIndex,
+    manifest_files,
+)
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class _RangeFile:
+    """Read-only view of bytes [start, start + length) of an open file"""
+
+    def __init__(self, path: str, start: int, length: int):
+        self._file = open(path, "rb")
+        self._file.seek(start)
+        self._remaining = length
+
+    def read(self, size: int = -1) -> bytes:
+        if self._remaining <= 0:
+            return b""
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._file.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _accepted(header: str) -> set[str]:
+    """Encodings accepted with a non-zero quality"""
+    accepted = set()
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(name.strip().lower())
+    return accepted
+
+
+def _byte_range(header: str, size: int) -> Optional[tuple[int, int]]:
+    """(start, end) inclusive for a single satisfiable range, else None"""
+    match = _RANGE.match(header.strip())
+    if not match or not (match.group(1) or match.group(2)):
+        return None
+    first, last = match.group(1), match.group(2)
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    else:
+        start, end = max(size - int(last), 0), size - 1
+    if start > end or start >= size:
+        return None
+    return start, end
+
+
+class StaticFilesMiddleware:
+    """
+    Serve STATIC_URL requests from STATIC_ROOT without a separate web server
+
+    - Metadata (size, ETag, type, precompressed siblings) is indexed at
+      startup, so requests never stat() the filesystem
+    - .br/.gz siblings written by CompressedStaticFilesStorage are served
+      when the client accepts them (Vary: Accept-Encoding)
+    - Hashed assets from the Vite manifest get a one-year immutable
+      Cache-Control; other files STATIC_MAX_AGE and ETag revalidation
+    - Whole files use FileResponse, which the WSGI server can send with
+      sendfile(); single byte Range requests are served from the identity
+      encoding
+
+    Settings:
+        STATIC_SERVE_ENABLED: switch (default False, middleware removed)
+        STATIC_MAX_AGE: max-age in seconds for unhashed files
+        VITE_MANIFEST_PATH: manifest listing hashed assets
+    """
+
+    IMMUTABLE = "public, max-age=31536000, immutable"
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        if not getattr(settings, "STATIC_SERVE_ENABLED", False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.prefix = "/" + settings.STATIC_URL.lstrip("/")
+        self.max_age = int(getattr(settings, "STATIC_MAX_AGE", 3600))
+        self.index = StaticFileIndex(
+            settings.STATIC_ROOT,
+            manifest_files(getattr(settings, "VITE_MANIFEST_PATH", None)),
+        )
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if request.method in ("GET", "HEAD") and request.path.startswith(self.prefix):
+            asset = self.index.get(request.path[len(self.prefix) :])
+            if asset is not None:
+                return self.serve(request, asset)
+        return self.get_response(request)
+
+    def serve(self, request: HttpRequest, asset: StaticAsset) -> HttpResponse:
+        range_header = request.META.get("HTTP_RANGE")
+        encoding, variant = "", asset.identity
+        if not range_header:
+            accepted = _accepted(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+            for name, encoded in asset.encoded.items():
+                if name in accepted:
+                    encoding, variant = name, encoded
+                    break
+
+        if variant.etag in request.META.get("HTTP_IF_NONE_MATCH", ""):
+            response = HttpResponse(status=304)
+            self._set_headers(response, asset, variant, encoding)
+            return response
+
+        if request.method == "HEAD":
+            response = HttpResponse()
+            response["Content-Length"] = str(variant.size)
+        elif range_header:
+            byte_range = _byte_range(range_header, variant.size)
+            if byte_range is None:
+                response = HttpResponse(status=416)
+                response["Content-Range"] = f"bytes */{variant.size}"
+                return response
+            start, end = byte_range
+            response = FileResponse(
+                _RangeFile(variant.path, start, end - start + 1), status=206
+            )
+            response["Content-Range"] = f"bytes {start}-{end}/{variant.size}"
+            response["Content-Length"] = str(end - start + 1)
+        else:
+            response = FileResponse(open(variant.path, "rb"))
+            response["Content-Length"] = str(variant.size)
+
+        self._set_headers(response, asset, variant, encoding)
+        return response
+
+    def _set_headers(
+        self,
+        response: HttpResponse,
+        asset: StaticAsset,
+        variant: FileVariant,
+        encoding: str,
+    ) -> None:
+        response["Content-Type"] = asset.content_type
+        # FileResponse names the variant on disk (e.g. main.js.gz)
+        del response["Content-Disposition"]
+        response["ETag"] = variant.etag
+        response["Last-Modified"] = asset.last_modified
+        response["Accept-Ranges"] = "bytes"
+        response["Cache-Control"] = (
+            self.IMMUTABLE if asset.immutable else f"public, max-age={self.max_age}"
+        )
+        if asset.encoded:
+            response["Vary"] = "Accept-Encoding"
+        if encoding:
+            response["Content-Encoding"] = encoding
@@ -0,0 +1,80 @@
+"""
+Tracing middleware - Root span per request and span export
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+from core.db.queries import QueryRecorder, RecordedQuery
+from core.tracing.exporters import build_exporter
+from core.tracing.spans import count_query, current_span, finish_trace, start_trace
+
+
+class _SpanQueryCounter(QueryRecorder):
+    """Attribute each statement to the innermost open span"""
+
+    def record(self, query: RecordedQuery) -> None:
+        count_query()
+
+
+class TracingMiddleware:
+    """
+    Open a trace per request and export its spans when the response is ready
+
+    Controller/Service/Repository methods decorated with @Controller() and
+    @Injectable() become child spans automatically.
+
+    Settings:
+        TRACING_ENABLED: opt-in switch (default False, middleware removed)
+        TRACING_SAMPLE_RATE: fraction of requests traced
+        TRACING_EXPORTER: "file" (JSON Lines) or "http" (OTLP/JSON collector)
+        TRACING_EXPORT_PATH / TRACING_COLLECTOR_URL / TRACING_SERVICE_NAME
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        if not getattr(settings, "TRACING_ENABLED", False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.sample_rate = float(getattr(settings, "TRACING_SAMPLE_RATE", 1.0))
+        self.exporter = build_exporter(
+            getattr(settings, "TRACING_EXPORTER", "file"),
+            getattr(settings, "TRACING_SERVICE_NAME", "savoro-backend"),
+            settings.TRACING_EXPORT_PATH,
+            settings.TRACING_COLLECTOR_URL,
+        )
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return self.get_response(request)
+
+        root = start_trace(
+            f"{request.method} {request.path}",
+            **{"http.method": request.method or "", "http.target": request.path},
+        )
+        try:
+            with _SpanQueryCounter(using=list(connections)):
+                response = self.get_response(request)
+                if callable(getattr(response, "render", None)) and not getattr(
+                    response, "is_rendered", True
+                ):
+                    response.render()
+            root.attributes["http.status_code"] = response.status_code
+            match = getattr(request, "resolver_match", None)
+            if match:
+                root.attributes["http.route"] = match.route
+            return response
+        finally:
+            self.exporter.export(finish_trace())
+
+    def process_exception(self, request: HttpRequest, exception: Exception) -> Any:
+        span = current_span()
+        if span is not None:
+            span.error = f"{type(exception).__name__}: {exception}"
+        return None
@@ -0,0 +1,91 @@
+# Generated by Django 4.2.26 on 2026-10-19 03:59
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Job",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("name", models.CharField(max_length=255, verbose_name="Tarea")),
+                ("args", models.JSONField(blank=True, default=list, verbose_name="Argumentos")),
+                ("kwargs", models.JSONField(blank=True, default=dict, verbose_name="Opciones")),
+                ("queue", models.CharField(default="default", max_length=64, verbose_name="Cola")),
+                ("priority", models.SmallIntegerField(default=0, verbose_name="Prioridad")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("queued", "En cola"),
+                            ("running", "En ejecución"),
+                            ("done", "Completado"),
+                            ("failed", "Fallido"),
+                        ],
+                        default="queued",
+                        max_length=16,
+                        verbose_name="Estado",
+                    ),
+                ),
+                (
+                    "dedup_key",
+                    models.CharField(
+                        blank=True, max_length=255, null=True, verbose_name="Clave de deduplicación"
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0, verbose_name="Intentos")),
+                (
+                    "max_attempts",
+                    models.PositiveSmallIntegerField(default=3, verbose_name="Intentos máximos"),
+                ),
+                (
+                    "run_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="Ejecutar desde"
+                    ),
+                ),
+                ("locked_by", models.CharField(blank=True, max_length=255, verbose_name="Worker")),
+                (
+                    "locked_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="Tomado en"),
+                ),
+                ("last_error", models.TextField(blank=True, verbose_name="Último error")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="Creado")),
+                (
+                    "finished_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="Terminado"),
+                ),
+            ],
+            options={
+                "verbose_name": "Tarea en segundo plano",
+                "verbose_name_plural": "Tareas en segundo plano",
+                "db_table": "savoro_job",
+                "indexes": [
+                    models.Index(
+                        fields=["queue", "status", "-priority", "run_at"],
+                        name="savoro_job_claim_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="job",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("status", "queued")),
+                fields=("dedup_key",),
+                name="savoro_job_dedup_queued",
+            ),
+        ),
+    ]
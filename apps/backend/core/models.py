@@ -0,0 +1,7 @@
+"""
+Core models - Registered here so Django discovers them for the core app
+"""
+
+from core.jobs.models import Job
+
+__all__ = ["Job"]
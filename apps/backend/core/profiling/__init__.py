@@ -0,0 +1,3 @@
+"""
+Core profiling module - Per-request timing breakdown and in-memory buffer
+"""
@@ -0,0 +1,96 @@
+"""
+Rolling in-memory buffer of sampled request profiles
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from django.conf import settings
+
+
+@dataclass
+class ProfiledQuery:
+    """Statement kept in a profile's top queries"""
+
+    sql: str
+    duration_ms: float
+
+
+@dataclass
+class RequestProfile:
+    """Timing breakdown of a single sampled request"""
+
+    method: str
+    path: str
+    started_at: datetime
+    view: str = ""
+    status_code: int = 0
+    total_ms: float = 0.0
+    sql_count: int = 0
+    sql_ms: float = 0.0
+    template_ms: float = 0.0
+    cache_calls: int = 0
+    cache_ms: float = 0.0
+    top_queries: list[ProfiledQuery] = field(default_factory=list)
+
+    @property
+    def app_ms(self) -> float:
+        """Time spent in controller/service logic (total minus instrumented time)"""
+        return max(self.total_ms - self.sql_ms - self.template_ms - self.cache_ms, 0.0)
+
+    def server_timing(self) -> str:
+        """Server-Timing header value"""
+        return ", ".join(
+            [
+                f'db;dur={self.sql_ms:.1f};desc="SQL ({self.sql_count})"',
+                f'tpl;dur={self.template_ms:.1f};desc="Templates"',
+                f'cache;dur={self.cache_ms:.1f};desc="Cache ({self.cache_calls})"',
+                f'app;dur={self.app_ms:.1f};desc="Controller"',
+                f"total;dur={self.total_ms:.1f}",
+            ]
+        )
+
+
+class ProfileBuffer:
+    """Thread-safe bounded buffer; oldest profiles are discarded first"""
+
+    def __init__(self, maxlen: int):
+        self._items: deque[RequestProfile] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def append(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._items.append(profile)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def snapshot(self) -> list[RequestProfile]:
+        with self._lock:
+            return list(self._items)
+
+    def slowest(self, limit: int = 20) -> list[RequestProfile]:
+        """Profiles ordered by total time, slowest first"""
+        return sorted(self.snapshot(), key=lambda p: p.total_ms, reverse=True)[:limit]
+
+
+_buffer: Optional[ProfileBuffer] = None
+_buffer_lock = threading.Lock()
+
+
+def get_profile_buffer() -> ProfileBuffer:
+    """Process-wide buffer sized by settings.PROFILING_BUFFER_SIZE"""
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = ProfileBuffer(
+                    int(getattr(settings, "PROFILING_BUFFER_SIZE", 500))
+                )
+    return _buffer
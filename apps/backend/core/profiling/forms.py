@@ -0,0 +1,19 @@
+"""
+Profiling forms
+"""
+
+from django import forms
+
+
+class SamplerForm(forms.Form):
+    """Parameters of a sampling profiler run"""
+
+    duration = forms.IntegerField(
+        min_value=1, max_value=120, initial=10, label="Duración (segundos)"
+    )
+    interval_ms = forms.IntegerField(
+        min_value=1, max_value=100, initial=5, label="Intervalo de muestreo (ms)"
+    )
+    project_only = forms.BooleanField(
+        required=False, initial=True, label="Solo frames de modules/ y core/"
+    )
@@ -0,0 +1,153 @@
+"""
+Profiling hooks for SQL, template rendering and cache calls
+
+Hooks are installed once per process and only do work while a request
+profile is active in the current context, so unsampled requests pay a
+single ContextVar lookup per template render or cache call.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from django.core.cache import caches
+from django.template.base import Template
+
+from core.db.queries import QueryRecorder, RecordedQuery
+
+from .buffer import ProfiledQuery, RequestProfile
+
+CACHE_METHODS = (
+    "get",
+    "set",
+    "add",
+    "delete",
+    "get_many",
+    "set_many",
+    "delete_many",
+    "get_or_set",
+    "has_key",
+    "incr",
+    "decr",
+    "touch",
+)
+
+_install_lock = threading.Lock()
+
+
+@dataclass
+class _ActiveProfile:
+    profile: RequestProfile
+    template_depth: int = 0
+    template_started: float = 0.0
+    sql_in_template_ms: float = 0.0
+
+
+_active: ContextVar[Optional[_ActiveProfile]] = ContextVar(
+    "request_profile", default=None
+)
+
+
+def get_active_profile() -> Optional[RequestProfile]:
+    """Profile of the request being handled in this context, if sampled"""
+    active = _active.get()
+    return active.profile if active else None
+
+
+def install_template_hook() -> None:
+    """Time top-level Template.render calls (nested includes are not double counted)"""
+    with _install_lock:
+        if getattr(Template, "_profiling_hook", False):
+            return
+        original = Template.render
+
+        @functools.wraps(original)
+        def render(self: Template, context: Any) -> Any:
+            active = _active.get()
+            if active is None:
+                return original(self, context)
+            active.template_depth += 1
+            if active.template_depth == 1:
+                active.template_started = time.perf_counter()
+            try:
+                return original(self, context)
+            finally:
+                active.template_depth -= 1
+                if active.template_depth == 0:
+                    elapsed = (time.perf_counter() - active.template_started) * 1000
+                    active.profile.template_ms += elapsed
+
+        Template.render = render  # type: ignore[method-assign]
+        setattr(Template, "_profiling_hook", True)
+
+
+def _wrap_cache_method(method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        active = _active.get()
+        if active is None:
+            return method(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            active.profile.cache_calls += 1
+            active.profile.cache_ms += (time.perf_counter() - start) * 1000
+
+    return wrapper
+
+
+def install_cache_hooks() -> None:
+    """Wrap the cache backends of the current thread (caches are per-thread)"""
+    for cache in caches.all():
+        if getattr(cache, "_profiling_hook", False):
+            continue
+        for name in CACHE_METHODS:
+            method = getattr(cache, name, None)
+            if method is not None:
+                setattr(cache, name, _wrap_cache_method(method))
+        setattr(cache, "_profiling_hook", True)
+
+
+class ProfileQueryRecorder(QueryRecorder):
+    """QueryRecorder that feeds SQL time into the active profile"""
+
+    def __init__(self, active: "_ActiveProfile", using: Any = None, top: int = 5):
+        super().__init__(using)
+        self.active = active
+        self.top = top
+
+    def record(self, query: RecordedQuery) -> None:
+        super().record(query)
+        duration_ms = query.duration * 1000
+        profile = self.active.profile
+        profile.sql_count += 1
+        profile.sql_ms += duration_ms
+        if self.active.template_depth:
+            self.active.sql_in_template_ms += duration_ms
+
+    def finalize(self) -> None:
+        """Store the slowest statements and remove SQL time from template time"""
+        slowest = sorted(self.queries, key=lambda q: q.duration, reverse=True)
+        self.active.profile.top_queries = [
+            ProfiledQuery(sql=q.sql, duration_ms=q.duration * 1000)
+            for q in slowest[: self.top]
+        ]
+        self.active.profile.template_ms = max(
+            self.active.profile.template_ms - self.active.sql_in_template_ms, 0.0
+        )
+
+
+def activate(profile: RequestProfile) -> tuple[_ActiveProfile, Any]:
+    """Make profile the active one for the current context"""
+    active = _ActiveProfile(profile=profile)
+    return active, _active.set(active)
+
+
+def deactivate(token: Any) -> None:
+    _active.reset(token)
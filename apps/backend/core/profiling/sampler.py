@@ -0,0 +1,235 @@
+"""
+Statistical sampling profiler - Collapsed stacks and flamegraphs of a worker
+
+A background thread reads sys._current_frames() every `interval` seconds and
+counts the stack of every other thread. Nothing is installed in the request
+path, so overhead is limited to the sampling thread while a run is active.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from types import FrameType
+from typing import Optional
+
+from django.conf import settings
+from django.template.loader import render_to_string
+
+DEFAULT_PREFIXES = ("modules" + os.sep, "core" + os.sep)
+_SELF = os.path.join("core", "profiling", "sampler.py")
+_TEMPLATE_BASE = os.path.join("django", "template", "base.py")
+
+
+class SamplerBusy(RuntimeError):
+    """A sampling run is already active in this process"""
+
+
+@dataclass
+class FlameRect:
+    """One box of the flamegraph, positioned in percent of the total width"""
+
+    name: str
+    depth: int
+    x: float
+    width: float
+    samples: int
+    hue: int
+
+
+def _template_label(frame: FrameType) -> Optional[str]:
+    """'template:dish/list.html' for Template._render frames, kept when filtering"""
+    if frame.f_code.co_name != "_render" or not frame.f_code.co_filename.endswith(
+        _TEMPLATE_BASE
+    ):
+        return None
+    origin = getattr(frame.f_locals.get("self"), "origin", None)
+    name = getattr(origin, "template_name", None) or getattr(origin, "name", None)
+    return f"template:{name}" if name else None
+
+
+def _label(frame: FrameType, root: str) -> Optional[str]:
+    filename = frame.f_code.co_filename
+    if filename.startswith(root):
+        filename = filename[len(root) :]
+    elif "site-packages" + os.sep in filename:
+        filename = filename.split("site-packages" + os.sep, 1)[1]
+    if filename == _SELF:
+        return None
+    return f"{filename}:{frame.f_code.co_name}"
+
+
+class SamplingProfiler:
+    """
+    Sample all threads of this process for `duration` seconds
+
+    Usage:
+        profiler = SamplingProfiler(duration=10).start()
+        ...
+        profiler.join()
+        folded, html = profiler.write(Path("logs/profiles"))
+    """
+
+    def __init__(
+        self,
+        duration: float = 10.0,
+        interval: float = 0.005,
+        prefixes: Optional[tuple[str, ...]] = DEFAULT_PREFIXES,
+    ):
+        self.duration = duration
+        self.interval = interval
+        self.prefixes = prefixes
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self.started_at = datetime.now()
+        self._root = str(settings.BASE_DIR) + os.sep
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "SamplingProfiler":
+        self._thread = threading.Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        deadline = time.monotonic() + self.duration
+        while time.monotonic() < deadline:
+            for ident, frame in sys._current_frames().items():
+                if ident != own:
+                    self._sample(frame)
+            self.samples += 1
+            time.sleep(self.interval)
+
+    def _sample(self, frame: Optional[FrameType]) -> None:
+        labels: list[str] = []
+        while frame is not None:
+            template = _template_label(frame)
+            if template is not None:
+                labels.append(template)
+            else:
+                label = _label(frame, self._root)
+                if label is not None and (
+                    self.prefixes is None or label.startswith(self.prefixes)
+                ):
+                    labels.append(label)
+            frame = frame.f_back
+        if labels:
+            self.stacks[";".join(reversed(labels))] += 1
+
+    def collapsed(self) -> str:
+        """Brendan Gregg's collapsed-stack format: 'a;b;c count' per line"""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in sorted(self.stacks.items())
+        )
+
+    def flame_rects(self, min_width: float = 0.1) -> list[FlameRect]:
+        """Icicle layout (root on top) of the collected stacks"""
+        tree: dict[str, dict] = {}
+        for stack, count in self.stacks.items():
+            node = tree
+            for name in stack.split(";"):
+                entry = node.setdefault(name, {"samples": 0, "children": {}})
+                entry["samples"] += count
+                node = entry["children"]
+
+        total = sum(self.stacks.values()) or 1
+        rects: list[FlameRect] = []
+
+        def walk(children: dict[str, dict], depth: int, x: float) -> None:
+            for name in sorted(children):
+                entry = children[name]
+                width = entry["samples"] * 100 / total
+                if width >= min_width:
+                    rects.append(
+                        FlameRect(
+                            name=name,
+                            depth=depth,
+                            x=x,
+                            width=width,
+                            samples=entry["samples"],
+                            hue=zlib.crc32(name.split(":", 1)[0].encode()) % 60,
+                        )
+                    )
+                    walk(entry["children"], depth + 1, x)
+                x += width
+
+        walk(tree, 0, 0.0)
+        return rects
+
+    def write(self, directory: Path) -> tuple[Path, Path]:
+        """Write <timestamp>.folded and <timestamp>.html into directory"""
+        directory.mkdir(parents=True, exist_ok=True)
+        name = f"profile-{self.started_at:%Y%m%d-%H%M%S}-{os.getpid()}"
+        folded = directory / f"{name}.folded"
+        folded.write_text(self.collapsed(), encoding="utf-8")
+        rects = self.flame_rects()
+        html = directory / f"{name}.html"
+        html.write_text(
+            render_to_string(
+                "core/profiling/flamegraph.html",
+                {
+                    "profiler": self,
+                    "rects": rects,
+                    "depth": max((r.depth for r in rects), default=0) + 1,
+                },
+            ),
+            encoding="utf-8",
+        )
+        return folded, html
+
+
+_current: Optional[SamplingProfiler] = None
+_lock = threading.Lock()
+
+
+def output_dir() -> Path:
+    """Directory where finished runs are written (settings.PROFILING_SAMPLER_DIR)"""
+    return Path(settings.PROFILING_SAMPLER_DIR)
+
+
+def start_sampling(
+    duration: float,
+    interval: float = 0.005,
+    prefixes: Optional[tuple[str, ...]] = DEFAULT_PREFIXES,
+) -> SamplingProfiler:
+    """
+    Start a run in this process; outputs are written to output_dir() when done
+
+    Raises:
+        SamplerBusy: another run is still active
+    """
+    global _current
+    with _lock:
+        if _current is not None and _current.running:
+            raise SamplerBusy("Ya hay un muestreo en curso en este proceso")
+        profiler = SamplingProfiler(duration, interval, prefixes).start()
+        _current = profiler
+
+    def finish() -> None:
+        profiler.join()
+        profiler.write(output_dir())
+
+    threading.Thread(target=finish, name="sampling-writer", daemon=True).start()
+    return profiler
+
+
+def current_sampling() -> Optional[SamplingProfiler]:
+    """Active run of this process, if any"""
+    return _current if _current is not None and _current.running else None
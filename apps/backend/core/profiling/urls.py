@@ -0,0 +1,14 @@
+"""
+Profiling URLs
+"""
+
+from django.urls import path
+from . import views
+
+app_name = "profiling"
+
+urlpatterns = [
+    path("requests/", views.slow_requests, name="requests"),
+    path("sampler/", views.sampler, name="sampler"),
+    path("sampler/<str:name>", views.sampler_output, name="sampler_output"),
+]
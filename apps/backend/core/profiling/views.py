@@ -0,0 +1,93 @@
+"""
+Profiling views - Staff-only inspection of sampled requests
+"""
+
+from django.conf import settings
+from django.contrib import messages
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import FileResponse, Http404, HttpRequest, HttpResponse
+from django.shortcuts import redirect, render
+
+from .buffer import get_profile_buffer
+from .forms import SamplerForm
+from .sampler import (
+    DEFAULT_PREFIXES,
+    SamplerBusy,
+    current_sampling,
+    output_dir,
+    start_sampling,
+)
+
+_OUTPUT_TYPES = {".html": "text/html", ".folded": "text/plain"}
+
+
+@staff_member_required
+def slow_requests(request: HttpRequest) -> HttpResponse:
+    """Slowest sampled requests with their top queries"""
+    try:
+        limit = max(1, min(int(request.GET.get("limit", 20)), 200))
+    except ValueError:
+        limit = 20
+
+    buffer = get_profile_buffer()
+    return render(
+        request,
+        "core/profiling/slow_requests.html",
+        {
+            "profiles": buffer.slowest(limit),
+            "sampled_count": len(buffer.snapshot()),
+            "enabled": getattr(settings, "PROFILING_ENABLED", False),
+            "sample_rate": getattr(settings, "PROFILING_SAMPLE_RATE", 0.0),
+            "limit": limit,
+        },
+    )
+
+
+@staff_member_required
+def sampler(request: HttpRequest) -> HttpResponse:
+    """Start a sampling profiler run in this worker and list finished runs"""
+    form = SamplerForm(request.POST or None)
+    if request.method == "POST" and form.is_valid():
+        try:
+            start_sampling(
+                form.cleaned_data["duration"],
+                form.cleaned_data["interval_ms"] / 1000,
+                DEFAULT_PREFIXES if form.cleaned_data["project_only"] else None,
+            )
+            messages.success(
+                request,
+                f"Muestreo iniciado por {form.cleaned_data['duration']} s",
+            )
+        except SamplerBusy as e:
+            messages.error(request, str(e))
+        return redirect("profiling:sampler")
+
+    directory = output_dir()
+    runs = sorted(
+        {path.stem for path in directory.glob("profile-*.html")}, reverse=True
+    )
+    return render(
+        request,
+        "core/profiling/sampler.html",
+        {
+            "form": form,
+            "submit_text": "Iniciar muestreo",
+            "running": current_sampling(),
+            "runs": runs,
+        },
+    )
+
+
+@staff_member_required
+def sampler_output(request: HttpRequest, name: str) -> FileResponse:
+    """Flamegraph (.html) or collapsed stacks (.folded) of a finished run"""
+    directory = output_dir().resolve()
+    path = (directory / name).resolve()
+    content_type = _OUTPUT_TYPES.get(path.suffix)
+    if path.parent != directory or content_type is None or not path.is_file():
+        raise Http404()
+    return FileResponse(
+        open(path, "rb"),
+        content_type=f"{content_type}; charset=utf-8",
+        as_attachment=path.suffix == ".folded",
+    )
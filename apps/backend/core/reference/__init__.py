@@ -0,0 +1,30 @@
+"""
+Reference data - Cached snapshots of categories, tags and other lookups
+
+Usage:
+    # modules/category/reference.py (imported at startup)
+    reference_data.register("categories", Category)
+
+    reference_data.get("categories")            # ReferenceSnapshot
+    use_reference_choices(form.fields["category"], "categories")
+"""
+
+from .registry import ReferenceItem, ReferenceRegistry, ReferenceSnapshot
+
+reference_data = ReferenceRegistry()
+
+
+def autodiscover() -> None:
+    """Import every installed app's `reference` module"""
+    from django.utils.module_loading import autodiscover_modules
+
+    autodiscover_modules("reference")
+
+
+__all__ = [
+    "ReferenceItem",
+    "ReferenceRegistry",
+    "ReferenceSnapshot",
+    "autodiscover",
+    "reference_data",
+]
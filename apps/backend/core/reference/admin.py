@@ -0,0 +1,31 @@
+"""
+Admin list filters served from reference data snapshots
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.contrib import admin
+from django.http import HttpRequest
+
+
+def reference_list_filter(name: str) -> type[admin.RelatedFieldListFilter]:
+    """
+    RelatedFieldListFilter whose options come from a snapshot
+
+    Usage: list_filter = [("category", reference_list_filter("categories"))]
+    Parameters, the empty choice and the rendering stay those of the
+    default related-field filter; only the options query goes away.
+    """
+
+    class ReferenceListFilter(admin.RelatedFieldListFilter):
+        def field_choices(
+            self, field: Any, request: HttpRequest, model_admin: Any
+        ) -> list[tuple[Any, str]]:
+            from . import reference_data
+
+            return [(item.id, item.name) for item in reference_data.get(name)]
+
+    ReferenceListFilter.__name__ = f"{name.title().replace('_', '')}ListFilter"
+    return ReferenceListFilter
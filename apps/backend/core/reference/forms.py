@@ -0,0 +1,56 @@
+"""
+Form choices served from reference data snapshots
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+from django import forms
+from django.forms.models import ModelChoiceIterator, ModelChoiceIteratorValue
+
+from .registry import ReferenceItem
+
+
+class ReferenceChoiceIterator(ModelChoiceIterator):
+    """ModelChoiceIterator over a snapshot instead of the field's queryset"""
+
+    def __init__(self, field: forms.ModelChoiceField, name: str):
+        super().__init__(field)
+        self.name = name
+
+    def _items(self) -> tuple[ReferenceItem, ...]:
+        from . import reference_data
+
+        return reference_data.get(self.name).items
+
+    def __iter__(self) -> Iterator[tuple[Any, str]]:
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for item in self._items():
+            yield self.choice(item)
+
+    def __len__(self) -> int:
+        return len(self._items()) + (1 if self.field.empty_label is not None else 0)
+
+    def __bool__(self) -> bool:
+        return self.field.empty_label is not None or bool(self._items())
+
+    def choice(self, obj: Any) -> tuple[ModelChoiceIteratorValue, str]:
+        value = getattr(obj, self.field.to_field_name or "id")
+        return ModelChoiceIteratorValue(value, obj), self.field.label_from_instance(obj)
+
+
+def use_reference_choices(field: forms.Field, name: str) -> None:
+    """
+    Render a ModelChoiceField/ModelMultipleChoiceField from a snapshot
+
+    Only the choices come from memory; submitted values are still validated
+    against the field's queryset. The snapshot must contain the same rows
+    as that queryset (the model's default manager).
+    """
+    if not isinstance(field, forms.ModelChoiceField):
+        raise TypeError(f"{type(field).__name__} is not a ModelChoiceField")
+    field.iterator = lambda f: ReferenceChoiceIterator(f, name)  # type: ignore[assignment]
+    # The widget copied the queryset-backed choices when the field was bound
+    field.widget.choices = field.choices
@@ -0,0 +1,157 @@
+"""
+Reference data registry - Process-level snapshots of small lookup tables
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+
+from core.db.routers import use_primary
+
+
+@dataclass(frozen=True, slots=True)
+class ReferenceItem:
+    """One row of a NamedModel lookup table"""
+
+    id: int
+    name: str
+    is_active: bool
+    deleted: bool
+
+    @property
+    def pk(self) -> int:
+        return self.id
+
+    def __str__(self) -> str:
+        return self.name
+
+
+@dataclass(frozen=True)
+class ReferenceSnapshot:
+    """Immutable rows of one table, in the model's default ordering"""
+
+    name: str
+    version: int
+    items: tuple[ReferenceItem, ...]
+    by_id: dict[int, ReferenceItem] = field(repr=False)
+
+    def __iter__(self) -> Iterator[ReferenceItem]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def get(self, id: int) -> Optional[ReferenceItem]:
+        return self.by_id.get(id)
+
+    @property
+    def available(self) -> tuple[ReferenceItem, ...]:
+        """Active, not deleted rows"""
+        return tuple(item for item in self.items if item.is_active and not item.deleted)
+
+
+class ReferenceRegistry:
+    """
+    Named snapshots reloaded only when their version changes
+
+    Versions live in the REFERENCE_DATA_CACHE cache and are bumped after
+    commit by post_save/post_delete of the registered model, so every
+    process sharing that cache reloads on its next access.
+
+    With the default per-process LocMemCache, other processes only notice
+    changes once the key expires (REFERENCE_DATA_TIMEOUT).
+
+    QuerySet.update()/bulk_create() send no signals; call invalidate().
+    """
+
+    def __init__(self) -> None:
+        self._models: dict[str, type[models.Model]] = {}
+        self._snapshots: dict[str, ReferenceSnapshot] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self) -> Any:
+        return caches[getattr(settings, "REFERENCE_DATA_CACHE", "default")]
+
+    @property
+    def timeout(self) -> Optional[int]:
+        return getattr(settings, "REFERENCE_DATA_TIMEOUT", 300)
+
+    def register(self, name: str, model: type[models.Model]) -> None:
+        """Track a NamedModel table under name and invalidate it on change"""
+        self._models[name] = model
+        uid = f"reference_data:{name}"
+        post_save.connect(
+            self._on_change(name), sender=model, weak=False, dispatch_uid=uid
+        )
+        post_delete.connect(
+            self._on_change(name), sender=model, weak=False, dispatch_uid=uid
+        )
+
+    def get(self, name: str) -> ReferenceSnapshot:
+        """Current snapshot, reloaded from the database if its version moved"""
+        version = self._version(name)
+        snapshot = self._snapshots.get(name)
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        with self._lock:
+            snapshot = self._snapshots.get(name)
+            if snapshot is None or snapshot.version != version:
+                snapshot = self._snapshots[name] = self._load(name, version)
+        return snapshot
+
+    def invalidate(self, name: str) -> None:
+        """Bump the version of name (after the current transaction commits)"""
+        transaction.on_commit(lambda: self._bump(name))
+
+    def names(self) -> list[str]:
+        return list(self._models)
+
+    def _version_key(self, name: str) -> str:
+        return f"reference_data:{name}:version"
+
+    def _version(self, name: str) -> int:
+        key = self._version_key(name)
+        version = self.cache.get(key)
+        if version is None:
+            # First access or cleared cache: any new value forces a reload
+            self.cache.add(key, time.time_ns(), self.timeout)
+            version = self.cache.get(key, 0)
+        return int(version)
+
+    def _bump(self, name: str) -> None:
+        key = self._version_key(name)
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            self.cache.set(key, time.time_ns(), self.timeout)
+        else:
+            self.cache.touch(key, self.timeout)
+        self._snapshots.pop(name, None)
+
+    def _load(self, name: str, version: int) -> ReferenceSnapshot:
+        model = self._models[name]
+        rows = model._default_manager.values_list("id", "name", "is_active", "deleted")
+        # A lagging replica would cache old rows under the new version
+        with use_primary():
+            items = tuple(ReferenceItem(*row) for row in rows)
+        return ReferenceSnapshot(
+            name=name,
+            version=version,
+            items=items,
+            by_id={item.id: item for item in items},
+        )
+
+    def _on_change(self, name: str) -> Any:
+        def receiver(**kwargs: Any) -> None:
+            self.invalidate(name)
+
+        return receiver
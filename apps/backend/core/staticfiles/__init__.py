@@ -0,0 +1,3 @@
+"""
+Core static files - Precompressed collectstatic output and in-memory serving index
+"""
@@ -0,0 +1,116 @@
+"""
+In-memory index of collected static files
+"""
+
+from __future__ import annotations
+
+import json
+import mimetypes
+import os
+import re
+from dataclasses import dataclass, field
+from email.utils import formatdate
+from pathlib import Path
+from typing import Iterable, Optional
+
+# Vite chunk/asset names: name-<hash>.ext (8+ url-safe characters)
+_VITE_HASH = re.compile(r"-[A-Za-z0-9_-]{8,}\.\w+$")
+# ManifestStaticFilesStorage names: name.<12 hex>.ext
+_DJANGO_HASH = re.compile(r"\.[0-9a-f]{12}\.\w+$")
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+@dataclass(frozen=True)
+class FileVariant:
+    """One encoding of an asset on disk"""
+
+    path: str
+    size: int
+    etag: str
+
+
+@dataclass
+class StaticAsset:
+    """Metadata of a static file, gathered once at startup"""
+
+    content_type: str
+    last_modified: str
+    immutable: bool
+    identity: FileVariant
+    encoded: dict[str, FileVariant] = field(default_factory=dict)
+
+
+def _variant(path: str, suffix: str = "") -> FileVariant:
+    stat = os.stat(path)
+    return FileVariant(
+        path=path,
+        size=stat.st_size,
+        etag=f'"{stat.st_size:x}-{int(stat.st_mtime):x}{suffix}"',
+    )
+
+
+def manifest_files(manifest_path: Optional[str]) -> set[str]:
+    """Files listed in a Vite manifest (chunks and their CSS/assets)"""
+    if not manifest_path:
+        return set()
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return set()
+    files: set[str] = set()
+    for entry in manifest.values():
+        files.add(entry["file"])
+        files.update(entry.get("css", []))
+        files.update(entry.get("assets", []))
+    return files
+
+
+class StaticFileIndex:
+    """
+    Map of URL path (relative to STATIC_URL) to StaticAsset
+
+    Built by walking STATIC_ROOT once; requests never stat the filesystem.
+    Files are immutable when the Vite manifest references them under a
+    hashed name (or Django's manifest storage hashed them); unhashed entry
+    files such as dish/js/main.js are revalidated instead.
+    """
+
+    def __init__(self, root: str | Path, hashed: Iterable[str] = ()):
+        self.root = Path(root)
+        self.hashed = set(hashed)
+        self.assets: dict[str, StaticAsset] = {}
+        self.build()
+
+    def build(self) -> None:
+        assets: dict[str, StaticAsset] = {}
+        compressed_suffixes = tuple(suffix for _, suffix in ENCODINGS)
+        for directory, _, files in os.walk(self.root):
+            for filename in files:
+                if filename.endswith(compressed_suffixes):
+                    continue
+                path = os.path.join(directory, filename)
+                name = Path(path).relative_to(self.root).as_posix()
+                content_type, _ = mimetypes.guess_type(filename)
+                if content_type and content_type.startswith("text/"):
+                    content_type += "; charset=utf-8"
+                identity = _variant(path)
+                asset = StaticAsset(
+                    content_type=content_type or "application/octet-stream",
+                    last_modified=formatdate(os.stat(path).st_mtime, usegmt=True),
+                    immutable=self.is_hashed(name),
+                    identity=identity,
+                )
+                for encoding, suffix in ENCODINGS:
+                    if os.path.exists(path + suffix):
+                        asset.encoded[encoding] = _variant(path + suffix, suffix)
+                assets[name] = asset
+        self.assets = assets
+
+    def is_hashed(self, name: str) -> bool:
+        if name in self.hashed and _VITE_HASH.search(name):
+            return True
+        return bool(_DJANGO_HASH.search(name))
+
+    def get(self, name: str) -> Optional[StaticAsset]:
+        return self.assets.get(name)
@@ -0,0 +1,76 @@
+"""
+Static files storage that writes precompressed siblings at collectstatic time
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+from typing import Any, Iterator
+
+from django.contrib.staticfiles.storage import StaticFilesStorage
+
+try:
+    import brotli  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = (
+    ".css",
+    ".js",
+    ".mjs",
+    ".map",
+    ".json",
+    ".svg",
+    ".txt",
+    ".html",
+    ".xml",
+    ".ico",
+    ".ttf",
+    ".otf",
+    ".eot",
+)
+# Keep a compressed variant only if it saves at least this fraction
+MIN_SAVING = 0.05
+
+
+def _write_if_smaller(path: str, data: bytes, original_size: int) -> bool:
+    if len(data) > original_size * (1 - MIN_SAVING):
+        if os.path.exists(path):
+            os.remove(path)
+        return False
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
+class CompressedStaticFilesStorage(StaticFilesStorage):
+    """
+    Write <file>.gz (and <file>.br when the brotli package is installed)
+    next to every compressible file collected
+
+    The static files middleware (core.middleware.static) negotiates these
+    variants, so responses are never compressed per request.
+    """
+
+    def post_process(
+        self, paths: dict[str, Any], dry_run: bool = False, **options: Any
+    ) -> Iterator[tuple[str, str, bool]]:
+        if dry_run:
+            return
+        for name in paths:
+            if not name.endswith(COMPRESSIBLE_EXTENSIONS):
+                continue
+            path = self.path(name)
+            with open(path, "rb") as f:
+                content = f.read()
+            processed = _write_if_smaller(
+                f"{path}.gz",
+                gzip.compress(content, compresslevel=9, mtime=0),
+                len(content),
+            )
+            if brotli is not None:
+                processed |= _write_if_smaller(
+                    f"{path}.br", brotli.compress(content), len(content)
+                )
+            yield name, name, processed
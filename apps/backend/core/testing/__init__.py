@@ -0,0 +1,26 @@
+"""
+Core testing utilities
+
+Usage:
+    from core.testing import QueryBudgetTestMixin, grow_dishes
+"""
+
+from .fixtures import (
+    grow_categories,
+    grow_category_dishes,
+    grow_dish_tags,
+    grow_dishes,
+    grow_tags,
+)
+from .queries import QueryBudgetTestMixin, assert_max_queries, assert_queries_constant
+
+__all__ = [
+    "QueryBudgetTestMixin",
+    "assert_max_queries",
+    "assert_queries_constant",
+    "grow_categories",
+    "grow_category_dishes",
+    "grow_dish_tags",
+    "grow_dishes",
+    "grow_tags",
+]
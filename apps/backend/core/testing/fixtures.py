@@ -0,0 +1,69 @@
+"""
+Row factories for query budget tests - Grow the catalog to N rows
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from modules.category.models import Category
+    from modules.dish.models import Dish
+
+
+def grow_tags(count: int) -> None:
+    """Ensure `count` tags exist"""
+    from modules.food_tag.models import FoodTag
+
+    for index in range(FoodTag.objects.count(), count):
+        FoodTag.objects.create(name=f"Etiqueta {index}")
+
+
+def grow_dishes(count: int) -> None:
+    """Ensure `count` dishes exist, each with its own category and two tags"""
+    from modules.category.models import Category
+    from modules.dish.models import Dish
+    from modules.food_tag.models import FoodTag
+
+    tags = list(FoodTag.objects.all()[:2]) or [
+        FoodTag.objects.create(name="Vegano"),
+        FoodTag.objects.create(name="Picante"),
+    ]
+    for index in range(Dish.objects.count(), count):
+        category = Category.objects.create(name=f"Categoría {index}")
+        dish = Dish.objects.create(
+            name=f"Plato {index}",
+            description=f"Descripción del plato {index}",
+            price=Decimal("9.50"),
+            category=category,
+        )
+        dish.tags.set(tags)
+
+
+def grow_categories(count: int) -> None:
+    """Ensure `count` categories exist, each with two dishes"""
+    from modules.category.models import Category
+
+    for index in range(Category.objects.count(), count):
+        grow_category_dishes(Category.objects.create(name=f"Categoría {index}"), 2)
+
+
+def grow_dish_tags(dish: Dish, count: int) -> None:
+    """Ensure `dish` has `count` tags"""
+    from modules.food_tag.models import FoodTag
+
+    for index in range(dish.tags.count(), count):
+        dish.tags.add(FoodTag.objects.create(name=f"Etiqueta {dish.pk}-{index}"))
+
+
+def grow_category_dishes(category: Category, count: int) -> None:
+    """Ensure `category` has `count` dishes"""
+    from modules.dish.models import Dish
+
+    for index in range(category.dishes.count(), count):
+        Dish.objects.create(
+            name=f"Plato {category.pk}-{index}",
+            price=Decimal("9.50"),
+            category=category,
+        )
@@ -0,0 +1,112 @@
+"""
+Query budget assertions for tests
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+from core.db.queries import QueryRecorder
+from core.exceptions.database import QueryBudgetExceeded
+from django.db import connections
+
+
+def get_declared_budget(action: Callable[..., Any]) -> int:
+    """Read the budget declared with @query_budget on an action"""
+    budget = getattr(action, "_query_budget", None)
+    if budget is None:
+        name = getattr(action, "__qualname__", repr(action))
+        raise AssertionError(f"{name} has no @query_budget declared")
+    return int(budget)
+
+
+@contextmanager
+def assert_max_queries(
+    max_queries: int, label: str = "block"
+) -> Iterator[QueryRecorder]:
+    """Fail if the wrapped block executes more than max_queries statements"""
+    with QueryRecorder(using=list(connections)) as recorder:
+        yield recorder
+    if recorder.count > max_queries:
+        raise QueryBudgetExceeded(
+            label, max_queries, recorder.count, recorder.format_queries()
+        )
+
+
+def _render(response: Any) -> Any:
+    """Render lazy responses so template queries are counted"""
+    if callable(getattr(response, "render", None)) and not getattr(
+        response, "is_rendered", True
+    ):
+        response.render()
+    return response
+
+
+def assert_queries_constant(
+    run: Callable[[], Any],
+    grow: Callable[[int], Any],
+    small: int = 10,
+    large: int = 100,
+    label: str = "action",
+) -> int:
+    """
+    Fail if the number of queries executed by run() grows with data size
+
+    Args:
+        run: Callable executing the action under test
+        grow: Callable that ensures at least N rows exist (e.g. dishes)
+        small: Row count for the first measurement
+        large: Row count for the second measurement
+        label: Name used in the failure message
+
+    Returns:
+        Query count measured at the small size
+    """
+    grow(small)
+    with QueryRecorder(using=list(connections)) as small_recorder:
+        _render(run())
+
+    grow(large)
+    with QueryRecorder(using=list(connections)) as large_recorder:
+        _render(run())
+
+    if large_recorder.count > small_recorder.count:
+        raise AssertionError(
+            f"{label} queries grow with N: {small_recorder.count} queries for {small} "
+            f"rows, {large_recorder.count} for {large} rows\n"
+            f"{large_recorder.format_queries()}"
+        )
+    return small_recorder.count
+
+
+class QueryBudgetTestMixin:
+    """
+    Mixin for Django TestCase classes with query budget assertions
+
+    Usage:
+        class DishQueryBudgetTest(QueryBudgetTestMixin, TestCase):
+            def test_index(self):
+                controller = resolve(DishController)
+                self.assertWithinQueryBudget(controller.index, self.get_request("/dishes/"))
+    """
+
+    def assertWithinQueryBudget(
+        self, action: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run action and fail if it exceeds the budget declared with @query_budget"""
+        budget = get_declared_budget(action)
+        label = getattr(action, "__qualname__", "action")
+        with assert_max_queries(budget, label):
+            response = _render(action(*args, **kwargs))
+        return response
+
+    def assertQueriesConstant(
+        self,
+        run: Callable[[], Any],
+        grow: Callable[[int], Any],
+        small: int = 10,
+        large: int = 100,
+    ) -> int:
+        """Fail if run() executes more queries for large than for small datasets"""
+        return assert_queries_constant(run, grow, small, large)
@@ -0,0 +1,13 @@
+"""
+Core tracing module - Lightweight per-request spans
+
+Usage:
+    from core.tracing import start_trace, traced
+
+No Django dependency at import time: the decorators in
+core.decorators.nest_style wrap methods with `traced`.
+"""
+
+from .spans import Span, current_span, finish_trace, start_trace, traced
+
+__all__ = ["Span", "current_span", "finish_trace", "start_trace", "traced"]
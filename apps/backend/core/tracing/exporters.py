@@ -0,0 +1,155 @@
+"""
+Span exporters - OpenTelemetry (OTLP/JSON) compatible output
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import threading
+import urllib.request
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Optional
+
+from .spans import Span
+
+logger = logging.getLogger("core.tracing")
+
+_SPAN_KINDS = {"internal": 1, "server": 2, "client": 3}
+
+
+def _attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def span_to_otlp(span: Span) -> dict[str, Any]:
+    """Convert a span to the OTLP/JSON span representation"""
+    attributes = [_attribute("db.query_count", span.query_count)]
+    attributes += [_attribute(key, value) for key, value in span.attributes.items()]
+    data: dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "parentSpanId": span.parent_id or "",
+        "name": span.name,
+        "kind": _SPAN_KINDS.get(span.kind, 1),
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": attributes,
+        "status": {"code": 1},
+    }
+    if span.error:
+        data["status"] = {"code": 2, "message": span.error}
+    return data
+
+
+def to_otlp(spans: list[Span], service_name: str) -> dict[str, Any]:
+    """Wrap spans in an OTLP ExportTraceServiceRequest payload"""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [_attribute("service.name", service_name)]},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "core.tracing"},
+                        "spans": [span_to_otlp(span) for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class SpanExporter(ABC):
+    """Base exporter"""
+
+    def __init__(self, service_name: str):
+        self.service_name = service_name
+
+    @abstractmethod
+    def export(self, spans: list[Span]) -> None:
+        """Send the finished spans of one trace"""
+
+
+class FileSpanExporter(SpanExporter):
+    """Append one OTLP/JSON payload per trace to a JSON Lines file"""
+
+    def __init__(self, service_name: str, path: str | Path):
+        super().__init__(service_name)
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def export(self, spans: list[Span]) -> None:
+        line = json.dumps(to_otlp(spans, self.service_name), separators=(",", ":"))
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+class HttpSpanExporter(SpanExporter):
+    """
+    POST OTLP/JSON payloads to a collector (e.g. http://localhost:4318/v1/traces)
+
+    Requests are sent from a daemon thread so the request thread never waits
+    on the collector; traces are dropped when the queue is full.
+    """
+
+    def __init__(
+        self, service_name: str, url: str, timeout: float = 2.0, maxsize: int = 1000
+    ):
+        super().__init__(service_name)
+        self.url = url
+        self.timeout = timeout
+        self._queue: queue.Queue[list[Span]] = queue.Queue(maxsize=maxsize)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def export(self, spans: list[Span]) -> None:
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            logger.warning("Trace export queue full, dropping trace")
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="span-exporter", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            spans = self._queue.get()
+            body = json.dumps(to_otlp(spans, self.service_name)).encode("utf-8")
+            request = urllib.request.Request(
+                self.url,
+                data=body,
+                headers={"Content-Type": "application/json"},
+                method="POST",
+            )
+            try:
+                with urllib.request.urlopen(request, timeout=self.timeout):
+                    pass
+            except Exception as e:
+                logger.warning("Trace export to %s failed: %s", self.url, e)
+
+
+def build_exporter(
+    kind: str, service_name: str, path: str | Path, url: str
+) -> SpanExporter:
+    """Exporter selected by settings.TRACING_EXPORTER ("file" or "http")"""
+    if kind == "http":
+        return HttpSpanExporter(service_name, url)
+    return FileSpanExporter(service_name, path)
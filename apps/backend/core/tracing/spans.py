@@ -0,0 +1,124 @@
+"""
+Span model and per-request span collection
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _new_id(size: int) -> str:
+    return os.urandom(size).hex()
+
+
+@dataclass
+class Span:
+    """
+    Timed unit of work inside a trace
+
+    query_count is inclusive: queries of child spans are added to their
+    parent when the child ends.
+    """
+
+    name: str
+    trace_id: str
+    parent_id: Optional[str] = None
+    span_id: str = field(default_factory=lambda: _new_id(8))
+    kind: str = "internal"
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: int = 0
+    query_count: int = 0
+    error: Optional[str] = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1_000_000 if self.end_ns else 0.0
+
+
+@dataclass
+class Trace:
+    """Spans collected while handling one request"""
+
+    trace_id: str = field(default_factory=lambda: _new_id(16))
+    spans: list[Span] = field(default_factory=list)
+
+
+_trace: ContextVar[Optional[Trace]] = ContextVar("trace", default=None)
+_span: ContextVar[Optional[Span]] = ContextVar("span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    """Innermost open span in this context, if a trace is active"""
+    return _span.get()
+
+
+def start_trace(name: str, kind: str = "server", **attributes: Any) -> Span:
+    """Open a trace and its root span for the current context"""
+    trace = Trace()
+    root = Span(name=name, trace_id=trace.trace_id, kind=kind, attributes=attributes)
+    trace.spans.append(root)
+    _trace.set(trace)
+    _span.set(root)
+    return root
+
+
+def finish_trace() -> list[Span]:
+    """Close the active trace and return its spans (root first)"""
+    trace = _trace.get()
+    if trace is None:
+        return []
+    root = trace.spans[0]
+    if not root.end_ns:
+        root.end_ns = time.time_ns()
+    _trace.set(None)
+    _span.set(None)
+    return trace.spans
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """
+    Wrap a function in a child span of the current span
+
+    Outside an active trace the wrapper is a single ContextVar lookup.
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            parent = _span.get()
+            if parent is None:
+                return func(*args, **kwargs)
+            trace = _trace.get()
+            span = Span(name=name, trace_id=parent.trace_id, parent_id=parent.span_id)
+            if trace is not None:
+                trace.spans.append(span)
+            token = _span.set(span)
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                span.error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                span.end_ns = time.time_ns()
+                _span.reset(token)
+                parent.query_count += span.query_count
+
+        setattr(wrapper, "__traced__", name)
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def count_query() -> None:
+    """Attribute one executed statement to the innermost open span"""
+    span = _span.get()
+    if span is not None:
+        span.query_count += 1
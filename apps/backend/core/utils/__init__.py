@@ -2,6 +2,7 @@
 Core utilities module
 """
 
+from .json import FastJsonResponse, dumps
 from .text import normalize_text
 
-__all__ = ["normalize_text"]
+__all__ = ["FastJsonResponse", "dumps", "normalize_text"]
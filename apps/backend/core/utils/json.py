@@ -0,0 +1,41 @@
+"""
+Fast JSON serialization - orjson when installed, stdlib json otherwise
+"""
+
+from __future__ import annotations
+
+import json
+from decimal import Decimal
+from typing import Any
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def _default(value: Any) -> Any:
+    # orjson handles datetime/date/UUID natively; Decimal is kept exact as a string
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize to UTF-8 JSON (datetimes as ISO 8601, Decimals as strings)"""
+    if orjson is not None:
+        return orjson.dumps(data, default=_default)
+    return json.dumps(
+        data, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+class FastJsonResponse(HttpResponse):
+    """HttpResponse with a body produced by dumps()"""
+
+    def __init__(self, data: Any, **kwargs: Any):
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(content=dumps(data), **kwargs)
@@ -0,0 +1,3 @@
+"""
+Feature modules - One Django app per domain
+"""
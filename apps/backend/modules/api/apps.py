@@ -0,0 +1,12 @@
+"""
+API app configuration
+"""
+
+from django.apps import AppConfig
+
+
+class ApiConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "modules.api"
+    label = "api"
+    verbose_name = "API"
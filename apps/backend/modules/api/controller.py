@@ -0,0 +1,152 @@
+"""
+API Controllers - JSON endpoints for POS tablets, menu boards and kiosks
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Optional
+
+from django.http import HttpRequest, HttpResponse, HttpResponseNotModified
+
+from core import BadRequestException, BaseController, Controller
+from core.decorators.statement_timeout import statement_timeout
+from core.utils import FastJsonResponse
+
+from .service import CatalogService, SyncService
+
+MAX_IDS = 100
+MAX_LIMIT = 500
+
+
+def _int_param(request: HttpRequest, name: str) -> Optional[int]:
+    value = request.GET.get(name, "")
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise BadRequestException(f"Parámetro '{name}' inválido")
+
+
+def _split(value: str) -> list[str]:
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def _error(e: BadRequestException) -> FastJsonResponse:
+    return FastJsonResponse({"error": e.message}, status=e.status_code)
+
+
+@Controller("sync")
+class SyncController(BaseController):
+    """
+    Sync Controller
+    Serves menu deltas so tablets keep a local copy up to date
+    """
+
+    def __init__(self, service: SyncService):
+        self.service = service
+
+    def index(self, request: HttpRequest) -> HttpResponse:
+        """Changes since ?since=<watermark> (omit it for the first sync)"""
+        try:
+            limit = _int_param(request, "limit")
+            if limit is not None and not 1 <= limit <= 1000:
+                raise BadRequestException("Límite inválido (1-1000)")
+            data = self.service.changes(request.GET.get("since") or None, limit)
+        except BadRequestException as e:
+            return _error(e)
+
+        response = FastJsonResponse(data)
+        response["Cache-Control"] = "no-store"
+        return response
+
+
+@Controller("catalog")
+class CatalogController(BaseController):
+    """
+    Catalog Controller
+    Read API with sparse fieldsets, batch fetch by ids and ETags
+
+    Query parameters:
+        fields: comma separated projection (?fields=id,name,price)
+        ids: comma separated batch fetch (up to 100)
+        search, category, tag: same filters as the dish list
+        limit, offset: page window (limit up to 500)
+    """
+
+    def __init__(self, service: CatalogService):
+        self.service = service
+
+    @statement_timeout(2000, fallback="_timed_out")
+    def dishes(self, request: HttpRequest) -> HttpResponse:
+        """List dishes"""
+        return self._list(request, "dishes")
+
+    def categories(self, request: HttpRequest) -> HttpResponse:
+        """List categories"""
+        return self._list(request, "categories")
+
+    def tags(self, request: HttpRequest) -> HttpResponse:
+        """List food tags"""
+        return self._list(request, "tags")
+
+    def _list(self, request: HttpRequest, resource: str) -> HttpResponse:
+        try:
+            fields = self.service.resolve_fields(
+                resource, _split(request.GET.get("fields", ""))
+            )
+            ids = self._ids(request)
+            limit = _int_param(request, "limit") or 100
+            offset = _int_param(request, "offset") or 0
+            if not 1 <= limit <= MAX_LIMIT or offset < 0:
+                raise BadRequestException(f"Límite inválido (1-{MAX_LIMIT})")
+            queryset = self.service.query(
+                resource,
+                ids=ids,
+                search_query=request.GET.get("search") or None,
+                category_id=_int_param(request, "category"),
+                tag_id=_int_param(request, "tag"),
+            )
+        except BadRequestException as e:
+            return _error(e)
+
+        count, version = self.service.version(queryset)
+        etag = '"{}"'.format(
+            hashlib.blake2b(
+                f"{resource}?{request.GET.urlencode()}#{version}".encode(),
+                digest_size=16,
+            ).hexdigest()
+        )
+        if etag in request.META.get("HTTP_IF_NONE_MATCH", ""):
+            response: HttpResponse = HttpResponseNotModified()
+        else:
+            response = FastJsonResponse(
+                {
+                    "count": count,
+                    "results": self.service.rows(
+                        resource, queryset, fields, limit, offset
+                    ),
+                }
+            )
+        response["ETag"] = etag
+        response["Cache-Control"] = "no-cache"
+        return response
+
+    def _timed_out(self, request: HttpRequest) -> HttpResponse:
+        response = FastJsonResponse(
+            {"error": "La consulta tardó demasiado; reduce los filtros"}, status=503
+        )
+        response["Retry-After"] = "5"
+        return response
+
+    def _ids(self, request: HttpRequest) -> Optional[list[int]]:
+        values = _split(request.GET.get("ids", ""))
+        if not values:
+            return None
+        if len(values) > MAX_IDS:
+            raise BadRequestException(f"Máximo {MAX_IDS} ids por consulta")
+        try:
+            return [int(value) for value in values]
+        except ValueError:
+            raise BadRequestException("Parámetro 'ids' inválido")
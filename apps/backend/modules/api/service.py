@@ -0,0 +1,309 @@
+"""
+API Services - Delta sync for POS tablets and read projections of the catalog
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db.models import Count, Max, QuerySet, Sum
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from core import BadRequestException, BaseService, Injectable
+from core.base.repositories import BaseRepository
+from modules.category.repository import CategoryRepository
+from modules.category.service import CategoryService
+from modules.dish.repository import DishRepository
+from modules.dish.service import DishService
+from modules.food_tag.repository import FoodTagRepository
+from modules.food_tag.service import FoodTagService
+
+Cursor = tuple[datetime, int]
+
+TOMBSTONE_FIELDS = ("id", "updated_at", "delete_at")
+ENTITY_FIELDS = {
+    "categories": ("id", "name", "is_active", "updated_at"),
+    "food_tags": ("id", "name", "is_active", "updated_at"),
+    "dishes": (
+        "id",
+        "name",
+        "description",
+        "price",
+        "category_id",
+        "image",
+        "is_active",
+        "updated_at",
+    ),
+}
+
+
+def encode_watermark(cursors: dict[str, Cursor]) -> str:
+    """Opaque token with the (updated_at, id) cursor of each entity"""
+    data = {
+        entity: [updated_at.isoformat(), id]
+        for entity, (updated_at, id) in cursors.items()
+    }
+    raw = json.dumps(data, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_watermark(token: str) -> dict[str, Cursor]:
+    """
+    Parse a watermark returned by a previous sync
+
+    Raises:
+        BadRequestException: the token is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        data = json.loads(raw)
+        cursors: dict[str, Cursor] = {}
+        for entity, (updated_at, id) in data.items():
+            parsed = parse_datetime(updated_at)
+            if entity not in ENTITY_FIELDS or parsed is None:
+                raise ValueError(entity)
+            cursors[entity] = (parsed, int(id))
+        return cursors
+    except (binascii.Error, ValueError, TypeError, AttributeError):
+        raise BadRequestException("Marca de sincronización inválida")
+
+
+@Injectable()
+class SyncService(BaseService):
+    """
+    Rows of Dish, Category and FoodTag changed since a watermark
+
+    Each entity is paginated independently by (updated_at, id). Rows
+    updated in the last SYNC_SETTLE_SECONDS are left for the next sync, so
+    a transaction committing late with an older updated_at is not skipped.
+    """
+
+    def __init__(
+        self,
+        category_repository: CategoryRepository,
+        food_tag_repository: FoodTagRepository,
+        dish_repository: DishRepository,
+    ):
+        self.repositories: dict[str, BaseRepository[Any]] = {
+            "categories": category_repository,
+            "food_tags": food_tag_repository,
+            "dishes": dish_repository,
+        }
+        self.dish_repository = dish_repository
+
+    def changes(
+        self, watermark: Optional[str] = None, limit: Optional[int] = None
+    ) -> dict[str, Any]:
+        """
+        Changes after `watermark` (None: full snapshot without tombstones)
+
+        Returns:
+            {"watermark": "...", "has_more": bool,
+             "changes": {"categories": [...], "food_tags": [...], "dishes": [...]},
+             "deleted": {"categories": [...], ...}}
+        """
+        limit = limit or int(getattr(settings, "SYNC_PAGE_SIZE", 500))
+        cursors = decode_watermark(watermark) if watermark else {}
+        until = timezone.now() - timedelta(
+            seconds=float(getattr(settings, "SYNC_SETTLE_SECONDS", 2))
+        )
+
+        changes: dict[str, list[dict[str, Any]]] = {}
+        deleted: dict[str, list[dict[str, Any]]] = {}
+        has_more = False
+        for entity, repository in self.repositories.items():
+            updated_at, id = cursors.get(entity, (None, 0))
+            rows = list(
+                repository.find_changed_since(updated_at, id, until).values(
+                    *ENTITY_FIELDS[entity], "deleted", "delete_at"
+                )[: limit + 1]
+            )
+            if len(rows) > limit:
+                has_more = True
+                rows = rows[:limit]
+            if rows:
+                cursors[entity] = (rows[-1]["updated_at"], rows[-1]["id"])
+
+            changes[entity] = [row for row in rows if not row["deleted"]]
+            deleted[entity] = [
+                {field: row[field] for field in TOMBSTONE_FIELDS}
+                for row in rows
+                if row["deleted"]
+            ]
+            for row in changes[entity]:
+                del row["deleted"], row["delete_at"]
+
+        self._add_dish_details(changes["dishes"])
+        return {
+            "watermark": encode_watermark(cursors),
+            "has_more": has_more,
+            "changes": changes,
+            "deleted": deleted,
+        }
+
+    def _add_dish_details(self, dishes: list[dict[str, Any]]) -> None:
+        tag_ids = self.dish_repository.find_tag_ids([dish["id"] for dish in dishes])
+        for dish in dishes:
+            dish["tag_ids"] = tag_ids[dish["id"]]
+            dish["image"] = (
+                default_storage.url(dish["image"]) if dish["image"] else None
+            )
+
+
+@dataclass(frozen=True)
+class Resource:
+    """Fields a catalog resource may project (?fields=)"""
+
+    fields: tuple[str, ...]
+    default_fields: tuple[str, ...]
+
+
+CATALOG = {
+    "dishes": Resource(
+        fields=(
+            "id",
+            "name",
+            "description",
+            "price",
+            "category_id",
+            "tag_ids",
+            "image",
+            "is_active",
+            "created_at",
+            "updated_at",
+        ),
+        default_fields=(
+            "id",
+            "name",
+            "description",
+            "price",
+            "category_id",
+            "tag_ids",
+            "image",
+        ),
+    ),
+    "categories": Resource(
+        fields=("id", "name", "is_active", "created_at", "updated_at"),
+        default_fields=("id", "name"),
+    ),
+    "tags": Resource(
+        fields=("id", "name", "is_active", "created_at", "updated_at"),
+        default_fields=("id", "name"),
+    ),
+}
+# Computed after the .values() projection
+VIRTUAL_FIELDS = {"tag_ids"}
+
+
+@Injectable()
+class CatalogService(BaseService):
+    """
+    Read-only projections of dishes, categories and food tags
+
+    Rows are fetched with .values() on the requested fields only; soft
+    deleted rows are never returned.
+    """
+
+    def __init__(
+        self,
+        dish_service: DishService,
+        category_service: CategoryService,
+        food_tag_service: FoodTagService,
+        dish_repository: DishRepository,
+    ):
+        self.dish_service = dish_service
+        self.category_service = category_service
+        self.food_tag_service = food_tag_service
+        self.dish_repository = dish_repository
+
+    def resolve_fields(self, resource: str, fields: Optional[list[str]]) -> list[str]:
+        """
+        Requested fields, or the resource defaults
+
+        Raises:
+            BadRequestException: a field is not exposed by the resource
+        """
+        allowed = CATALOG[resource]
+        if not fields:
+            return list(allowed.default_fields)
+        unknown = [field for field in fields if field not in allowed.fields]
+        if unknown:
+            raise BadRequestException(
+                f"Campos inválidos: {', '.join(unknown)}. "
+                f"Disponibles: {', '.join(allowed.fields)}"
+            )
+        return list(dict.fromkeys(fields))
+
+    def query(
+        self,
+        resource: str,
+        ids: Optional[list[int]] = None,
+        search_query: Optional[str] = None,
+        category_id: Optional[int] = None,
+        tag_id: Optional[int] = None,
+    ) -> QuerySet[Any]:
+        """Filtered queryset of a resource (dish filters match the HTML list)"""
+        if resource == "dishes":
+            queryset = self.dish_service.find_filtered(
+                search_query=search_query, category_id=category_id, tag_id=tag_id
+            )
+        elif resource == "categories":
+            queryset = self.category_service.find_all()
+        else:
+            queryset = self.food_tag_service.find_all()
+        if resource != "dishes" and search_query:
+            queryset = queryset.filter(name__icontains=search_query)
+
+        queryset = queryset.filter(deleted=False)
+        if ids is not None:
+            queryset = queryset.filter(id__in=ids)
+        return queryset
+
+    def version(self, queryset: QuerySet[Any]) -> tuple[int, str]:
+        """
+        (count, version) of a result set from one aggregate query
+
+        The version changes when a row is added, removed or updated, so it
+        can back an ETag without serializing the rows.
+        """
+        stats = queryset.order_by().aggregate(
+            count=Count("id"), last=Max("updated_at"), ids=Sum("id")
+        )
+        last = stats["last"].isoformat() if stats["last"] else ""
+        return stats["count"], f"{stats['count']}:{stats['ids'] or 0}:{last}"
+
+    def rows(
+        self,
+        resource: str,
+        queryset: QuerySet[Any],
+        fields: list[str],
+        limit: int,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """Projected rows of one page"""
+        columns = [field for field in fields if field not in VIRTUAL_FIELDS]
+        if "id" not in columns:
+            columns.append("id")
+        rows = list(queryset.values(*columns)[offset : offset + limit])
+
+        if "tag_ids" in fields:
+            tag_ids = self.dish_repository.find_tag_ids([row["id"] for row in rows])
+            for row in rows:
+                row["tag_ids"] = tag_ids[row["id"]]
+        if resource == "dishes" and "image" in fields:
+            for row in rows:
+                row["image"] = (
+                    default_storage.url(row["image"]) if row["image"] else None
+                )
+        if "id" not in fields:
+            for row in rows:
+                del row["id"]
+        return rows
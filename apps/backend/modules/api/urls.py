@@ -0,0 +1,15 @@
+"""
+API URLs
+"""
+
+from django.urls import path
+from . import views
+
+app_name = "api"
+
+urlpatterns = [
+    path("sync/", views.sync, name="sync"),
+    path("dishes/", views.list_dishes, name="dishes"),
+    path("categories/", views.list_categories, name="categories"),
+    path("tags/", views.list_tags, name="tags"),
+]
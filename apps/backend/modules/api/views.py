@@ -0,0 +1,36 @@
+"""
+API views - Thin adapters to controllers
+"""
+
+from django.http import HttpRequest, HttpResponse
+from django.views.decorators.http import require_GET
+
+from core.di import provide
+from .controller import CatalogController, SyncController
+
+sync_controller = provide(SyncController)
+catalog_controller = provide(CatalogController)
+
+
+@require_GET
+def sync(request: HttpRequest) -> HttpResponse:
+    """Delta sync of dishes, categories and food tags"""
+    return sync_controller.index(request)
+
+
+@require_GET
+def list_dishes(request: HttpRequest) -> HttpResponse:
+    """Dish projections"""
+    return catalog_controller.dishes(request)
+
+
+@require_GET
+def list_categories(request: HttpRequest) -> HttpResponse:
+    """Category projections"""
+    return catalog_controller.categories(request)
+
+
+@require_GET
+def list_tags(request: HttpRequest) -> HttpResponse:
+    """Food tag projections"""
+    return catalog_controller.tags(request)
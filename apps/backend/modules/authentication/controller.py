@@ -22,8 +22,8 @@ class AuthenticationController(BaseController, MessageMixin):
     Handles HTTP requests for authentication operations
     """
 
-    def __init__(self):
-        self.service = AuthenticationService()
+    def __init__(self, service: AuthenticationService):
+        self.service = service
 
     def login_view(self, request: HttpRequest) -> HttpResponse:
         """Handle user login"""
@@ -4,10 +4,11 @@ Authentication views - Thin adapters to controller
 
 from django.http import HttpRequest, HttpResponse
 from django.contrib.auth.decorators import login_required
+from core.di import provide
 from .controller import AuthenticationController
 
 
-controller = AuthenticationController()
+controller = provide(AuthenticationController)
 
 
 def login_view(request: HttpRequest) -> HttpResponse:
@@ -2,22 +2,27 @@
 Category controller - HTTP handlers
 """
 
+import copy
+
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import render
 from django.core.paginator import Paginator
 from django.template.loader import render_to_string
-from core import BaseController, MessageMixin, PaginationMixin
+from core import BaseController, Controller, MessageMixin, PaginationMixin
+from core.decorators.query_budget import query_budget
 from core.exceptions.http import NotFoundException
 from modules.category.forms import CategoryForm
 from .service import CategoryService
 
 
+@Controller("categories")
 class CategoryController(BaseController, MessageMixin, PaginationMixin):
     """Controller for Category HTTP endpoints"""
 
-    def __init__(self):
-        self.service = CategoryService()
+    def __init__(self, service: CategoryService):
+        self.service = service
 
+    @query_budget(5)
     def index(self, request: HttpRequest) -> HttpResponse:
         """List all categories with infinite scroll support"""
         # Get search query and page from request
@@ -68,9 +73,13 @@ class CategoryController(BaseController, MessageMixin, PaginationMixin):
             },
         )
 
+    @query_budget(3)
     def show(self, request: HttpRequest, category_id: int) -> HttpResponse:
         """Show category details"""
-        category = self.service.find_one(category_id)
+        try:
+            category = self.service.find_one_with_stats(category_id)
+        except NotFoundException as e:
+            return self.error_response(request, str(e), redirect_url="category:list")
         return render(request, "category/detail.html", {"category": category})
 
     def create(self, request: HttpRequest) -> HttpResponse:
@@ -107,7 +116,11 @@ class CategoryController(BaseController, MessageMixin, PaginationMixin):
         except NotFoundException as e:
             return self.error_response(request, str(e), redirect_url="category:list")
         if request.method == "POST":
-            form = CategoryForm(request.POST, request.FILES, instance=category)
+            # ModelForm.is_valid() writes the POST into its instance: bind a
+            # copy so the identity map keeps the stored values for the service
+            form = CategoryForm(
+                request.POST, request.FILES, instance=copy.copy(category)
+            )
             if form.is_valid():
                 try:
                     updated_category = self.service.update(
@@ -136,7 +149,7 @@ class CategoryController(BaseController, MessageMixin, PaginationMixin):
     def destroy(self, request: HttpRequest, category_id: int) -> HttpResponse:
         """Delete category"""
         try:
-            category = self.service.find_one(category_id)
+            category = self.service.find_one_with_stats(category_id)
         except NotFoundException as e:
             return self.error_response(request, str(e), redirect_url="category:list")
 
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.26 on 2026-10-19 04:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("category", "0002_alter_category_table"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(fields=["updated_at", "id"], name="category_category_sync_idx"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.26 on 2026-10-19 04:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("category", "0003_category_category_category_sync_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="version",
+            field=models.PositiveIntegerField(default=1, editable=False, verbose_name="Versión"),
+        ),
+    ]
@@ -0,0 +1,8 @@
+"""
+Category reference data - Snapshot for filters, form choices and the admin
+"""
+
+from core.reference import reference_data
+from .models import Category
+
+reference_data.register("categories", Category)
@@ -5,7 +5,7 @@ Similar to TypeORM Repository in NestJS
 
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING
+from typing import Iterable, Optional, TYPE_CHECKING
 from django.db.models import QuerySet, Count, Q, Prefetch
 from core import BaseRepository, Injectable
 from .models import Category
@@ -32,6 +32,13 @@ class CategoryRepository(BaseRepository[Category]):
             .order_by("-dish_count", "name")
         )
 
+    def find_by_id_with_dish_count(self, id: int) -> Optional[Category]:
+        """Find category by ID with dish count annotation"""
+        try:
+            return self.find_all_with_dish_count().get(id=id)
+        except self.model.DoesNotExist:
+            return None
+
     def find_all_with_dishes(
         self, dishes_queryset: QuerySet[Dish]
     ) -> QuerySet[Category]:
@@ -43,6 +50,10 @@ class CategoryRepository(BaseRepository[Category]):
             .order_by("name")
         )
 
+    def find_active_by_ids(self, ids: Iterable[int]) -> QuerySet[Category]:
+        """Find active categories among the given IDs, ordered by name"""
+        return self.find_all().filter(id__in=list(ids), is_active=True).order_by("name")
+
     def search_by_name(self, query: str) -> QuerySet[Category]:
         """Search categories by name"""
         return self.find_all().filter(name__icontains=query)
@@ -5,9 +5,10 @@ Similar to NestJS Service (@Injectable())
 
 from __future__ import annotations
 
-from typing import Optional, Dict, Any, TYPE_CHECKING
+from typing import Iterable, Optional, Dict, Any, TYPE_CHECKING
 from django.db.models import QuerySet
 from core import BaseService, Injectable, NotFoundException, BadRequestException
+from core.reference import ReferenceSnapshot, reference_data
 from core.utils import normalize_text
 from .models import Category
 from .repository import CategoryRepository
@@ -23,20 +24,31 @@ class CategoryService(BaseService):
     Contains all category-related operations and validations
     """
 
-    def __init__(self):
-        self.repository = CategoryRepository()
+    def __init__(self, repository: CategoryRepository):
+        self.repository = repository
 
     # ========================================================================
     # QUERY METHODS
     # ========================================================================
 
-    def find_all(self) -> QuerySet[Category]:
-        """Get all categories"""
-        return self.repository.find_all()
+    def find_all(self, plan: Optional[str] = None) -> QuerySet[Category]:
+        """Get all categories (plan: CategoryRepository.fetch_plans, none declared yet)"""
+        return self.repository.find_all(plan)
 
-    def find_one(self, category_id: int) -> Category:
-        """Get category by ID"""
-        category = self.repository.find_by_id(category_id)
+    def find_options(self) -> ReferenceSnapshot:
+        """All categories from the cached reference data (no query while unchanged)"""
+        return reference_data.get("categories")
+
+    def find_one(self, category_id: int, plan: Optional[str] = None) -> Category:
+        """Get category by ID (plan: CategoryRepository.fetch_plans, none declared yet)"""
+        category = self.repository.find_by_id(category_id, plan)
+        if not category:
+            raise NotFoundException(f"Categoría con ID {category_id} no encontrada")
+        return category
+
+    def find_one_with_stats(self, category_id: int) -> Category:
+        """Get category by ID with dish count statistics"""
+        category = self.repository.find_by_id_with_dish_count(category_id)
         if not category:
             raise NotFoundException(f"Categoría con ID {category_id} no encontrada")
         return category
@@ -89,6 +101,10 @@ class CategoryService(BaseService):
         """Get categories with specific dishes preloaded"""
         return self.repository.find_all_with_dishes(dishes_queryset)
 
+    def find_active_by_ids(self, category_ids: Iterable[int]) -> QuerySet[Category]:
+        """Get active categories among the given IDs"""
+        return self.repository.find_active_by_ids(category_ids)
+
     # ========================================================================
     # MUTATION METHODS
     # ========================================================================
@@ -104,7 +120,9 @@ class CategoryService(BaseService):
                 f"Ya existe una categoría con el nombre '{data['name']}'"
             )
 
-        return self.repository.create(**data)
+        category = self.repository.create(**data)
+        self.repository.flush()
+        return category
 
     def update(self, category_id: int, data: Dict[str, Any]) -> Category:
         """
@@ -126,6 +144,7 @@ class CategoryService(BaseService):
         if not updated_category:
             raise NotFoundException(f"Categoría con ID {category_id} no encontrada")
 
+        self.repository.flush()
         return updated_category
 
     def delete(self, category_id: int) -> bool:
@@ -143,7 +162,9 @@ class CategoryService(BaseService):
             )
 
         # Perform soft delete
-        return self.repository.delete(category_id)
+        deleted = self.repository.delete(category_id)
+        self.repository.flush()
+        return deleted
 
     # ========================================================================
     # STATISTICS
@@ -0,0 +1,58 @@
+"""
+Category query budget tests - Query counts must not grow with the number of rows
+"""
+
+from __future__ import annotations
+
+from core.testing.fixtures import grow_categories, grow_category_dishes
+from core.testing.queries import QueryBudgetTestMixin, get_declared_budget
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from modules.category.admin import CategoryAdmin
+from modules.category.controller import CategoryController
+from modules.category.models import Category
+
+
+@override_settings(QUERY_BUDGET_MODE="raise")
+class CategoryQueryBudgetTest(QueryBudgetTestMixin, TestCase):
+    """Each budgeted category view stays within its budget for N and 10N rows"""
+
+    def setUp(self) -> None:
+        user = User.objects.create_superuser("staff", password="x")
+        self.client.force_login(user)
+
+    def get(self, url: str, **headers: str) -> object:
+        response = self.client.get(url, **headers)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_budgets_are_declared(self) -> None:
+        for action in (
+            CategoryController.index,
+            CategoryController.show,
+            CategoryAdmin.changelist_view,
+        ):
+            self.assertGreater(get_declared_budget(action), 0)
+
+    def test_index(self) -> None:
+        url = reverse("category:list")
+        self.assertQueriesConstant(lambda: self.get(url), grow_categories)
+
+    def test_index_infinite_scroll(self) -> None:
+        url = reverse("category:list") + "?page=2"
+        self.assertQueriesConstant(
+            lambda: self.get(url, HTTP_X_REQUESTED_WITH="XMLHttpRequest"),
+            lambda count: grow_categories(count + 12),
+        )
+
+    def test_show(self) -> None:
+        category = Category.objects.create(name="Entrantes")
+        url = reverse("category:detail", kwargs={"category_id": category.pk})
+        self.assertQueriesConstant(
+            lambda: self.get(url), lambda count: grow_category_dishes(category, count)
+        )
+
+    def test_admin_changelist(self) -> None:
+        url = reverse("admin:category_category_changelist")
+        self.assertQueriesConstant(lambda: self.get(url), grow_categories)
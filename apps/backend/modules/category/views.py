@@ -4,10 +4,11 @@ Category views - Thin adapters to controller
 
 from django.contrib.auth.decorators import login_required
 from django.http import HttpRequest, HttpResponse
+from core.di import provide
 from .controller import CategoryController
 
 
-controller = CategoryController()
+controller = provide(CategoryController)
 
 
 def list_categories(request: HttpRequest) -> HttpResponse:
@@ -2,14 +2,29 @@
 Dish admin configuration
 """
 
+from typing import Any
 from django.contrib import admin
+from django.http import HttpRequest, HttpResponse
+from core.decorators.query_budget import query_budget
+from core.di import resolve
+from core.reference.admin import reference_list_filter
+from core.reference.forms import use_reference_choices
+from django.db.models import QuerySet
 from .models import Dish
+from .repository import DishRepository
+from .service import DishService
 
 
 @admin.register(Dish)
 class DishAdmin(admin.ModelAdmin):  # type: ignore
     list_display = ["name", "category", "price", "is_active", "created_at"]
-    list_filter = ["category", "tags", "is_active", "created_at"]
+    list_select_related = ["category"]
+    list_filter = [
+        ("category", reference_list_filter("categories")),
+        ("tags", reference_list_filter("food_tags")),
+        "is_active",
+        "created_at",
+    ]
     search_fields = ["name", "description"]
     filter_horizontal = ["tags"]
     readonly_fields = ["created_at", "updated_at"]
@@ -23,3 +38,40 @@ class DishAdmin(admin.ModelAdmin):  # type: ignore
             {"fields": ("created_at", "updated_at"), "classes": ("collapse",)},
         ),
     )
+
+    def formfield_for_foreignkey(
+        self, db_field: Any, request: HttpRequest, **kwargs: Any
+    ) -> Any:
+        formfield = super().formfield_for_foreignkey(db_field, request, **kwargs)
+        if db_field.name == "category":
+            use_reference_choices(formfield, "categories")
+        return formfield
+
+    def formfield_for_manytomany(
+        self, db_field: Any, request: HttpRequest, **kwargs: Any
+    ) -> Any:
+        formfield = super().formfield_for_manytomany(db_field, request, **kwargs)
+        if db_field.name == "tags":
+            use_reference_choices(formfield, "food_tags")
+        return formfield
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet[Dish]:
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        if match is not None and match.url_name == "dish_dish_changelist":
+            # Only the list_display columns; change forms load every field
+            queryset = resolve(DishRepository).with_plan(queryset, "admin_row")
+        return queryset
+
+    def save_model(
+        self, request: HttpRequest, obj: Dish, form: Any, change: bool
+    ) -> None:
+        super().save_model(request, obj, form, change)
+        if "image" in form.changed_data:
+            resolve(DishService).schedule_image_renditions(obj)
+
+    @query_budget(6)
+    def changelist_view(
+        self, request: HttpRequest, extra_context: dict[str, Any] | None = None
+    ) -> HttpResponse:
+        return super().changelist_view(request, extra_context)
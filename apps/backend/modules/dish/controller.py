@@ -4,7 +4,9 @@ Dish Controller - HTTP request handler for Dish
 
 from __future__ import annotations
 
-from typing import Dict, Any
+import copy
+from typing import Dict, Any, Iterable, Optional
+from django.contrib import messages
 from django.shortcuts import render
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.core.paginator import Paginator
@@ -19,11 +21,14 @@ from core import (
     FilterMixin,
     NotFoundException,
 )
+from core.decorators.query_budget import query_budget
+from core.decorators.statement_timeout import statement_timeout
 
 from .forms import DishForm
+from .projections import DishCard
 from .service import DishService
 from modules.category.service import CategoryService
-from modules.food_tag.models import FoodTag
+from modules.food_tag.service import FoodTagService
 
 
 @Controller("dishes")
@@ -33,51 +38,118 @@ class DishController(BaseController, MessageMixin, PaginationMixin, FilterMixin)
     Handles HTTP requests for dish operations
     """
 
-    def __init__(self):
-        self.service = DishService()
-        self.category_service = CategoryService()
+    def __init__(
+        self,
+        service: DishService,
+        category_service: CategoryService,
+        food_tag_service: FoodTagService,
+    ):
+        self.service = service
+        self.category_service = category_service
+        self.food_tag_service = food_tag_service
 
+    @statement_timeout(2000, fallback="_index_timed_out")
+    @query_budget(10)
     def index(self, request: HttpRequest) -> HttpResponse:
         """List all dishes with filters and infinite scroll support"""
         # Get filters from request
         search_query = request.GET.get("search", "")
         category_id = request.GET.get("category", "")
         tag_id = request.GET.get("tag", "")
-        page = request.GET.get("page", 1)
 
-        # Apply filters
-        dishes = self.service.find_filtered(
+        # Apply filters and project the dishes once (single query)
+        cards = self.service.find_listing(
             search_query=search_query if search_query else None,
             category_id=int(category_id) if category_id else None,
             tag_id=int(tag_id) if tag_id else None,
         )
 
-        # Get all categories with dishes for this queryset
-        categories = self.category_service.find_all_with_dishes(dishes)
-
-        # Get uncategorized dishes
-        uncategorized_dishes = list(dishes.filter(category__isnull=True))
-
-        # Create a list of "sections" (category + dishes or uncategorized)
-        sections = []
-        for category in categories:
-            # Only add sections that have dishes
-            category_dishes = list(category.dishes.all())
-            if category_dishes:
-                sections.append(
-                    {
-                        "type": "category",
-                        "category": category,
-                        "dishes": category_dishes,
-                    }
-                )
+        # Group them by category
+        dishes_by_category = self._group_by_category(cards)
+        categories = self.category_service.find_active_by_ids(
+            key for key in dishes_by_category if key is not None
+        )
+        return self._render_index(
+            request, self._build_sections(dishes_by_category, categories)
+        )
+
+    def _index_timed_out(self, request: HttpRequest) -> HttpResponse:
+        """
+        Degraded index: the last listing cached for the same filters, built
+        without queries (categories come from the reference data snapshot)
+        """
+        search_query = request.GET.get("search", "")
+        category_id = request.GET.get("category", "")
+        tag_id = request.GET.get("tag", "")
+        cards = self.service.find_cached_listing(
+            search_query=search_query if search_query else None,
+            category_id=int(category_id) if category_id else None,
+            tag_id=int(tag_id) if tag_id else None,
+        )
 
+        dishes_by_category = self._group_by_category(cards or [])
+        categories = [
+            category
+            for category in self.category_service.find_options().available
+            if category.id in dishes_by_category
+        ]
+        sections = self._build_sections(dishes_by_category, categories)
+
+        if cards is None and (search_query or category_id or tag_id):
+            message = (
+                "La búsqueda tardó demasiado y se canceló. "
+                "Prueba con un término más corto o con menos filtros."
+            )
+        elif cards is None:
+            message = (
+                "El menú tardó demasiado en cargar. "
+                "Inténtalo de nuevo en unos segundos."
+            )
+        else:
+            message = (
+                "La búsqueda tardó demasiado; se muestran los últimos resultados "
+                "guardados, que pueden no estar actualizados."
+            )
+        return self._render_index(request, sections, warning=message)
+
+    @staticmethod
+    def _group_by_category(
+        cards: Iterable[DishCard],
+    ) -> Dict[Optional[int], list[DishCard]]:
+        dishes_by_category: Dict[Optional[int], list[DishCard]] = {}
+        for card in cards:
+            dishes_by_category.setdefault(card.category_id, []).append(card)
+        return dishes_by_category
+
+    @staticmethod
+    def _build_sections(
+        dishes_by_category: Dict[Optional[int], list[DishCard]],
+        categories: Iterable[Any],
+    ) -> list[Dict[str, Any]]:
+        """Create a list of "sections" (category + dishes or uncategorized)"""
+        sections: list[Dict[str, Any]] = [
+            {
+                "type": "category",
+                "category": category,
+                "dishes": dishes_by_category[category.id],
+            }
+            for category in categories
+        ]
+        uncategorized_dishes = dishes_by_category.get(None)
         if uncategorized_dishes:
             sections.append({"type": "uncategorized", "dishes": uncategorized_dishes})
+        return sections
 
+    def _render_index(
+        self,
+        request: HttpRequest,
+        sections: list[Dict[str, Any]],
+        warning: Optional[str] = None,
+    ) -> HttpResponse:
+        """Page of sections: full page, or HTML fragment for infinite scroll"""
         # Paginate sections instead of individual dishes
         paginator = Paginator(sections, 3)  # 3 sections (categories) per page
-        paginated_sections = paginator.get_page(page)
+        paginated_sections = paginator.get_page(request.GET.get("page", 1))
 
         # Check if this is an AJAX request for infinite scroll
         is_ajax = request.headers.get("X-Requested-With") == "XMLHttpRequest"
@@ -91,39 +163,44 @@ class DishController(BaseController, MessageMixin, PaginationMixin, FilterMixin)
                 },
                 request=request,
             )
-            return JsonResponse(
-                {
-                    "html": html,
-                    "has_next": paginated_sections.has_next(),
-                    "next_page": (
-                        paginated_sections.next_page_number()
-                        if paginated_sections.has_next()
-                        else None
-                    ),
-                }
-            )
+            data: Dict[str, Any] = {
+                "html": html,
+                "has_next": paginated_sections.has_next(),
+                "next_page": (
+                    paginated_sections.next_page_number()
+                    if paginated_sections.has_next()
+                    else None
+                ),
+            }
+            if warning:
+                data["message"] = warning
+            return JsonResponse(data)
+
+        if warning:
+            messages.warning(request, warning)
 
         # Regular page load
         # Get all categories and tags for filters
-        all_categories = self.category_service.find_all()
-        all_tags = FoodTag.objects.all()
+        all_categories = self.category_service.find_options()
+        all_tags = self.food_tag_service.find_options()
 
         context: Dict[str, Any] = {
             "sections": paginated_sections,
             "all_categories": all_categories,
             "all_tags": all_tags,
-            "search_query": search_query,
-            "category_filter": category_id,
-            "tag_filter": tag_id,
+            "search_query": request.GET.get("search", ""),
+            "category_filter": request.GET.get("category", ""),
+            "tag_filter": request.GET.get("tag", ""),
             "has_next": paginated_sections.has_next(),
         }
 
         return render(request, "dish/list.html", context)
 
+    @query_budget(4)
     def show(self, request: HttpRequest, dish_id: int) -> HttpResponse:
         """Show dish details"""
         try:
-            dish = self.service.find_one(dish_id)
+            dish = self.service.find_one(dish_id, plan="detail")
             return render(request, "dish/detail.html", {"dish": dish})
         except NotFoundException as e:
             return self.error_response(request, str(e), redirect_url="dish:list")
@@ -154,15 +231,18 @@ class DishController(BaseController, MessageMixin, PaginationMixin, FilterMixin)
             },
         )
 
+    @query_budget(12)
     def update(self, request: HttpRequest, dish_id: int) -> HttpResponse:
         """Update dish"""
         try:
-            dish = self.service.find_one(dish_id)
+            dish = self.service.find_one(dish_id, plan="form")
         except NotFoundException as e:
             return self.error_response(request, str(e), redirect_url="dish:list")
 
         if request.method == "POST":
-            form = DishForm(request.POST, request.FILES, instance=dish)
+            # ModelForm.is_valid() writes the POST into its instance: bind a
+            # copy so the identity map keeps the stored values for the service
+            form = DishForm(request.POST, request.FILES, instance=copy.copy(dish))
             if form.is_valid():
                 try:
                     updated_dish = self.service.update(dish_id, form.cleaned_data)
@@ -188,7 +268,7 @@ class DishController(BaseController, MessageMixin, PaginationMixin, FilterMixin)
     def destroy(self, request: HttpRequest, dish_id: int) -> HttpResponse:
         """Delete dish"""
         try:
-            dish = self.service.find_one(dish_id)
+            dish = self.service.find_one(dish_id, plan="card")
         except NotFoundException as e:
             return self.error_response(request, str(e), redirect_url="dish:list")
 
@@ -6,7 +6,9 @@ from typing import Any
 from django import forms
 from django.forms import Widget
 from core.base.forms import BaseModelForm, BaseSearchForm
-from .models import Dish, Category
+from core.reference import reference_data
+from core.reference.forms import use_reference_choices
+from .models import Dish
 
 
 class DishForm(BaseModelForm):
@@ -20,6 +22,11 @@ class DishForm(BaseModelForm):
             "tags": forms.CheckboxSelectMultiple(),
         }
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        use_reference_choices(self.fields["category"], "categories")
+        use_reference_choices(self.fields["tags"], "food_tags")
+
 
 class DishSearchForm(BaseSearchForm):
     """Form for searching dishes"""
@@ -32,7 +39,7 @@ class DishSearchForm(BaseSearchForm):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
 
-        categories = Category.objects.all()
+        categories = reference_data.get("categories")
         category_field = self.fields["category"]
         if isinstance(category_field, forms.ChoiceField):
             category_field.choices = [("", "Todas las categorías")] + [
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.26 on 2026-10-19 03:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dish", "0002_alter_dish_table"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dish",
+            name="image_renditions",
+            field=models.JSONField(
+                blank=True, default=dict, editable=False, verbose_name="Variantes de imagen"
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.26 on 2026-10-19 03:57
+
+import core.files.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dish", "0003_dish_image_renditions"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="dish",
+            name="image",
+            field=models.ImageField(
+                blank=True,
+                null=True,
+                storage=core.files.storage.content_addressed_storage,
+                upload_to="dishes/",
+                verbose_name="Imagen",
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.26 on 2026-10-19 04:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dish", "0004_dish_image_content_addressed"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="dish",
+            index=models.Index(fields=["updated_at", "id"], name="dish_dish_sync_idx"),
+        ),
+    ]
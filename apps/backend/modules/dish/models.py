@@ -9,6 +9,7 @@ from django.urls import reverse_lazy
 from django.core.validators import MinValueValidator
 
 from core.base.models import NamedModel
+from core.files.storage import content_addressed_storage
 from modules.category.models import Category
 from modules.food_tag.models import FoodTag
 
@@ -30,10 +31,18 @@ class Dish(NamedModel):
     )
     image = models.ImageField(
         upload_to="dishes/",
+        storage=content_addressed_storage,
         blank=True,
         null=True,
         verbose_name="Imagen",
     )
+    # Sized WebP/JPEG variants and LQIP of `image` (core.images)
+    image_renditions = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name="Variantes de imagen",
+    )
     category: models.ForeignKey[Category] = models.ForeignKey(
         "category.Category",
         on_delete=models.SET_NULL,
@@ -0,0 +1,39 @@
+"""
+Dish projections - Compact read models for list views
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Optional
+
+from django.utils.text import Truncator
+
+SUMMARY_WORDS = 15
+# Only this many characters of the description are read from the database
+SUMMARY_SOURCE_CHARS = 300
+
+
+@dataclass(frozen=True, slots=True)
+class DishCard:
+    """What a dish card renders, built from one .values() row"""
+
+    id: int
+    name: str
+    summary: str
+    price: Decimal
+    category_id: Optional[int]
+    image: str
+    image_renditions: dict[str, Any]
+    tag_names: tuple[str, ...]
+
+
+def summarize(text: str, source_chars: int = SUMMARY_SOURCE_CHARS) -> str:
+    """Same output as |truncatewords:15 on a prefix of the description"""
+    if len(text) >= source_chars:
+        # The prefix may end mid-word: drop the partial word, keep the ellipsis
+        words = text.split()[:-1]
+        if len(words) <= SUMMARY_WORDS:
+            return " ".join(words) + " …"
+    return Truncator(text).words(SUMMARY_WORDS, truncate=" …")
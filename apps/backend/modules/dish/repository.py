@@ -5,10 +5,19 @@ Similar to TypeORM Repository in NestJS
 
 from __future__ import annotations
 
-from typing import Optional
-from django.db.models import QuerySet, Q
+from typing import Any, Optional
+from django.db.models import F, Prefetch, Q, QuerySet
+from django.db.models.fields.json import KT
+from django.db.models.functions import Left
 from core import BaseRepository, Injectable
+from core.base.repositories import FetchPlan
+from core.db.aggregates import GroupConcat
+from modules.food_tag.models import FoodTag
 from .models import Dish
+from .projections import SUMMARY_SOURCE_CHARS, DishCard, summarize
+
+# Separator of aggregated tag names (cannot appear in a name typed in a form)
+_TAG_SEPARATOR = "\x1f"
 
 
 @Injectable()
@@ -18,13 +27,31 @@ class DishRepository(BaseRepository[Dish]):
     Handles all database operations for dishes
     """
 
+    fetch_plans = {
+        # Delete confirmation card: name, price, image and category name
+        "card": FetchPlan(
+            select_related=("category",),
+            only=("name", "price", "image", "category__name"),
+        ),
+        # Detail page: every column, category joined, tags prefetched
+        "detail": FetchPlan(
+            select_related=("category",),
+            prefetch_related=(
+                Prefetch("tags", queryset=FoodTag.objects.only("id", "name")),
+            ),
+        ),
+        # Edit form: initial tag selection comes from the prefetch cache
+        "form": FetchPlan(prefetch_related=("tags",)),
+        # Admin changelist columns (list_display)
+        "admin_row": FetchPlan(
+            select_related=("category",),
+            only=("name", "price", "is_active", "created_at", "category__name"),
+        ),
+    }
+
     def __init__(self):
         super().__init__(Dish)
 
-    def find_all_with_relations(self) -> QuerySet[Dish]:
-        """Find all dishes with related data preloaded"""
-        return self.find_all().prefetch_related("tags", "category")
-
     def find_by_category(self, category_id: int) -> QuerySet[Dish]:
         """Find all dishes by category"""
         return self.find_all().filter(category_id=category_id)
@@ -53,3 +80,81 @@ class DishRepository(BaseRepository[Dish]):
         if exclude_id:
             queryset = queryset.exclude(pk=exclude_id)
         return queryset.exists()
+
+    def find_missing_renditions(self) -> QuerySet[Dish]:
+        """Find dishes whose image has no renditions for its current file"""
+        return (
+            self.find_all()
+            .exclude(image="")
+            .exclude(image__isnull=True)
+            .annotate(rendition_source=KT("image_renditions__source"))
+            .filter(Q(rendition_source__isnull=True) | ~Q(rendition_source=F("image")))
+        )
+
+    def save_image_renditions(
+        self, id: int, image_name: str, renditions: dict[str, Any]
+    ) -> bool:
+        """Store renditions unless the image was replaced meanwhile"""
+        return bool(
+            self.model.objects.filter(pk=id, image=image_name).update(
+                image_renditions=renditions
+            )
+        )
+
+    def find_tag_ids(self, dish_ids: list[int]) -> dict[int, list[int]]:
+        """Tag IDs of several dishes in one query on the M2M table"""
+        tag_ids: dict[int, list[int]] = {dish_id: [] for dish_id in dish_ids}
+        rows = self.model.tags.through.objects.filter(dish_id__in=dish_ids)
+        for dish_id, food_tag_id in rows.values_list("dish_id", "foodtag_id"):
+            tag_ids[dish_id].append(food_tag_id)
+        return tag_ids
+
+    def find_cards(self, queryset: QuerySet[Dish]) -> list[DishCard]:
+        """
+        Project dishes to DishCard from a single query
+        Tag names are aggregated in SQL; only a prefix of the description is read
+        """
+        # Re-select by pk: a tag filter on `queryset` would otherwise restrict
+        # the aggregated tag names to the filtered tag
+        rows = (
+            self.model.objects.filter(pk__in=queryset.order_by().values("pk"))
+            .annotate(
+                summary_source=Left("description", SUMMARY_SOURCE_CHARS),
+                tag_list=GroupConcat("tags__name", _TAG_SEPARATOR),
+            )
+            .values_list(
+                "id",
+                "name",
+                "summary_source",
+                "price",
+                "category_id",
+                "image",
+                "image_renditions",
+                "tag_list",
+            )
+            .order_by("name", "id")
+        )
+        return [
+            DishCard(
+                id=id,
+                name=name,
+                summary=summarize(summary_source or ""),
+                price=price,
+                category_id=category_id,
+                image=image or "",
+                image_renditions=image_renditions,
+                tag_names=tuple(
+                    sorted(tag_list.split(_TAG_SEPARATOR)) if tag_list else ()
+                ),
+            )
+            for (
+                id,
+                name,
+                summary_source,
+                price,
+                category_id,
+                image,
+                image_renditions,
+                tag_list,
+            ) in rows
+        ]
@@ -5,14 +5,25 @@ Similar to NestJS Service (@Injectable())
 
 from __future__ import annotations
 
+import hashlib
 from typing import Optional, Dict, Any
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import QuerySet
 from core import BaseService, Injectable, NotFoundException, BadRequestException
+from core.db.timeouts import check_deadline
+from core.images import generate_renditions
+from core.jobs import job
 from core.utils import normalize_text
 from .models import Dish
+from .projections import DishCard
 from .repository import DishRepository
 
 
+# Seconds the last listing of each filter combination is kept for degraded pages
+LISTING_CACHE_TIMEOUT = 600
+
+
 # Lazy imports to avoid circular dependencies
 def _get_category_model():
     from modules.category.models import Category
@@ -20,12 +31,6 @@ def _get_category_model():
     return Category
 
 
-def _get_food_tag_model():
-    from modules.food_tag.models import FoodTag
-
-    return FoodTag
-
-
 @Injectable()
 class DishService(BaseService):
     """
@@ -33,20 +38,20 @@ class DishService(BaseService):
     Contains all dish-related operations and validations
     """
 
-    def __init__(self):
-        self.repository = DishRepository()
+    def __init__(self, repository: DishRepository):
+        self.repository = repository
 
     # ========================================================================
     # QUERY METHODS
     # ========================================================================
 
-    def find_all(self) -> QuerySet[Dish]:
-        """Get all dishes with relations"""
-        return self.repository.find_all_with_relations()
+    def find_all(self, plan: Optional[str] = None) -> QuerySet[Dish]:
+        """Get all dishes (plan: DishRepository.fetch_plans)"""
+        return self.repository.find_all(plan)
 
-    def find_one(self, dish_id: int) -> Dish:
-        """Get dish by ID"""
-        dish = self.repository.find_by_id(dish_id)
+    def find_one(self, dish_id: int, plan: Optional[str] = None) -> Dish:
+        """Get dish by ID (plan: DishRepository.fetch_plans)"""
+        dish = self.repository.find_by_id(dish_id, plan)
         if not dish:
             raise NotFoundException(f"Plato con ID {dish_id} no encontrado")
         return dish
@@ -56,29 +61,33 @@ class DishService(BaseService):
         search_query: Optional[str] = None,
         category_id: Optional[int] = None,
         tag_id: Optional[int] = None,
+        plan: Optional[str] = None,
     ) -> QuerySet[Dish]:
         """
         Get filtered dishes
         Applies multiple filters based on provided parameters
         """
-        queryset = self.repository.find_all_with_relations()
+        queryset = self.repository.find_all(plan)
 
         if search_query:
             # Normalize search query for accent-insensitive search
             normalized_query = normalize_text(search_query)
 
-            # Get all dishes and filter in Python for accent-insensitive search
-            all_dishes = list(queryset)
-            filtered_dishes = [
-                dish
-                for dish in all_dishes
-                if normalized_query in normalize_text(dish.name)
-                or normalized_query in normalize_text(dish.description or "")
-            ]
+            # Filter in Python for accent-insensitive search, reading only the
+            # searchable columns so relations are not prefetched for every row;
+            # an action's statement timeout also bounds this loop
+            dish_ids: list[int] = []
+            for dish_id, name, description in queryset.values_list(
+                "id", "name", "description"
+            ):
+                check_deadline()
+                if normalized_query in normalize_text(name):
+                    dish_ids.append(dish_id)
+                elif normalized_query in normalize_text(description or ""):
+                    dish_ids.append(dish_id)
 
             # Convert back to queryset by getting the IDs
-            if filtered_dishes:
-                dish_ids = [dish.id for dish in filtered_dishes]
+            if dish_ids:
                 queryset = queryset.filter(id__in=dish_ids)
             else:
                 # Return empty queryset
@@ -92,6 +101,47 @@ class DishService(BaseService):
 
         return queryset
 
+    def find_cards(self, queryset: QuerySet[Dish]) -> list[DishCard]:
+        """Get list-view projections of the given dishes"""
+        return self.repository.find_cards(queryset)
+
+    def find_listing(
+        self,
+        search_query: Optional[str] = None,
+        category_id: Optional[int] = None,
+        tag_id: Optional[int] = None,
+    ) -> list[DishCard]:
+        """
+        Cards of the filtered dishes
+        The result is cached per filter combination for find_cached_listing()
+        """
+        cards = self.find_cards(
+            self.find_filtered(search_query, category_id, tag_id)
+        )
+        cache.set(
+            self._listing_key(search_query, category_id, tag_id),
+            cards,
+            LISTING_CACHE_TIMEOUT,
+        )
+        return cards
+
+    def find_cached_listing(
+        self,
+        search_query: Optional[str] = None,
+        category_id: Optional[int] = None,
+        tag_id: Optional[int] = None,
+    ) -> Optional[list[DishCard]]:
+        """Last listing computed for these filters (may be stale), without queries"""
+        return cache.get(self._listing_key(search_query, category_id, tag_id))
+
+    @staticmethod
+    def _listing_key(
+        search_query: Optional[str], category_id: Optional[int], tag_id: Optional[int]
+    ) -> str:
+        search = normalize_text(search_query or "").strip()
+        digest = hashlib.sha1(search.encode()).hexdigest()
+        return f"dish:listing:{category_id or ''}:{tag_id or ''}:{digest}"
+
     def find_by_category(self, category_id: int) -> QuerySet[Dish]:
         """Get dishes by category"""
         return self.repository.find_by_category(category_id)
@@ -104,6 +154,7 @@ class DishService(BaseService):
     # MUTATION METHODS
     # ========================================================================
 
+    @transaction.atomic
     def create(self, data: Dict[str, Any]) -> Dish:
         """
         Create new dish
@@ -129,18 +180,17 @@ class DishService(BaseService):
 
         # Add tags if provided
         if tags:
-            from typing import cast
-
-            FoodTag = _get_food_tag_model()
-
-            dish.tags.set(cast(list[FoodTag], tags))  # type: ignore[misc]
+            self.repository.set_related(dish, "tags", tags)
 
+        self.repository.flush()
+        self.schedule_image_renditions(dish)
         return dish
 
+    @transaction.atomic
     def update(self, dish_id: int, data: Dict[str, Any]) -> Dish:
         """
         Update dish
-        Validates data before update
+        Validates data before update; tag changes roll back on a version conflict
         """
         # Check if dish exists
         dish = self.find_one(dish_id)
@@ -160,20 +210,21 @@ class DishService(BaseService):
             ).exists():
                 raise BadRequestException("Categoría inválida")
 
-        # Update tags if provided
-        tags = data.pop("tags", None)
-        if tags is not None:
-            from typing import cast
-
-            FoodTag = _get_food_tag_model()
-
-            dish.tags.set(cast(list[FoodTag], tags))  # type: ignore[misc]
-
         # Update dish
+        tags = data.pop("tags", None)
         updated_dish = self.repository.update(dish_id, **data)
         if not updated_dish:
             raise NotFoundException(f"Plato con ID {dish_id} no encontrado")
 
+        # Update tags if provided (written with the fields under a unit of work)
+        if tags is not None:
+            self.repository.set_related(updated_dish, "tags", tags)
+
+        # Conflicts surface here, before the controller builds its response;
+        # the rendition job also reads the stored file name from the database
+        self.repository.flush()
+        if "image" in data:
+            self.schedule_image_renditions(updated_dish)
         return updated_dish
 
     def delete(self, dish_id: int) -> bool:
@@ -184,15 +235,46 @@ class DishService(BaseService):
         self.find_one(dish_id)
 
         # Perform soft delete
-        return self.repository.delete(dish_id)
+        deleted = self.repository.delete(dish_id)
+        self.repository.flush()
+        return deleted
 
     def toggle_active(self, dish_id: int) -> Dish:
         """Toggle dish active status"""
         dish = self.find_one(dish_id)
         dish.is_active = not dish.is_active
-        dish.save()
+        self.repository.save(dish)
+        self.repository.flush()
         return dish
 
+    # ========================================================================
+    # IMAGE RENDITIONS
+    # ========================================================================
+
+    def schedule_image_renditions(self, dish: Dish) -> None:
+        """Enqueue the image renditions (core.jobs, "images" queue)"""
+        if dish.image and dish.image_renditions.get("source") != dish.image.name:
+            self.generate_image_renditions.delay(
+                dish.pk,
+                dish.image.name,
+                dedup_key=f"renditions:{dish.pk}:{dish.image.name}",
+            )
+
+    @job(queue="images", max_attempts=5)
+    def generate_image_renditions(
+        self, dish_id: int, image_name: str, force: bool = False
+    ) -> bool:
+        """
+        Write sized WebP/JPEG variants and the LQIP of a dish image
+        Returns False when the image was replaced while processing
+        """
+        renditions = generate_renditions(image_name, force=force)
+        return self.repository.save_image_renditions(dish_id, image_name, renditions)
+
+    def find_missing_renditions(self) -> QuerySet[Dish]:
+        """Get dishes with an image but no renditions for it"""
+        return self.repository.find_missing_renditions()
+
     # ========================================================================
     # STATISTICS AND AGGREGATIONS
     # ========================================================================
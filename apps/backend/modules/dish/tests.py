@@ -0,0 +1,80 @@
+"""
+Dish query budget tests - Query counts must not grow with the number of rows
+"""
+
+from __future__ import annotations
+
+from core.testing.fixtures import grow_dish_tags, grow_dishes
+from core.testing.queries import QueryBudgetTestMixin, get_declared_budget
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from modules.dish.admin import DishAdmin
+from modules.dish.controller import DishController
+from modules.dish.models import Dish
+
+
+@override_settings(QUERY_BUDGET_MODE="raise")
+class DishQueryBudgetTest(QueryBudgetTestMixin, TestCase):
+    """Each budgeted dish view stays within its budget for N and 10N rows"""
+
+    def setUp(self) -> None:
+        user = User.objects.create_superuser("staff", password="x")
+        self.client.force_login(user)
+
+    def get(self, url: str, **headers: str) -> object:
+        response = self.client.get(url, **headers)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_budgets_are_declared(self) -> None:
+        for action in (
+            DishController.index,
+            DishController.show,
+            DishController.update,
+            DishAdmin.changelist_view,
+        ):
+            self.assertGreater(get_declared_budget(action), 0)
+
+    def test_index(self) -> None:
+        url = reverse("dish:list")
+        self.assertQueriesConstant(lambda: self.get(url), grow_dishes)
+
+    def test_index_infinite_scroll(self) -> None:
+        url = reverse("dish:list") + "?page=2"
+        self.assertQueriesConstant(
+            lambda: self.get(url, HTTP_X_REQUESTED_WITH="XMLHttpRequest"),
+            lambda count: grow_dishes(count + 12),
+        )
+
+    def test_index_filtered(self) -> None:
+        grow_dishes(1)
+        dish = Dish.objects.get()
+        url = f"{reverse('dish:list')}?search=plato&tag={dish.tags.first().pk}"
+        self.assertQueriesConstant(lambda: self.get(url), grow_dishes)
+
+    def test_show(self) -> None:
+        grow_dishes(1)
+        dish = Dish.objects.get()
+        url = reverse("dish:detail", kwargs={"dish_id": dish.pk})
+        self.assertQueriesConstant(
+            lambda: self.get(url), lambda count: grow_dish_tags(dish, count)
+        )
+
+    def test_update_form(self) -> None:
+        grow_dishes(1)
+        dish = Dish.objects.get()
+        url = reverse("dish:update", kwargs={"dish_id": dish.pk})
+        self.assertQueriesConstant(
+            lambda: self.get(url), lambda count: grow_dish_tags(dish, count)
+        )
+
+    def test_update_form_options(self) -> None:
+        grow_dishes(1)
+        dish = Dish.objects.get()
+        url = reverse("dish:update", kwargs={"dish_id": dish.pk})
+        self.assertQueriesConstant(lambda: self.get(url), grow_dishes)
+
+    def test_admin_changelist(self) -> None:
+        url = reverse("admin:dish_dish_changelist")
+        self.assertQueriesConstant(lambda: self.get(url), grow_dishes)
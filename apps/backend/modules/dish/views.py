@@ -4,10 +4,11 @@ Dish views - Thin adapters to controller
 
 from django.contrib.auth.decorators import login_required
 from django.http import HttpRequest, HttpResponse
+from core.di import provide
 from .controller import DishController
 
 
-controller = DishController()
+controller = provide(DishController)
 
 
 def list_dishes(request: HttpRequest) -> HttpResponse:
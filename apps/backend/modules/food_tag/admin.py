@@ -2,7 +2,10 @@
 FoodTag admin configuration
 """
 
+from typing import Any
 from django.contrib import admin
+from django.http import HttpRequest, HttpResponse
+from core.decorators.query_budget import query_budget
 from .models import FoodTag
 
 
@@ -11,3 +14,9 @@ class FoodTagAdmin(admin.ModelAdmin):  # type: ignore
     list_display = ["name", "is_active", "created_at"]
     list_filter = ["is_active"]
     search_fields = ["name"]
+
+    @query_budget(3)
+    def changelist_view(
+        self, request: HttpRequest, extra_context: dict[str, Any] | None = None
+    ) -> HttpResponse:
+        return super().changelist_view(request, extra_context)
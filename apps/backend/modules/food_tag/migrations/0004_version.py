@@ -0,0 +1,18 @@
+# Generated by Django 4.2.26 on 2026-10-19 04:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("food_tag", "0003_foodtag_food_tag_foodtag_sync_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="foodtag",
+            name="version",
+            field=models.PositiveIntegerField(default=1, editable=False, verbose_name="Versión"),
+        ),
+    ]
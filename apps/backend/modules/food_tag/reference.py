@@ -0,0 +1,8 @@
+"""
+FoodTag reference data - Snapshot for filters, form choices and the admin
+"""
+
+from core.reference import reference_data
+from .models import FoodTag
+
+reference_data.register("food_tags", FoodTag)
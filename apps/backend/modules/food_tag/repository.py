@@ -1,6 +1,7 @@
 """
 FoodTag repository
 """
+
 from core import BaseRepository, Injectable
 from .models import FoodTag
 
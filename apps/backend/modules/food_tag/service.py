@@ -1,7 +1,12 @@
 """
 FoodTag service
 """
+
+from typing import Optional
+from django.db.models import QuerySet
 from core import BaseService, Injectable
+from core.reference import ReferenceSnapshot, reference_data
+from .models import FoodTag
 from .repository import FoodTagRepository
 
 
@@ -9,5 +14,13 @@ from .repository import FoodTagRepository
 class FoodTagService(BaseService):
     """Service for FoodTag business logic"""
 
-    def __init__(self):
-        self.repository = FoodTagRepository()
+    def __init__(self, repository: FoodTagRepository):
+        self.repository = repository
+
+    def find_all(self, plan: Optional[str] = None) -> QuerySet[FoodTag]:
+        """Get all food tags (plan: FoodTagRepository.fetch_plans, none declared yet)"""
+        return self.repository.find_all(plan)
+
+    def find_options(self) -> ReferenceSnapshot:
+        """All food tags from the cached reference data (no query while unchanged)"""
+        return reference_data.get("food_tags")
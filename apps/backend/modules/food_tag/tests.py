@@ -0,0 +1,32 @@
+"""
+FoodTag query budget tests - Query counts must not grow with the number of rows
+"""
+
+from __future__ import annotations
+
+from core.testing.fixtures import grow_tags
+from core.testing.queries import QueryBudgetTestMixin, get_declared_budget
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from modules.food_tag.admin import FoodTagAdmin
+
+
+@override_settings(QUERY_BUDGET_MODE="raise")
+class FoodTagQueryBudgetTest(QueryBudgetTestMixin, TestCase):
+    """The tag changelist stays within its budget for N and 10N rows"""
+
+    def setUp(self) -> None:
+        user = User.objects.create_superuser("staff", password="x")
+        self.client.force_login(user)
+
+    def test_admin_changelist(self) -> None:
+        url = reverse("admin:food_tag_foodtag_changelist")
+
+        def run() -> object:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            return response
+
+        self.assertGreater(get_declared_budget(FoodTagAdmin.changelist_view), 0)
+        self.assertQueriesConstant(run, grow_tags)
@@ -0,0 +1,91 @@
+"""
+Template tags for responsive images (renditions from core.images)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from django import template
+from django.core.files.storage import default_storage
+from django.db.models.fields.files import FieldFile
+from django.utils.html import format_html
+from django.utils.safestring import SafeString, mark_safe
+
+register = template.Library()
+
+# Card grid: 1 column on mobile, 2 on tablets (m6), 3 on desktop (l4)
+CARD_SIZES = "(min-width: 993px) 33vw, (min-width: 601px) 50vw, 100vw"
+
+
+def _srcset(sources: list[list[Any]]) -> str:
+    return ", ".join(f"{default_storage.url(path)} {width}w" for width, path in sources)
+
+
+@register.simple_tag
+def responsive_image(
+    image: Optional[FieldFile | str],
+    renditions: Optional[dict[str, Any]],
+    alt: str = "",
+    sizes: str = CARD_SIZES,
+    css_class: str = "",
+    lazy: bool = True,
+) -> SafeString:
+    """
+    Render a <picture> with WebP and JPEG srcsets for an image field.
+
+    The LQIP is painted as background until the chosen rendition loads.
+    Without renditions for the current file (still processing, or never
+    generated) the original upload is used.
+
+    Usage in templates:
+        {% load image_tags %}
+        {% responsive_image dish.image dish.image_renditions alt=dish.name %}
+        {% responsive_image dish.image dish.image_renditions sizes="100vw" lazy=False %}
+
+    Args:
+        image: Image field of the model, or the stored file name (projections)
+        renditions: Metadata returned by core.images.generate_renditions
+        alt: Alternative text
+        sizes: `sizes` attribute describing the rendered width
+        css_class: Class of the <img>
+        lazy: Use loading="lazy" (disable for above-the-fold images)
+
+    Returns:
+        <picture> (or <img>) HTML, empty string without image
+    """
+    if not image:
+        return mark_safe("")
+    loading = "lazy" if lazy else "eager"
+    name = image if isinstance(image, str) else image.name
+
+    if not renditions or renditions.get("source") != name:
+        return format_html(
+            '<img src="{}" alt="{}" class="{}" loading="{}" decoding="async">',
+            default_storage.url(image) if isinstance(image, str) else image.url,
+            alt,
+            css_class,
+            loading,
+        )
+
+    sources = renditions["sources"]
+    jpeg = sources["jpeg"]
+    return format_html(
+        "<picture>"
+        '<source type="image/webp" srcset="{}" sizes="{}">'
+        '<img src="{}" srcset="{}" sizes="{}" width="{}" height="{}" alt="{}"'
+        ' class="{}" loading="{}" decoding="async"'
+        " style=\"background: center / cover no-repeat url('{}')\">"
+        "</picture>",
+        _srcset(sources["webp"]),
+        sizes,
+        default_storage.url(jpeg[-1][1]),
+        _srcset(jpeg),
+        sizes,
+        renditions["width"],
+        renditions["height"],
+        alt,
+        css_class,
+        loading,
+        renditions["lqip"],
+    )
@@ -2,16 +2,123 @@
 Template tags for Vite integration
 """
 
+from __future__ import annotations
+
 from django import template
 from django.conf import settings
 from django.templatetags.static import static as django_static
-from django.utils.safestring import mark_safe
+from django.utils.html import format_html_join
+from django.utils.safestring import SafeString, mark_safe
+from typing import Any, Optional
 import json
 import os
+import threading
+import time
 
 register = template.Library()
 
 
+class ViteManifest:
+    """
+    Vite manifest.json loaded once per process
+
+    The file is stat()ed at most every `check_interval` seconds and parsed
+    again only when its mtime changes (e.g. after a new frontend build).
+    Resolved dependency chains are cached until the next reload.
+    """
+
+    def __init__(self, path: str, check_interval: float = 1.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._data: dict[str, Any] = {}
+        self._mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self._chains: dict[str, list[str]] = {}
+        self._lock = threading.Lock()
+
+    def _refresh(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return
+        with self._lock:
+            if now - self._checked_at < self.check_interval:
+                return
+            self._checked_at = now
+            try:
+                mtime = os.stat(self.path).st_mtime
+            except OSError:
+                self._data, self._mtime, self._chains = {}, None, {}
+                return
+            if mtime == self._mtime:
+                return
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                # Build in progress: keep the previous manifest, retry later
+                return
+            self._data, self._mtime, self._chains = data, mtime, {}
+
+    @property
+    def data(self) -> dict[str, Any]:
+        self._refresh()
+        return self._data
+
+    def file(self, name: str) -> Optional[str]:
+        """Built file of a manifest entry"""
+        entry = self.data.get(name)
+        return entry.get("file") if entry else None
+
+    def chain(self, name: str) -> list[str]:
+        """Manifest keys of an entry and its static imports, dependencies first"""
+        data = self.data
+        chain = self._chains.get(name)
+        if chain is not None:
+            return chain
+
+        chain = []
+        seen: set[str] = set()
+
+        def visit(key: str) -> None:
+            if key in seen or key not in data:
+                return
+            seen.add(key)
+            for imported in data[key].get("imports", []):
+                visit(imported)
+            chain.append(key)
+
+        visit(name)
+        self._chains[name] = chain
+        return chain
+
+    def css(self, name: str) -> list[str]:
+        """CSS files required by an entry and every chunk it imports"""
+        data = self.data
+        files: list[str] = []
+        for key in self.chain(name):
+            entry = data[key]
+            if entry["file"].endswith(".css"):
+                files.append(entry["file"])
+            files.extend(entry.get("css", []))
+        return list(dict.fromkeys(files))
+
+
+_manifest: Optional[ViteManifest] = None
+
+
+def get_manifest() -> ViteManifest:
+    """Process-wide manifest (path from settings.VITE_MANIFEST_PATH)"""
+    global _manifest
+    path = getattr(
+        settings,
+        "VITE_MANIFEST_PATH",
+        os.path.join(settings.BASE_DIR, "../frontend/staticfiles/manifest.json"),
+    )
+    if _manifest is None or _manifest.path != path:
+        _manifest = ViteManifest(path)
+    return _manifest
+
+
 @register.simple_tag
 def vite_asset(path: str) -> str:
     """
@@ -33,21 +140,10 @@ def vite_asset(path: str) -> str:
         vite_url = getattr(settings, "VITE_DEV_SERVER_URL", "http://localhost:5173")
         return f"{vite_url}/static/{path}"
 
-    # Production mode: load from manifest
-    manifest_path = os.path.join(
-        settings.BASE_DIR, "../frontend/staticfiles/manifest.json"
-    )
-
-    try:
-        with open(manifest_path, "r", encoding="utf-8") as f:
-            manifest = json.load(f)
-
-        # Look for the file in manifest
-        if path in manifest:
-            file_path = manifest[path]["file"]
-            return f"{settings.STATIC_URL}{file_path}"
-    except (FileNotFoundError, KeyError, json.JSONDecodeError):
-        pass
+    # Production mode: load from the cached manifest
+    file_path = get_manifest().file(path)
+    if file_path:
+        return f"{settings.STATIC_URL}{file_path}"
 
     # Fallback: return the path as-is
     return f"{settings.STATIC_URL}{path}"
@@ -80,6 +176,53 @@ def static(path: str) -> str:
     return django_static(path)
 
 
+@register.simple_tag
+def vite_preload(*paths: str) -> SafeString:
+    """
+    Emit preload hints for entries and their whole dependency chain.
+
+    JS chunks get <link rel="modulepreload"> and CSS files
+    <link rel="preload" as="style">, so the browser fetches every file in
+    parallel instead of discovering imports one level at a time.
+
+    Usage in templates (inside <head>):
+        {% load vite_tags %}
+        {% vite_preload "shared/js/main.js" "dish/js/main.js" %}
+
+    Args:
+        paths: Entry paths relative to the static directory
+
+    Returns:
+        Link tags in production, empty string in development
+    """
+    if getattr(settings, "VITE_DEV_MODE", False):
+        return mark_safe("")
+
+    manifest = get_manifest()
+    modules: list[str] = []
+    styles: list[str] = []
+    for path in paths:
+        for key in manifest.chain(path):
+            file_path = manifest.file(key)
+            if file_path and file_path.endswith(".js"):
+                modules.append(file_path)
+        styles.extend(manifest.css(path))
+
+    static_url = settings.STATIC_URL
+    return format_html_join(
+        "\n",
+        '<link rel="{}" href="{}"{}>',
+        [
+            ("modulepreload", f"{static_url}{file_path}", "")
+            for file_path in dict.fromkeys(modules)
+        ]
+        + [
+            ("preload", f"{static_url}{file_path}", mark_safe(' as="style"'))
+            for file_path in dict.fromkeys(styles)
+        ],
+    )
+
+
 @register.simple_tag
 def vite_hmr() -> str:
     """